@@ -0,0 +1,67 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Measure the cost of constructing page objects and regions.
+
+Compares looking up the adapter registry and creating a new wait for every
+page object and region (as PyPOM did previously) against the cached driver
+adapters and waits.
+
+Usage::
+
+  $ python benchmarks/bench_construction.py [number]
+
+"""
+
+import sys
+import timeit
+from contextlib import contextmanager
+
+from selenium.webdriver.support.ui import WebDriverWait
+from zope.interface import implementer
+
+from pypom import Page, Region, view
+from pypom.interfaces import IDriver
+from pypom.selenium_driver import ISelenium, Selenium
+
+
+@implementer(ISelenium)
+class Driver(object):
+    """Stand-in for a Selenium driver, no commands are sent"""
+
+
+@contextmanager
+def registry_lookups():
+    adapt_driver = view.adaptDriver
+    wait_factory = Selenium.wait_factory
+    view.adaptDriver = IDriver
+    Selenium.wait_factory = lambda self, timeout: WebDriverWait(self.driver, timeout)
+    try:
+        yield
+    finally:
+        view.adaptDriver = adapt_driver
+        Selenium.wait_factory = wait_factory
+
+
+@contextmanager
+def cached_lookups():
+    yield
+
+
+def measure(name, func, number):
+    elapsed = min(timeit.repeat(func, number=number, repeat=3))
+    print("{:<20}{:>10.2f} us".format(name, elapsed / number * 1e6))
+
+
+def main(number=100000):
+    driver = Driver()
+    page = Page(driver, "https://www.mozilla.org/")
+    for mode, context in [("registry", registry_lookups), ("cached", cached_lookups)]:
+        with context():
+            measure("page, " + mode, lambda: Page(driver, "https://www.mozilla.org/"), number)
+            measure("region, " + mode, lambda: Region(page), number)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,81 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Measure presence checks against a driver with an implicit wait.
+
+Uses a stub driver that simulates the latency of each command, and waits for
+the implicit wait to expire when no elements are found. Compares setting the
+implicit wait on the driver (so absence checks wait) against setting it
+through the adapter (so checks suspend it).
+
+Usage::
+
+  $ python benchmarks/bench_implicit_wait.py [number]
+
+"""
+
+import sys
+import time
+import timeit
+
+from selenium.common.exceptions import NoSuchElementException
+from zope.interface import implementer
+
+from pypom import Page
+from pypom.selenium_driver import ISelenium
+
+COMMAND_LATENCY = 0.001
+IMPLICIT_WAIT = 0.05
+
+
+@implementer(ISelenium)
+class Driver(object):
+    """Stand-in for a Selenium driver with a single element"""
+
+    def __init__(self):
+        self.implicit_wait = 0
+
+    def _command(self, found):
+        time.sleep(COMMAND_LATENCY)
+        if not found:
+            time.sleep(self.implicit_wait)
+
+    def implicitly_wait(self, time_to_wait):
+        self._command(True)
+        self.implicit_wait = time_to_wait
+
+    def find_element(self, strategy, locator):
+        self._command(locator == "present")
+        if locator != "present":
+            raise NoSuchElementException()
+        return object()
+
+    def find_elements(self, strategy, locator):
+        self._command(locator == "present")
+        return [object()] if locator == "present" else []
+
+
+def measure(name, func, number):
+    elapsed = min(timeit.repeat(func, number=number, repeat=3))
+    print("{:<20}{:>10.2f} ms".format(name, elapsed / number * 1e3))
+
+
+def main(number=20):
+    for mode in ["driver", "adapter"]:
+        driver = Driver()
+        page = Page(driver)
+        if mode == "driver":
+            driver.implicitly_wait(IMPLICIT_WAIT)
+        else:
+            page.driver_adapter.implicitly_wait(IMPLICIT_WAIT)
+        for locator in ["present", "absent"]:
+            measure(
+                "{}, {}".format(locator, mode),
+                lambda: page.is_element_present("id", locator),
+                number,
+            )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
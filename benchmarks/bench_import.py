@@ -0,0 +1,73 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Measure the time taken to import PyPOM.
+
+Runs ``python -X importtime -c "import pypom"`` in a new interpreter a number
+of times and reports the best cumulative import time, along with the slowest
+modules imported. Requires Python 3.7 or later.
+
+If a limit is given, the script exits with a non-zero status when the import
+takes longer, so it can be used to catch regressions.
+
+Usage::
+
+  $ python benchmarks/bench_import.py [--repeat 10] [--limit 100]
+
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+
+def importtime(module):
+    """Return a dict of cumulative import times in microseconds by module."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    output = subprocess.check_output(
+        [sys.executable, "-X", "importtime", "-c", "import " + module],
+        env=env,
+        stderr=subprocess.STDOUT,
+    ).decode()
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split(":", 1)[1].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="pypom", help="module to import")
+    parser.add_argument("--repeat", type=int, default=10, help="number of runs")
+    parser.add_argument("--top", type=int, default=10, help="modules to list")
+    parser.add_argument(
+        "--limit", type=float, help="fail if the import takes longer (in ms)"
+    )
+    args = parser.parse_args()
+
+    runs = [importtime(args.module) for _ in range(args.repeat)]
+    best = min(runs, key=lambda times: times[args.module])
+    total = best[args.module] / 1000.0
+
+    print("{}: {:.1f} ms (best of {})".format(args.module, total, args.repeat))
+    # the first entry is the module itself
+    slowest = sorted(best.items(), key=lambda item: -item[1])[1:]
+    for name, elapsed in slowest[: args.top]:
+        print("  {:<40}{:>10.1f} ms".format(name, elapsed / 1000.0))
+    for name in ("selenium", "splinter"):
+        if name in best:
+            print("warning: {} is imported by {}".format(name, args.module))
+
+    if args.limit is not None and total > args.limit:
+        print("import time exceeds limit of {:.1f} ms".format(args.limit))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Measure matching URLs to page object classes.
+
+Compares a page index against trying every URL template in turn, for an
+increasing number of page object classes.
+
+Usage::
+
+  $ python benchmarks/bench_index.py [number]
+
+"""
+
+import sys
+import timeit
+
+from pypom import Page
+from pypom.index import PageIndex, _Matcher
+
+BASE_URL = "https://www.mozilla.org/"
+
+
+def page_classes(count):
+    classes = []
+    for i in range(count):
+        template = "/{{locale}}/section{}/".format(i)
+        classes.append(type("Page{}".format(i), (Page,), {"URL_TEMPLATE": template}))
+        template = "/items{}/{{id}}".format(i)
+        classes.append(type("Item{}".format(i), (Page,), {"URL_TEMPLATE": template}))
+    return classes
+
+
+def linear(classes):
+    matchers = [_Matcher(cls, cls.URL_TEMPLATE, BASE_URL) for cls in classes]
+    origin = BASE_URL.rstrip("/")
+
+    def match(url):
+        path = url.replace(origin, "", 1)
+        for matcher in matchers:
+            if matcher.match(origin, path, []) is not None:
+                return matcher.page_class
+
+    return match
+
+
+def measure(name, func, number):
+    elapsed = min(timeit.repeat(func, number=number, repeat=3))
+    print("{:<20}{:>10.2f} us".format(name, elapsed / number * 1e6))
+
+
+def main(number=2000):
+    for count in [10, 100, 1000]:
+        classes = page_classes(count)
+        index = PageIndex(base_url=BASE_URL)
+        for cls in classes:
+            index.register(cls)
+        match = linear(classes)
+        for url in [
+            BASE_URL + "items{}/42".format(count - 1),
+            BASE_URL + "en-US/section{}/".format(count - 1),
+        ]:
+            print(url)
+            measure("linear, {}".format(count), lambda: match(url), number)
+            measure("index, {}".format(count), lambda: index.match(url), number)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,105 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Measure page objects end to end through the Selenium WebDriver client.
+
+Drives a ``StubServer`` from ``stub_server.py`` using
+``selenium.webdriver.Remote`` and the Selenium driver adapter, so the times
+include PyPOM, the Selenium client and HTTP, but not a browser. The number
+of commands sent for each operation is shown as well, and an artificial
+latency can be added to each command to see how they add up.
+
+Usage::
+
+  $ python benchmarks/bench_remote.py [number] [latency in ms ...]
+
+"""
+
+import sys
+import timeit
+
+from selenium.webdriver.common.by import By
+from stub_server import StubServer
+
+from pypom import Page, Region
+
+BASE_URL = "https://www.mozilla.org"
+
+ROW = (
+    '<li class="story"><a href="/news/{0}">Story {0}</a>'
+    ' <span class="date">{0} May</span></li>\n'
+)
+
+HTML = """<html><head><title>News</title></head><body>
+<h1 id="title">News</h1>
+<ul id="news">{}</ul>
+</body></html>
+""".format(
+    "".join(ROW.format(i) for i in range(20))
+)
+
+
+class Story(Region):
+    _link = (By.TAG_NAME, "a")
+
+    @property
+    def title(self):
+        return self.find_element(*self._link).text
+
+
+class News(Page):
+    URL_TEMPLATE = "/"
+    _title = (By.ID, "title")
+    _stories = (By.CLASS_NAME, "story")
+
+    @property
+    def loaded(self):
+        return self.is_element_displayed(*self._title)
+
+    @property
+    def stories(self):
+        return self.regions(Story, *self._stories)
+
+
+def measure(server, name, func, number):
+    commands = server.commands
+    elapsed = min(timeit.repeat(func, number=number, repeat=3))
+    sent = (server.commands - commands) / 3.0 / number
+    print("{:<32}{:>10.3f} ms{:>8.1f} commands".format(name, elapsed / number * 1e3, sent))
+
+
+def main(number=20, *latencies):
+    for latency in latencies or (0,):
+        with StubServer(pages={BASE_URL + "/": HTML}, latency=latency / 1e3) as server:
+            driver = server.remote()
+            print("latency {} ms".format(latency))
+            page = News(driver, BASE_URL).open()
+            root = page.find_element(*News._stories)
+            measure(server, "Region", lambda: Story(page, root=root), number)
+            measure(server, "Region.title", lambda: Story(page, root=root).title, number)
+            measure(server, "regions (20)", lambda: page.stories, number)
+            measure(server, "find_element", lambda: page.find_element(By.ID, "title"), number)
+            measure(
+                server, "find_elements (20)", lambda: page.find_elements(By.TAG_NAME, "a"), number
+            )
+            measure(
+                server,
+                "is_element_present, missing",
+                lambda: page.is_element_present(By.ID, "missing"),
+                number,
+            )
+            measure(
+                server,
+                "is_element_displayed",
+                lambda: page.is_element_displayed(By.ID, "title"),
+                number,
+            )
+            # opening the page again replaces the elements found above
+            measure(server, "Page.open", lambda: News(driver, BASE_URL).open(), number)
+            driver.quit()
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(*[int(arg) for arg in args[:1]] + [float(arg) for arg in args[1:]])
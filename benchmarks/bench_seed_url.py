@@ -0,0 +1,57 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Measure the cost of building seed URLs.
+
+Compares formatting the seed URL on every access (as PyPOM did previously)
+against the cached seed URL, and measures opening new page objects, which
+format the seed URL once.
+
+Usage::
+
+  $ python benchmarks/bench_seed_url.py [number]
+
+"""
+
+import sys
+import timeit
+
+from zope.interface import implementer
+
+from pypom import Page
+from pypom.selenium_driver import ISelenium
+
+
+@implementer(ISelenium)
+class Driver(object):
+    """Stand-in for a Selenium driver, no commands are sent"""
+
+    def get(self, url):
+        pass
+
+
+class Search(Page):
+    URL_TEMPLATE = "/{locale}/search?q={term}"
+
+
+def measure(name, func, number):
+    elapsed = min(timeit.repeat(func, number=number, repeat=3))
+    print("{:<20}{:>10.2f} us".format(name, elapsed / number * 1e6))
+
+
+def main(number=100000):
+    driver = Driver()
+    kwargs = {"locale": "en-US", "term": "firefox", "page": 2, "sort": "new"}
+    page = Search(driver, "https://www.mozilla.org/", **kwargs)
+    measure("format", page._format_seed_url, number)
+    measure("cached", lambda: page.seed_url, number)
+    measure(
+        "open new page",
+        lambda: Search(driver, "https://www.mozilla.org/", **kwargs).open(),
+        number,
+    )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
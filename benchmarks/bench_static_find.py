@@ -0,0 +1,81 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Measure locating elements using the static HTML driver.
+
+Compares the indexed lookups of the driver, and the CSS selectors and XPath
+expressions evaluated by lxml, against scanning the whole document, for
+documents with an increasing number of elements.
+
+Usage::
+
+  $ python benchmarks/bench_static_find.py [number]
+
+"""
+
+import sys
+import time
+import timeit
+
+from selenium.webdriver.common.by import By
+
+from pypom.static_driver import StaticDriver
+
+ROW = (
+    '<li id="row{0}" class="row r{1}">'
+    '<a href="/items/{0}">Item {0}</a> <span class="price">{0}.00</span>'
+    "</li>\n"
+)
+
+
+def html(rows):
+    items = "".join(ROW.format(i, i % 10) for i in range(rows))
+    return "<html><body><ul id='items'>{}</ul></body></html>".format(items)
+
+
+def measure(name, func, number):
+    elapsed = min(timeit.repeat(func, number=number, repeat=3))
+    print("{:<40}{:>12.2f} us".format(name, elapsed / number * 1e6))
+
+
+def main(number=20):
+    for rows in [1000, 10000, 40000]:
+        driver = StaticDriver()
+        start = time.time()
+        driver.load(html(rows), "https://www.mozilla.org/")
+        parsed = time.time()
+        document = driver.document
+        document.index
+        indexed = time.time()
+        print(
+            "{} elements: parse {:.0f} ms, index {:.0f} ms".format(
+                len(document.index.elements),
+                (parsed - start) * 1e3,
+                (indexed - parsed) * 1e3,
+            )
+        )
+        last = "row{}".format(rows - 1)
+        row = driver.find_element(By.ID, last)
+        locators = [
+            (By.ID, last),
+            (By.CSS_SELECTOR, "#" + last),
+            (By.XPATH, "//*[@id='{}']".format(last)),
+            (By.CLASS_NAME, "r9"),
+            (By.CSS_SELECTOR, "li.r9 > a"),
+        ]
+        for by, value in locators:
+            name = "{}={}".format(by, value)
+            measure(name, lambda: driver.find_elements(by, value), number)
+        measure(
+            "scan id={}".format(last),
+            lambda: [e for e in document.iter() if e.get("id") == last],
+            number,
+        )
+        measure("root: tag name=a", lambda: row.find_elements(By.TAG_NAME, "a"), number)
+        measure("root: css=.price", lambda: row.find_elements(By.CSS_SELECTOR, ".price"), number)
+        measure("root: xpath=.//a", lambda: row.find_elements(By.XPATH, ".//a"), number)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
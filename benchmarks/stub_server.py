@@ -0,0 +1,422 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""A stub WebDriver server, for measuring overhead without a browser.
+
+:py:class:`StubServer` runs in a thread of the current process, and speaks
+enough of the `W3C WebDriver protocol`_ for
+:py:class:`selenium.webdriver.Remote` to open pages, find elements and read
+them. Pages are parsed by the :py:class:`~pypom.static_driver.StaticDriver`,
+so everything a command costs other than the browser itself, which is
+PyPOM, the Selenium client and HTTP, can be measured. An artificial latency
+can be added to each command to see how the number of commands adds up::
+
+  from stub_server import StubServer
+
+  with StubServer(pages={'https://www.mozilla.org/': html}, latency=0.001) as server:
+      driver = server.remote()
+      page = Home(driver, 'https://www.mozilla.org').open()
+      print(server.commands)
+
+Scripts are not run, other than those Selenium uses to read attributes and
+whether elements are displayed, and those passed in ``scripts``.
+
+.. _W3C WebDriver protocol: https://www.w3.org/TR/webdriver/
+"""
+
+import itertools
+import json
+import re
+import sys
+import threading
+import time
+
+from selenium.common.exceptions import (
+    InvalidArgumentException,
+    InvalidSelectorException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    WebDriverException,
+)
+
+from pypom.static_driver import StaticDriver, StaticElement
+
+if sys.version_info >= (3,):
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+else:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+
+# key of element references in the W3C protocol
+_ELEMENT = "element-6066-11e4-a52e-4f735466cecf"
+
+# errors of the W3C protocol, with their HTTP status, by exception, with
+# subclasses first
+_ERRORS = [
+    (InvalidSelectorException, "invalid selector", 400),
+    (NoSuchElementException, "no such element", 404),
+    (StaleElementReferenceException, "stale element reference", 404),
+    (InvalidArgumentException, "invalid argument", 400),
+]
+
+
+class _NoSuchSession(WebDriverException):
+    pass
+
+
+class _UnknownCommand(WebDriverException):
+    pass
+
+
+class _ScriptError(WebDriverException):
+    pass
+
+
+def _atoms():
+    # the scripts Selenium runs to read attributes and whether elements are
+    # displayed, with the methods of StaticElement giving the same results
+    from selenium.webdriver.remote import webelement
+
+    atoms = []
+    for name, method in [
+        ("getAttribute_js", "get_attribute"),
+        ("isDisplayed_js", "is_displayed"),
+    ]:
+        source = getattr(webelement, name, None)
+        if source:
+            atoms.append((source, method))
+    return atoms
+
+
+class _Driver(StaticDriver):
+    # loads the pages of the server, and other URLs as a static driver does
+    def __init__(self, pages):
+        super(_Driver, self).__init__()
+        self.pages = pages
+
+    def _fetch(self, url):
+        if url in self.pages:
+            return self.pages[url], url
+        return super(_Driver, self)._fetch(url)
+
+
+class _Session(object):
+    # commands, by method and path within the session
+    routes = [
+        ("POST", "url", "navigate"),
+        ("GET", "url", "current_url"),
+        ("GET", "title", "title"),
+        ("POST", "refresh", "refresh"),
+        ("GET", "source", "source"),
+        ("POST", "timeouts", "timeouts"),
+        ("POST", "element", "find_element"),
+        ("POST", "elements", "find_elements"),
+        ("POST", "element/(?P<element>[^/]+)/element", "find_element"),
+        ("POST", "element/(?P<element>[^/]+)/elements", "find_elements"),
+        ("GET", "element/(?P<element>[^/]+)/text", "element_text"),
+        ("GET", "element/(?P<element>[^/]+)/name", "element_name"),
+        ("GET", "element/(?P<element>[^/]+)/attribute/(?P<name>[^/]+)", "element_attribute"),
+        ("GET", "element/(?P<element>[^/]+)/property/(?P<name>[^/]+)", "element_property"),
+        ("GET", "element/(?P<element>[^/]+)/enabled", "element_enabled"),
+        ("GET", "element/(?P<element>[^/]+)/selected", "element_selected"),
+        ("POST", "element/(?P<element>[^/]+)/click", "element_click"),
+        ("POST", "execute/sync", "execute"),
+        ("POST", "execute/async", "execute"),
+        ("GET", "cookie", "get_cookies"),
+        ("POST", "cookie", "add_cookie"),
+        ("DELETE", "cookie", "delete_cookies"),
+    ]
+    routes = [
+        (method, re.compile("^{}$".format(path)), name) for method, path, name in routes
+    ]
+
+    def __init__(self, server):
+        self.server = server
+        self.driver = _Driver(server.pages)
+        self.elements = {}
+        self.references = {}
+
+    def run(self, method, command, params):
+        for route_method, pattern, name in self.routes:
+            match = pattern.match(command)
+            if route_method == method and match is not None:
+                return getattr(self, name)(params, **match.groupdict())
+        raise _UnknownCommand("Unknown command: {} {}".format(method, command))
+
+    def reference(self, element):
+        # the same element has the same reference while the session lasts
+        reference = self.references.get(element)
+        if reference is None:
+            reference = "element-{}".format(len(self.elements) + 1)
+            self.references[element] = reference
+            self.elements[reference] = element
+        return {_ELEMENT: reference}
+
+    def element(self, reference):
+        element = self.elements.get(reference)
+        if element is None:
+            raise NoSuchElementException("Unknown element: {}".format(reference))
+        return element
+
+    def encode(self, value):
+        if isinstance(value, (list, tuple)):
+            return [self.encode(item) for item in value]
+        if isinstance(value, dict):
+            return dict((key, self.encode(item)) for key, item in value.items())
+        if isinstance(value, StaticElement):
+            return self.reference(value)
+        return value
+
+    def decode(self, value):
+        if isinstance(value, list):
+            return [self.decode(item) for item in value]
+        if isinstance(value, dict):
+            if _ELEMENT in value:
+                return self.element(value[_ELEMENT])
+            return dict((key, self.decode(item)) for key, item in value.items())
+        return value
+
+    def navigate(self, params):
+        self.driver.get(params["url"])
+
+    def current_url(self, params):
+        return self.driver.current_url
+
+    def title(self, params):
+        return self.driver.title
+
+    def refresh(self, params):
+        self.driver.refresh()
+
+    def source(self, params):
+        return self.driver.page_source
+
+    def timeouts(self, params):
+        pass  # elements are found at once, so there is nothing to wait for
+
+    def find_element(self, params, element=None):
+        context = self.driver if element is None else self.element(element)
+        return self.reference(context.find_element(params["using"], params["value"]))
+
+    def find_elements(self, params, element=None):
+        context = self.driver if element is None else self.element(element)
+        found = context.find_elements(params["using"], params["value"])
+        return [self.reference(item) for item in found]
+
+    def element_text(self, params, element):
+        return self.element(element).text
+
+    def element_name(self, params, element):
+        return self.element(element).tag_name
+
+    def element_attribute(self, params, element, name):
+        return self.element(element).get_dom_attribute(name)
+
+    def element_property(self, params, element, name):
+        return self.element(element).get_property(name)
+
+    def element_enabled(self, params, element):
+        return self.element(element).is_enabled()
+
+    def element_selected(self, params, element):
+        return self.element(element).is_selected()
+
+    def element_click(self, params, element):
+        self.element(element).click()
+
+    def execute(self, params):
+        script, args = params["script"], self.decode(params.get("args", []))
+        function = self.server.scripts.get(script)
+        if function is not None:
+            return self.encode(function(*args))
+        for source, method in self.server.atoms:
+            if source in script:
+                return self.encode(getattr(args[0], method)(*args[1:]))
+        raise _ScriptError("Scripts are not run by the stub server")
+
+    def get_cookies(self, params):
+        return self.driver.get_cookies()
+
+    def add_cookie(self, params):
+        self.driver.add_cookie(params["cookie"])
+
+    def delete_cookies(self, params):
+        self.driver.delete_all_cookies()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # responses are written as headers and body, which must not be delayed
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def log_message(self, format, *args):
+        pass
+
+    def _dispatch(self, method):
+        server = self.server.stub
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        server._command()
+        try:
+            params = json.loads(body.decode("utf-8")) if body else {}
+            value = self._run(server, method, self.path.rstrip("/"), params)
+        except Exception as exc:
+            self._respond_error(exc)
+        else:
+            self._respond(200, {"value": value})
+
+    def _run(self, server, method, path, params):
+        if path == "/status":
+            return {"ready": True, "message": "PyPOM stub server"}
+        if path == "/session" and method == "POST":
+            return server._new_session()
+        match = re.match("^/session/(?P<session>[^/]+)/?(?P<command>.*)$", path)
+        if match is None:
+            raise _UnknownCommand("Unknown command: {} {}".format(method, path))
+        session_id, command = match.group("session", "command")
+        session = server._sessions.get(session_id)
+        if session is None:
+            raise _NoSuchSession("No session: {}".format(session_id))
+        if not command and method == "DELETE":
+            del server._sessions[session_id]
+            return None
+        return session.run(method, command, params)
+
+    def _respond(self, status, data):
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _respond_error(self, exc):
+        error, status = "unknown error", 500
+        if isinstance(exc, _NoSuchSession):
+            error, status = "invalid session id", 404
+        elif isinstance(exc, _UnknownCommand):
+            error, status = "unknown command", 404
+        elif isinstance(exc, _ScriptError):
+            error, status = "javascript error", 500
+        else:
+            for cls, name, code in _ERRORS:
+                if isinstance(exc, cls):
+                    error, status = name, code
+                    break
+        message = getattr(exc, "msg", None) or str(exc)
+        self._respond(
+            status, {"value": {"error": error, "message": message, "stacktrace": ""}}
+        )
+
+
+class _Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class StubServer(object):
+    """A stub WebDriver server running in a thread of this process.
+
+    :param pages: (optional) Markup of pages by URL. Other URLs are loaded
+        in the same way as by :py:func:`~pypom.static_driver.StaticDriver.get`.
+    :param latency: (optional) Time in seconds to delay each command by.
+    :param scripts: (optional) Functions by the source of the scripts they
+        stand in for, called with the arguments of the script.
+    :type pages: dict
+    :type latency: float
+    :type scripts: dict
+    """
+
+    def __init__(self, pages=None, latency=0, scripts=None):
+        self.pages = dict(pages or {})
+        self.latency = latency
+        self.scripts = dict(scripts or {})
+        self.atoms = _atoms()
+        self.commands = 0
+        self._lock = threading.Lock()
+        self._sessions = {}
+        self._session_ids = itertools.count(1)
+        self._server = None
+        self._thread = None
+
+    def __repr__(self):
+        return "<StubServer {}>".format(self.url if self._server else "stopped")
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    @property
+    def url(self):
+        """URL of the server, to pass as the command executor of a driver.
+
+        :rtype: str
+        """
+        host, port = self._server.server_address[:2]
+        return "http://{}:{}".format(host, port)
+
+    def start(self):
+        """Starts serving on a free port of the loopback interface.
+
+        :return: The server.
+        :rtype: :py:class:`StubServer`
+        """
+        self._server = _Server(("127.0.0.1", 0), _Handler)
+        self._server.stub = self
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}
+        )
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stops serving, and ends all sessions."""
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._sessions.clear()
+
+    def remote(self):
+        """Starts a session using :py:class:`selenium.webdriver.Remote`.
+
+        :rtype: :py:class:`selenium.webdriver.Remote`
+        """
+        from selenium import webdriver
+        from selenium.webdriver.remote.remote_connection import RemoteConnection
+
+        class Connection(RemoteConnection):
+            # Selenium 3 defaults to a timeout urllib3 2 does not accept
+            _timeout = 60
+
+        return webdriver.Remote(
+            command_executor=Connection(self.url, keep_alive=True),
+            desired_capabilities={"browserName": "stub"},
+        )
+
+    def _command(self):
+        with self._lock:
+            self.commands += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _new_session(self):
+        with self._lock:
+            session_id = "session-{}".format(next(self._session_ids))
+            self._sessions[session_id] = _Session(self)
+        return {
+            "sessionId": session_id,
+            "capabilities": {"browserName": "stub", "acceptInsecureCerts": False},
+        }
@@ -0,0 +1,128 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import time
+
+import pytest
+from selenium.common.exceptions import (
+    InvalidSelectorException,
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    WebDriverException,
+)
+from selenium.webdriver.common.by import By
+from stub_server import StubServer
+
+from pypom import Page, Region
+
+HOME = """<!DOCTYPE html>
+<html><head><title>Home</title></head>
+<body>
+  <h1 id="title">Welcome</h1>
+  <ul id="news">
+    <li class="story"><a href="/news/1">First story</a></li>
+    <li class="story"><a href="/news/2">Second story</a></li>
+  </ul>
+  <input type="checkbox" name="all" checked>
+  <p class="notice" style="display: none">Hidden notice</p>
+</body></html>
+"""
+
+STORY = "<title>Story</title><h1>Story</h1>"
+
+
+class Story(Region):
+    @property
+    def title(self):
+        return self.find_element(By.TAG_NAME, "a").text
+
+
+class Home(Page):
+    URL_TEMPLATE = "/"
+
+    @property
+    def loaded(self):
+        return self.is_element_displayed(By.ID, "title")
+
+    @property
+    def stories(self):
+        return self.regions(Story, By.CLASS_NAME, "story")
+
+
+@pytest.fixture
+def server():
+    pages = {
+        "https://www.mozilla.org/": HOME,
+        "https://www.mozilla.org/news/1": STORY,
+    }
+    scripts = {"return arguments[0];": lambda value: value}
+    with StubServer(pages=pages, scripts=scripts) as server:
+        yield server
+
+
+@pytest.fixture
+def remote(server):
+    driver = server.remote()
+    yield driver
+    driver.quit()
+
+
+def test_page_and_regions(remote):
+    home = Home(remote, "https://www.mozilla.org").open()
+    assert remote.title == "Home"
+    assert remote.current_url == "https://www.mozilla.org/"
+    assert [story.title for story in home.stories] == ["First story", "Second story"]
+    assert home.is_element_present(By.NAME, "all")
+    assert not home.is_element_present(By.ID, "missing")
+    assert not home.is_element_displayed(By.CLASS_NAME, "notice")
+
+
+def test_elements(remote):
+    remote.get("https://www.mozilla.org/")
+    link = remote.find_element(By.CSS_SELECTOR, "#news a")
+    assert link.tag_name == "a"
+    assert link.get_attribute("href") == "https://www.mozilla.org/news/1"
+    assert link == remote.find_elements(By.XPATH, "//a")[0]
+    assert remote.find_element(By.NAME, "all").is_selected()
+    link.click()
+    assert remote.title == "Story"
+    with pytest.raises(StaleElementReferenceException):
+        link.text
+
+
+def test_errors(remote):
+    remote.get("https://www.mozilla.org/")
+    with pytest.raises(NoSuchElementException):
+        remote.find_element(By.ID, "missing")
+    with pytest.raises(InvalidSelectorException):
+        remote.find_element(By.XPATH, "//[")
+    with pytest.raises(JavascriptException):
+        remote.execute_script("return document.title;")
+
+
+def test_scripts(remote):
+    remote.get("https://www.mozilla.org/")
+    title = remote.find_element(By.ID, "title")
+    assert remote.execute_script("return arguments[0];", [title, 1]) == [title, 1]
+
+
+def test_latency(server, remote):
+    server.latency = 0.05
+    commands = server.commands
+    start = time.time()
+    remote.get("https://www.mozilla.org/")
+    remote.find_element(By.ID, "title")
+    assert server.commands == commands + 2
+    assert time.time() - start >= 0.1
+
+
+def test_sessions(server, remote):
+    other = server.remote()
+    other.get("https://www.mozilla.org/news/1")
+    remote.get("https://www.mozilla.org/")
+    assert other.title == "Story"
+    other.quit()
+    with pytest.raises(WebDriverException):
+        other.title
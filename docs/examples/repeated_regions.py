@@ -7,14 +7,21 @@ class Results(Page):
 
     @property
     def results(self):
-        return [
-            self.Result(self, el) for el in self.find_elements(*self._result_locator)
-        ]
+        return self.regions(self.Result, *self._result_locator)
+
+    @property
+    def result_records(self):
+        return self.find_records(self.Result, *self._result_locator)
 
     class Result(Region):
         _name_locator = (By.CLASS_NAME, "name")
         _detail_locator = (By.TAG_NAME, "a")
 
+        _fields = (
+            ("name", _name_locator, "text"),
+            ("detail_link", _detail_locator, "property:href"),
+        )
+
         @property
         def name(self):
             return self.find_element(*self._name_locator).text
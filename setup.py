@@ -1,6 +1,7 @@
 from setuptools import setup
 
 splinter_requires = ["splinter"]
+static_requires = ["lxml", "cssselect"]
 
 setup(
     name="PyPOM",
@@ -14,7 +15,7 @@ setup(
     packages=["pypom", "pypom.interfaces"],
     install_requires=["zope.interface", "zope.component", "pluggy", "selenium"],
     setup_requires=["setuptools_scm"],
-    extras_require={"splinter": splinter_requires},
+    extras_require={"splinter": splinter_requires, "static": static_requires},
     license="Mozilla Public License 2.0 (MPL 2.0)",
     keywords="pypom page object model selenium",
     classifiers=[
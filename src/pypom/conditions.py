@@ -0,0 +1,186 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Declarative loaded conditions.
+
+Conditions listed in ``_loaded_conditions`` of a page or region class are
+compiled into a single script that is waited for in the browser, or checked
+one at a time on every poll when the driver can not run them as a script::
+
+  from pypom import Page
+  from pypom.conditions import Displayed, HasClass, UrlMatches
+  from selenium.webdriver.common.by import By
+
+  class Mozilla(Page):
+      _loaded_conditions = (
+          UrlMatches(r'/en-US/$'),
+          Displayed(By.ID, 'logo'),
+          HasClass(By.TAG_NAME, 'body', 'loaded'),
+      )
+
+Locators of conditions of a region are relative to its root element.
+"""
+
+import json
+import re
+
+
+def _attribute(element, name):
+    get_attribute = getattr(element, "get_attribute", None)
+    if get_attribute is not None:
+        return get_attribute(name)
+    return element[name]
+
+
+class Condition(object):
+    """Base class for loaded conditions."""
+
+    def script(self, element):
+        """Return a JavaScript expression that is true when the condition is met.
+
+        The expression can use the ``displayed(element)`` function, and
+        ``root``, which is the root element of a region or the document.
+
+        :param element: Function returning an expression evaluating to the
+            first element located by a strategy and locator, or ``None`` if
+            the locator can not be used in a script.
+        :return: JavaScript expression, or ``None`` if the condition can not
+            be checked using a script.
+        :rtype: str
+        """
+        raise NotImplementedError
+
+    def check(self, view):
+        """Check whether the condition is met using the driver.
+
+        :param view: Page or region the condition belongs to.
+        :return: ``True`` if the condition is met, else ``False``.
+        :rtype: bool
+        """
+        raise NotImplementedError
+
+
+class _ElementCondition(Condition):
+    def __init__(self, strategy, locator):
+        self.strategy = strategy
+        self.locator = locator
+
+    def __repr__(self):
+        return "{}({!r}, {!r})".format(
+            type(self).__name__, self.strategy, self.locator
+        )
+
+    def script(self, element):
+        expression = element(self.strategy, self.locator)
+        if expression is None:
+            return None
+        return "(function(e) {{ return !!e && {}; }})({})".format(
+            self._test, expression
+        )
+
+    def _find(self, view):
+        elements = view.find_elements(self.strategy, self.locator)
+        return elements[0] if elements else None
+
+
+class Present(_ElementCondition):
+    """An element is present.
+
+    :param strategy: Location strategy to use.
+    :param locator: Location of the element.
+    """
+
+    _test = "true"
+
+    def check(self, view):
+        return bool(view.is_element_present(self.strategy, self.locator))
+
+
+class Displayed(_ElementCondition):
+    """An element is displayed.
+
+    :param strategy: Location strategy to use.
+    :param locator: Location of the element.
+    """
+
+    _test = "displayed(e)"
+
+    def check(self, view):
+        return bool(view.is_element_displayed(self.strategy, self.locator))
+
+
+class HasClass(_ElementCondition):
+    """An element has a class.
+
+    :param strategy: Location strategy to use.
+    :param locator: Location of the element.
+    :param class_name: Name of the class.
+    """
+
+    def __init__(self, strategy, locator, class_name):
+        super(HasClass, self).__init__(strategy, locator)
+        self.class_name = class_name
+        self._test = "e.classList.contains({})".format(json.dumps(class_name))
+
+    def check(self, view):
+        element = self._find(view)
+        if element is None:
+            return False
+        return self.class_name in (_attribute(element, "class") or "").split()
+
+
+class HasAttribute(_ElementCondition):
+    """An element has an attribute, optionally with a given value.
+
+    :param strategy: Location strategy to use.
+    :param locator: Location of the element.
+    :param name: Name of the attribute.
+    :param value: (optional) Value of the attribute.
+    """
+
+    def __init__(self, strategy, locator, name, value=None):
+        super(HasAttribute, self).__init__(strategy, locator)
+        self.name = name
+        self.value = value
+        if value is None:
+            self._test = "e.hasAttribute({})".format(json.dumps(name))
+        else:
+            self._test = "e.getAttribute({}) === {}".format(
+                json.dumps(name), json.dumps(value)
+            )
+
+    def check(self, view):
+        element = self._find(view)
+        if element is None:
+            return False
+        value = _attribute(element, self.name)
+        if self.value is None:
+            return value is not None
+        return value == self.value
+
+
+class UrlMatches(Condition):
+    """The current URL matches a regular expression.
+
+    The expression is evaluated by the browser when the condition is checked
+    using a script, so it should only use syntax supported by both Python and
+    JavaScript.
+
+    :param pattern: Regular expression searched for in the current URL.
+    """
+
+    def __init__(self, pattern):
+        self.pattern = pattern
+        self._regex = re.compile(pattern)
+
+    def __repr__(self):
+        return "UrlMatches({!r})".format(self.pattern)
+
+    def script(self, element):
+        return "new RegExp({}).test(window.location.href)".format(
+            json.dumps(self.pattern)
+        )
+
+    def check(self, view):
+        return bool(self._regex.search(view.driver_adapter.current_url()))
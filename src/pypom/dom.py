@@ -0,0 +1,610 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Static HTML documents.
+
+Documents are parsed into trees of :py:mod:`lxml.html` elements, and queried
+using CSS selectors, translated to XPath by :py:mod:`cssselect`, and XPath
+expressions evaluated by :py:mod:`lxml`. Both are required by the
+``static`` extra::
+
+  $ pip install PyPOM[static]
+
+How browsers correct invalid markup is left to the HTML parser of libxml2,
+except that ``head`` and ``body`` elements are always present, and table
+rows and cells outside of a ``tbody`` or ``tr`` element are wrapped in one,
+as browsers do.
+"""
+
+import re
+from bisect import bisect_right
+
+import lxml.html
+from cssselect import HTMLTranslator, SelectorError, parse as parse_selector
+from cssselect.parser import Class, CombinedSelector
+from cssselect.parser import Element as ElementSelector
+from cssselect.parser import Hash
+from cssselect.xpath import ExpressionError
+from lxml import etree
+from selenium.common.exceptions import InvalidSelectorException
+
+FORM_ELEMENTS = frozenset(
+    "button fieldset input optgroup option select textarea".split()
+)
+
+_BLOCK = frozenset(
+    "address article aside blockquote center details dialog dir div dl fieldset "
+    "figcaption figure footer form h1 h2 h3 h4 h5 h6 header hgroup hr li listing "
+    "main menu nav ol p pre section summary table ul".split()
+)
+
+# elements that are never rendered
+_HIDDEN_ELEMENTS = frozenset(
+    "head script style template title meta link base noscript datalist".split()
+)
+
+# elements whose content is not escaped
+_RAW_TEXT_ELEMENTS = frozenset("script style xmp iframe noembed noframes".split())
+
+_DISPLAY_NONE = re.compile(r"(?:^|;)\s*display\s*:\s*none\s*(?:!important\s*)?(?:;|$)", re.I)
+_VISIBILITY = re.compile(r"(?:^|;)\s*visibility\s*:\s*(\w+)", re.I)
+_WHITESPACE = re.compile(r"[ \t\n\r\f]+")
+
+# markup is passed to the parser encoded, so that it is not decoded again
+# using encoding declarations within it
+_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+
+_TRANSLATOR = HTMLTranslator()
+
+# compiled selectors and expressions, see compile_selector and
+# compile_expression
+_selectors = {}
+_MAX_SELECTORS = 512
+_expressions = {}
+_MAX_EXPRESSIONS = 512
+
+
+class Document(object):
+    """A parsed HTML document.
+
+    :param root: The ``html`` element.
+    :param url: URL the document was loaded from.
+    :type root: :py:class:`lxml.html.HtmlElement`
+    :type url: str
+    """
+
+    def __init__(self, root, url="about:blank"):
+        self.root = root
+        self.tree = root.getroottree()
+        self.url = url
+        # elements known to be hidden, such as by style sheets
+        self.hidden = frozenset()
+        self._index = None
+
+    def __repr__(self):
+        return "<Document {}>".format(self.url)
+
+    @property
+    def title(self):
+        """Text of the ``title`` element.
+
+        :rtype: str
+        """
+        title = self.root.find(".//title")
+        if title is None:
+            return ""
+        return _WHITESPACE.sub(" ", title.text_content()).strip()
+
+    @property
+    def index(self):
+        """Index of the elements of the document, built when first used.
+
+        The tree must not be changed once the index is built.
+
+        :rtype: :py:class:`Index`
+        """
+        if self._index is None:
+            self._index = Index(self)
+        return self._index
+
+    def iter(self):
+        """Iterate over the elements in document order.
+
+        :rtype: iterator
+        """
+        return self.root.iter(etree.Element)
+
+
+class _Orders(object):
+    # the orders of a list of elements, as a sequence for bisect
+    __slots__ = ("elements", "orders")
+
+    def __init__(self, elements, orders):
+        self.elements = elements
+        self.orders = orders
+
+    def __len__(self):
+        return len(self.elements)
+
+    def __getitem__(self, index):
+        return self.orders[self.elements[index]]
+
+
+class Index(object):
+    """Elements of a document by id, name, class name and tag name.
+
+    Looking up elements takes the same time regardless of the size of the
+    document, and looking up elements within an element only adds a binary
+    search to the lookup. As the index refers to every element, lxml keeps
+    returning the same objects for them, which can be compared by identity.
+
+    :param document: Document.
+    :type document: :py:class:`Document`
+    """
+
+    def __init__(self, document):
+        self.elements = list(document.iter())
+        self.ids = {}
+        self.names = {}
+        self.classes = {}
+        self.tags = {}
+        # position of each element in document order, and the position of
+        # its last descendant
+        self.orders = {}
+        self.ends = {}
+        for order, element in enumerate(self.elements):
+            self.orders[element] = order
+            self.tags.setdefault(element.tag, []).append(element)
+            attrib = element.attrib
+            if "id" in attrib:
+                self.ids.setdefault(attrib["id"], []).append(element)
+            if "name" in attrib:
+                self.names.setdefault(attrib["name"], []).append(element)
+            if "class" in attrib:
+                for name in set(attrib["class"].split()):
+                    self.classes.setdefault(name, []).append(element)
+        ends = self.ends
+        for element in reversed(self.elements):
+            # descendants come first in reverse order, so the first one seen
+            # is the last descendant
+            end = ends.setdefault(element, self.orders[element])
+            parent = element.getparent()
+            if parent is not None:
+                ends.setdefault(parent, end)
+        self._keys = {
+            "id": self.ids,
+            "name": self.names,
+            "class": self.classes,
+            "tag": self.tags,
+        }
+
+    def lookup(self, key, value, root=None):
+        """Elements by id, name, class name or tag name.
+
+        :param key: One of ``id``, ``name``, ``class`` or ``tag``.
+        :param value: Value of the attribute, or name of the tag.
+        :param root: (optional) Element whose descendants are looked up.
+            Defaults to the whole document.
+        :type key: str
+        :type value: str
+        :type root: :py:class:`lxml.html.HtmlElement`
+        :return: Elements in document order.
+        :rtype: list
+        """
+        elements = self._keys[key].get(value)
+        if not elements:
+            return []
+        return self.within(elements, root)
+
+    def within(self, elements, root=None):
+        """The elements of a list that are descendants of an element.
+
+        :param elements: Elements of the document in document order.
+        :param root: (optional) Element whose descendants are returned.
+            Defaults to the whole document.
+        :type elements: list
+        :type root: :py:class:`lxml.html.HtmlElement`
+        :return: Elements in document order.
+        :rtype: list
+        """
+        if root is None or isinstance(root, Document):
+            return list(elements)
+        orders = _Orders(elements, self.orders)
+        start = bisect_right(orders, self.orders[root])
+        return elements[start:bisect_right(orders, self.ends[root], start)]
+
+
+def _wrap_runs(parent, tags, tag):
+    # wrap each run of children with one of the tags in a new element
+    wrapper = None
+    for child in list(parent):
+        if child.tag in tags:
+            if wrapper is None:
+                wrapper = parent.makeelement(tag, {})
+                child.addprevious(wrapper)
+            wrapper.append(child)
+        elif isinstance(child.tag, str):
+            wrapper = None
+
+
+def _ensure_structure(root):
+    # add the elements browsers always create, but libxml2 does not
+    if root.find("head") is None:
+        root.insert(0, root.makeelement("head", {}))
+    if root.find("body") is None and root.find("frameset") is None:
+        root.append(root.makeelement("body", {}))
+    for table in list(root.iter("table")):
+        _wrap_runs(table, ("td", "th"), "tr")
+        _wrap_runs(table, ("tr",), "tbody")
+        for section in table:
+            if section.tag in ("thead", "tbody", "tfoot"):
+                _wrap_runs(section, ("td", "th"), "tr")
+
+
+def parse(html, url="about:blank"):
+    """Parse an HTML document.
+
+    :param html: Markup of the document.
+    :param url: (optional) URL the document was loaded from.
+    :type html: str
+    :type url: str
+    :return: Document.
+    :rtype: :py:class:`Document`
+    """
+    try:
+        root = lxml.html.document_fromstring(html.encode("utf-8"), parser=_PARSER)
+    except etree.ParserError:
+        # nothing but whitespace and comments
+        root = lxml.html.document_fromstring(b"<html></html>", parser=_PARSER)
+    _ensure_structure(root)
+    return Document(root, url)
+
+
+def _escape(text):
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def to_html(element, inner=False):
+    """Serialize an element to HTML.
+
+    :param element: Element.
+    :param inner: (optional) Only serialize the children of the element, in
+        the same way as ``innerHTML``.
+    :type element: :py:class:`lxml.html.HtmlElement`
+    :type inner: bool
+    :rtype: str
+    """
+    if not inner:
+        return lxml.html.tostring(element, encoding="unicode", with_tail=False)
+    parts = []
+    if element.text:
+        raw = element.tag in _RAW_TEXT_ELEMENTS
+        parts.append(element.text if raw else _escape(element.text))
+    for child in element:
+        parts.append(lxml.html.tostring(child, encoding="unicode"))
+    return "".join(parts)
+
+
+def compile_selector(selector):
+    """A compiled selector, which is only translated once as selectors are cached.
+
+    :param selector: CSS selector.
+    :type selector: str
+    :rtype: :py:class:`Selector`
+    :raises: :py:class:`~selenium.common.exceptions.InvalidSelectorException`
+    """
+    compiled = _selectors.get(selector)
+    if compiled is None:
+        if len(_selectors) >= _MAX_SELECTORS:
+            _selectors.clear()
+        compiled = _selectors[selector] = Selector(selector)
+    return compiled
+
+
+def _key(tree):
+    # index key of the elements a selector without combinators can match,
+    # preferring ids to class names to tag names
+    keys = {}
+    while tree is not None:
+        if isinstance(tree, Hash):
+            keys.setdefault("id", tree.id)
+        elif isinstance(tree, Class):
+            keys.setdefault("class", tree.class_name)
+        elif isinstance(tree, ElementSelector) and tree.element:
+            keys.setdefault("tag", tree.element.lower())
+        tree = getattr(tree, "selector", None)
+    for name in ("id", "class", "tag"):
+        if name in keys:
+            return name, keys[name]
+    return None
+
+
+class Selector(object):
+    """A CSS selector list translated to XPath.
+
+    Selectors without combinators that have an id, class name or tag name
+    are matched against the elements of the document with it, looked up in
+    its index, so they take about the same time regardless of the size of the
+    document. Others are evaluated as XPath.
+
+    :param selector: CSS selector.
+    :type selector: str
+    :raises: :py:class:`~selenium.common.exceptions.InvalidSelectorException`
+    """
+
+    def __init__(self, selector):
+        self.selector = selector
+        try:
+            selectors = parse_selector(selector)
+            if any(parsed.pseudo_element for parsed in selectors):
+                raise ExpressionError("Pseudo-elements are not supported.")
+            self.combined = any(
+                isinstance(parsed.parsed_tree, CombinedSelector) for parsed in selectors
+            )
+            prefix = "descendant-or-self::" if self.combined else "descendant::"
+            self.xpath = self._translate(selectors, prefix)
+            # index key of each selector, or None when one can not be used
+            self.keys = [
+                None if self.combined else _key(parsed.parsed_tree)
+                for parsed in selectors
+            ]
+            self.matches = None
+            if None not in self.keys:
+                self.matches = self._translate(selectors, "self::")
+        except SelectorError as e:
+            raise InvalidSelectorException(
+                "Invalid CSS selector {!r}: {}".format(selector, e)
+            )
+
+    def __repr__(self):
+        return "Selector({!r})".format(self.selector)
+
+    @staticmethod
+    def _translate(selectors, prefix):
+        return etree.XPath(
+            " | ".join(
+                _TRANSLATOR.selector_to_xpath(parsed, prefix=prefix)
+                for parsed in selectors
+            )
+        )
+
+    def select(self, document, context):
+        """Find the elements matching the selector.
+
+        As with ``querySelectorAll``, the whole selector is matched against
+        the document, so combinators may match ancestors of the context.
+
+        :param document: Document.
+        :param context: The document, or the element to search within.
+        :type document: :py:class:`Document`
+        :type context: :py:class:`Document` or :py:class:`lxml.html.HtmlElement`
+        :return: Elements in document order.
+        :rtype: list
+        """
+        if None not in self.keys:
+            index = document.index
+            if len(self.keys) == 1:
+                candidates = index.lookup(*self.keys[0], root=context)
+            else:
+                found = set()
+                for key in self.keys:
+                    found.update(index.lookup(*key, root=context))
+                candidates = sorted(found, key=index.orders.get)
+            matches = self.matches
+            return [element for element in candidates if matches(element)]
+        if context is document or not self.combined:
+            return self.xpath(document.tree if context is document else context)
+        return document.index.within(self.xpath(document.tree), context)
+
+
+def compile_expression(expression):
+    """A compiled XPath expression, which is cached.
+
+    :param expression: XPath expression.
+    :type expression: str
+    :rtype: :py:class:`lxml.etree.XPath`
+    :raises: :py:class:`~selenium.common.exceptions.InvalidSelectorException`
+    """
+    compiled = _expressions.get(expression)
+    if compiled is None:
+        try:
+            compiled = etree.XPath(expression)
+        except etree.XPathSyntaxError as e:
+            raise InvalidSelectorException(
+                "Invalid XPath expression {!r}: {}".format(expression, e)
+            )
+        if len(_expressions) >= _MAX_EXPRESSIONS:
+            _expressions.clear()
+        _expressions[expression] = compiled
+    return compiled
+
+
+def select(document, context, selector):
+    """Find the elements matching a CSS selector.
+
+    As with ``querySelectorAll``, the whole selector is matched against the
+    document, so combinators may match ancestors of the context.
+
+    :param document: Document.
+    :param context: The document, or the element to search within.
+    :param selector: CSS selector.
+    :type document: :py:class:`Document`
+    :type context: :py:class:`Document` or :py:class:`lxml.html.HtmlElement`
+    :type selector: str
+    :return: Elements in document order.
+    :rtype: list
+    :raises: :py:class:`~selenium.common.exceptions.InvalidSelectorException`
+    """
+    return compile_selector(selector).select(document, context)
+
+
+def evaluate(document, context, expression):
+    """Find the elements selected by an XPath expression.
+
+    :param document: Document.
+    :param context: The document, or the context element.
+    :param expression: XPath expression.
+    :type document: :py:class:`Document`
+    :type context: :py:class:`Document` or :py:class:`lxml.html.HtmlElement`
+    :type expression: str
+    :return: Elements in document order.
+    :rtype: list
+    :raises: :py:class:`~selenium.common.exceptions.InvalidSelectorException`
+        if the expression is invalid or does not select elements.
+    """
+    xpath = compile_expression(expression)
+    try:
+        result = xpath(document.tree if context is document else context)
+    except etree.XPathError as e:
+        raise InvalidSelectorException(
+            "Invalid XPath expression {!r}: {}".format(expression, e)
+        )
+    if not isinstance(result, list) or not all(
+        etree.iselement(item) and isinstance(item.tag, str)
+        for item in result
+    ):
+        raise InvalidSelectorException(
+            "The result of the XPath expression {!r} is not a list of elements".format(
+                expression
+            )
+        )
+    return result
+
+
+def is_disabled(element):
+    """Whether a form element is disabled.
+
+    :param element: Element.
+    :type element: :py:class:`lxml.html.HtmlElement`
+    :rtype: bool
+    """
+    if element.tag not in FORM_ELEMENTS:
+        return False
+    if "disabled" in element.attrib:
+        return True
+    for ancestor in element.iterancestors("fieldset"):
+        if "disabled" in ancestor.attrib:
+            return True
+    return False
+
+
+def is_checked(element):
+    """Whether a check box or radio button is checked, or an option selected.
+
+    :param element: Element.
+    :type element: :py:class:`lxml.html.HtmlElement`
+    :rtype: bool
+    """
+    if element.tag == "input":
+        kind = element.get("type", "").lower()
+        return kind in ("checkbox", "radio") and "checked" in element.attrib
+    return element.tag == "option" and "selected" in element.attrib
+
+
+def is_displayed(element, hidden=()):
+    """Whether an element would be displayed by a browser.
+
+    Elements are hidden by the ``hidden`` attribute, inline styles with
+    ``display: none`` or ``visibility: hidden``, or when they are never
+    rendered, such as ``script`` elements. Style sheets are not applied, but
+    elements known to be hidden can be given.
+
+    :param element: Element.
+    :param hidden: (optional) Elements known to be hidden, such as the
+        ``hidden`` set of the document.
+    :type element: :py:class:`lxml.html.HtmlElement`
+    :rtype: bool
+    """
+    if element in hidden:
+        return False
+    visibility = None
+    node = element
+    while node is not None:
+        if node.tag in _HIDDEN_ELEMENTS or "hidden" in node.attrib:
+            return False
+        if node.tag == "input" and node.get("type", "").lower() == "hidden":
+            return False
+        style = node.get("style")
+        if style:
+            if _DISPLAY_NONE.search(style):
+                return False
+            if visibility is None:
+                match = _VISIBILITY.search(style)
+                if match:
+                    visibility = match.group(1).lower()
+        node = node.getparent()
+    return visibility not in ("hidden", "collapse")
+
+
+def visible_text(element, hidden=()):
+    """Text of an element as rendered by a browser.
+
+    Only text of displayed elements is included. Whitespace is collapsed
+    outside of ``pre`` elements, and block elements and ``br`` elements
+    start new lines.
+
+    :param element: Element.
+    :param hidden: (optional) Elements known to be hidden, see
+        :py:func:`is_displayed`.
+    :type element: :py:class:`lxml.html.HtmlElement`
+    :rtype: str
+    """
+    if not is_displayed(element, hidden):
+        return ""
+    parts = []
+    _render(element, parts, element.tag in ("pre", "textarea"), hidden)
+    lines = []
+    for line in "".join(parts).split("\n"):
+        # collapsed text never starts lines with spaces, preformatted may
+        line = line.rstrip(" ")
+        if line:
+            lines.append(line)
+    return "\n".join(lines)
+
+
+def _add_text(parts, text, preformatted):
+    if not text:
+        return
+    if not preformatted:
+        text = _WHITESPACE.sub(" ", text)
+        if text.startswith(" ") and (not parts or parts[-1][-1:] in " \n"):
+            text = text[1:]
+    if text:
+        parts.append(text)
+
+
+def _render(element, parts, preformatted, hidden):
+    _add_text(parts, element.text, preformatted)
+    for node in element:
+        tag = node.tag
+        # comments and processing instructions only have a tail
+        if isinstance(tag, str) and node not in hidden and _displayed_child(node):
+            if tag == "br":
+                parts.append("\n")
+            else:
+                block = tag in _BLOCK or tag in ("tr", "option", "caption")
+                if block:
+                    parts.append("\n")
+                _render(node, parts, preformatted or tag in ("pre", "textarea"), hidden)
+                if block:
+                    parts.append("\n")
+                elif tag in ("td", "th"):
+                    parts.append(" ")
+        _add_text(parts, node.tail, preformatted)
+
+
+def _displayed_child(element):
+    # is_displayed for an element whose parent is displayed
+    if element.tag in _HIDDEN_ELEMENTS or "hidden" in element.attrib:
+        return False
+    if element.tag == "input" and element.get("type", "").lower() == "hidden":
+        return False
+    style = element.get("style")
+    if style:
+        if _DISPLAY_NONE.search(style):
+            return False
+        match = _VISIBILITY.search(style)
+        if match and match.group(1).lower() in ("hidden", "collapse"):
+            return False
+    return True
@@ -2,15 +2,121 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
-from zope import component
-from zope.interface import classImplements
+import weakref
+
+from zope.interface import classImplements, implementedBy, providedBy
 
 from .interfaces import IDriver
 
+# adapters currently in use, keyed on the identity of the adapted driver
+_adapters = weakref.WeakValueDictionary()
+
+# adapter factories, keyed on the type of the adapted driver
+_factories = {}
+
+_defaults_registered = False
+
 
 def registerDriver(iface, driver, class_implements=[]):
     """ Register driver adapter used by page object"""
+    from zope import component
+
     for class_item in class_implements:
         classImplements(class_item, iface)
 
     component.provideAdapter(factory=driver, adapts=[iface], provides=IDriver)
+    clearAdapterCache()
+
+
+def registerDefaultDrivers():
+    """Register the driver adapters included with PyPOM.
+
+    Selenium support is always registered, and Splinter support is
+    registered if Splinter is installed. This is called the first time a
+    driver without a registered adapter is adapted, so the driver modules are
+    only imported when needed. The static HTML driver and the drivers of
+    recordings and replays are registered when :py:mod:`pypom.static_driver`
+    and :py:mod:`pypom.replay` are imported, which is needed to create them.
+    """
+    global _defaults_registered
+    _defaults_registered = True
+
+    from .selenium_driver import register as registerSelenium
+
+    registerSelenium()
+
+    try:
+        import splinter  # noqa
+    except ImportError:  # pragma: no cover
+        pass  # pragma: no cover
+    else:
+        from .splinter_driver import register as registerSplinter
+
+        registerSplinter()
+
+
+def clearAdapterCache():
+    """Forget all cached driver adapters and adapter factories.
+
+    This is called whenever a driver is registered, and only needs to be
+    called directly if the interfaces implemented by a driver class are
+    changed by other means.
+    """
+    _adapters.clear()
+    _factories.clear()
+
+
+def _factory(driver):
+    cls = type(driver)
+    spec = providedBy(driver)
+    if spec is not implementedBy(cls):
+        # the driver instance provides interfaces of its own, so its type
+        # can not be used to find the adapter factory
+        return None
+    factory = _factories.get(cls)
+    if factory is None:
+        from zope import component
+
+        factory = component.getSiteManager().adapters.lookup((spec,), IDriver)
+        if factory is not None:
+            _factories[cls] = factory
+    return factory
+
+
+def adaptDriver(driver):
+    """Return the driver adapter for a driver.
+
+    This is equivalent to ``IDriver(driver)``, but avoids looking up the
+    adapter registry each time. Adapters are shared by all page objects and
+    regions using the same driver for as long as any of them exist, and
+    adapter factories are looked up once per driver type.
+
+    :param driver: A driver.
+    :return: Driver adapter providing :py:class:`~pypom.interfaces.IDriver`.
+    :raises: TypeError if no adapter is registered for the driver, after
+        registering the default drivers.
+    """
+    adapter = _adapters.get(id(driver))
+    if adapter is not None and getattr(adapter, "driver", None) is driver:
+        return adapter
+
+    factory = _factory(driver)
+    if factory is None:
+        try:
+            adapter = IDriver(driver)
+        except TypeError:
+            if _defaults_registered:
+                raise
+            registerDefaultDrivers()
+            return adaptDriver(driver)
+    else:
+        adapter = factory(driver)
+        if adapter is None:
+            raise TypeError("Could not adapt", driver, IDriver)
+
+    if getattr(adapter, "driver", None) is driver:
+        try:
+            _adapters[id(driver)] = adapter
+        except TypeError:
+            pass  # the adapter does not support weak references
+    return adapter
@@ -0,0 +1,283 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Elements of static documents.
+
+Elements of the documents parsed by :py:mod:`pypom.dom` are found using
+:py:func:`find`, and read through :py:class:`StaticElement` in the same way
+as elements of a browser, both by the
+:py:class:`~pypom.static_driver.StaticDriver` and within
+:py:func:`~pypom.selenium_driver.Selenium.snapshot`.
+"""
+
+import sys
+
+from selenium.common.exceptions import (
+    InvalidArgumentException,
+    InvalidSelectorException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+)
+from selenium.webdriver.common.by import By
+
+from . import dom
+
+if sys.version_info >= (3,):
+    from urllib.parse import urljoin
+else:
+    from urlparse import urljoin
+
+# boolean attributes, which get_attribute returns as "true" or None
+_BOOLEAN_ATTRIBUTES = frozenset(
+    "async autofocus autoplay checked compact controls declare default defer "
+    "disabled formnovalidate hidden inert ismap itemscope loop multiple muted "
+    "nohref noresize noshade novalidate nowrap open readonly required reversed "
+    "selected".split()
+)
+
+# attributes that get_attribute resolves to absolute URLs
+_URL_ATTRIBUTES = frozenset(["href", "src", "action"])
+
+
+class StaticElement(object):
+    """An element of a page loaded by a :py:class:`~pypom.static_driver.StaticDriver`.
+
+    Elements become stale when another page is loaded, and then raise
+    :py:class:`~selenium.common.exceptions.StaleElementReferenceException`
+    in the same way as elements of a browser.
+    """
+
+    def __init__(self, driver, node, document):
+        self.parent = driver
+        self._node = node
+        self._document = document
+
+    def __repr__(self):
+        return "<StaticElement {}>".format(self._node.tag)
+
+    def __eq__(self, other):
+        return isinstance(other, StaticElement) and other._node is self._node
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self._node)
+
+    @property
+    def node(self):
+        """The element in the document tree.
+
+        :rtype: :py:class:`lxml.html.HtmlElement`
+        :raises: :py:class:`~selenium.common.exceptions.StaleElementReferenceException`
+        """
+        if self.parent.document is not self._document:
+            raise StaleElementReferenceException(
+                "The element is not part of the current page"
+            )
+        return self._node
+
+    @property
+    def tag_name(self):
+        return self.node.tag
+
+    @property
+    def text(self):
+        """Text of the element as rendered, see :py:func:`~pypom.dom.visible_text`."""
+        return dom.visible_text(self.node, self._document.hidden)
+
+    @property
+    def value(self):
+        return self.get_property("value")
+
+    @property
+    def html(self):
+        return dom.to_html(self.node, inner=True)
+
+    @property
+    def outer_html(self):
+        return dom.to_html(self.node)
+
+    def __getitem__(self, name):
+        return self.get_attribute(name)
+
+    def get_dom_attribute(self, name):
+        """Value of an attribute, or ``None``.
+
+        :rtype: str
+        """
+        return self.node.attrib.get(name.lower())
+
+    def get_attribute(self, name):
+        """Value of an attribute or property, in the same way as Selenium.
+
+        Boolean attributes are ``'true'`` or ``None``, and URLs are absolute.
+
+        :rtype: str
+        """
+        node = self.node
+        name = name.lower()
+        if name in _BOOLEAN_ATTRIBUTES:
+            if name in ("checked", "selected"):
+                return "true" if dom.is_checked(node) else None
+            return "true" if name in node.attrib else None
+        if name == "value":
+            return self.get_property("value")
+        if name == "classname":
+            name = "class"
+        value = node.attrib.get(name)
+        if value is not None and name in _URL_ATTRIBUTES:
+            return urljoin(self._document.url, value)
+        return value
+
+    def get_property(self, name):
+        """Value of a property of the element, or ``None``.
+
+        Supports common properties of elements and form fields.
+        """
+        node = self.node
+        if name == "value":
+            return _value(node)
+        if name == "textContent":
+            return node.text_content()
+        if name == "innerText":
+            return dom.visible_text(node, self._document.hidden)
+        if name == "innerHTML":
+            return dom.to_html(node, inner=True)
+        if name == "outerHTML":
+            return dom.to_html(node)
+        if name == "tagName":
+            return node.tag.upper()
+        if name == "className":
+            return node.attrib.get("class", "")
+        if name in ("checked", "selected"):
+            return dom.is_checked(node)
+        if name == "disabled":
+            return dom.is_disabled(node)
+        if name in _URL_ATTRIBUTES:
+            value = node.attrib.get(name)
+            return value if value is None else urljoin(self._document.url, value)
+        if name in ("id", "name", "title", "type", "lang", "dir"):
+            return node.attrib.get(name, "")
+        return None
+
+    def is_displayed(self):
+        return dom.is_displayed(self.node, self._document.hidden)
+
+    def is_enabled(self):
+        return not dom.is_disabled(self.node)
+
+    def is_selected(self):
+        return dom.is_checked(self.node)
+
+    def click(self):
+        """Follow a link. Clicking other elements does nothing."""
+        node = self.node
+        if node.tag == "a" and "href" in node.attrib:
+            self.parent.get(urljoin(self._document.url, node.attrib["href"]))
+
+    def find_element(self, by=By.ID, value=None):
+        """Find an element within this element.
+
+        :param by: Location strategy.
+        :param value: Locator.
+        :rtype: :py:class:`StaticElement`
+        :raises: :py:class:`~selenium.common.exceptions.NoSuchElementException`
+        """
+        return _first(self.find_elements(by, value), by, value)
+
+    def find_elements(self, by=By.ID, value=None):
+        """Find elements within this element.
+
+        :param by: Location strategy.
+        :param value: Locator.
+        :rtype: list of :py:class:`StaticElement`
+        """
+        nodes = find(self._document, self.node, by, value)
+        return [StaticElement(self.parent, node, self._document) for node in nodes]
+
+
+def _first(elements, by, value):
+    if not elements:
+        raise NoSuchElementException(
+            "Unable to locate element: {}={}".format(by, value)
+        )
+    return elements[0]
+
+
+def _value(node):
+    tag = node.tag
+    if tag == "input":
+        default = ""
+        if node.attrib.get("type", "").lower() in ("checkbox", "radio"):
+            default = "on"
+        return node.attrib.get("value", default)
+    if tag == "textarea":
+        return node.text_content()
+    if tag == "option":
+        if "value" in node.attrib:
+            return node.attrib["value"]
+        return " ".join(node.text_content().split())
+    if tag == "select":
+        options = list(node.iter("option"))
+        for option in options:
+            if "selected" in option.attrib:
+                return _value(option)
+        return _value(options[0]) if options else ""
+    if tag == "button":
+        return node.attrib.get("value", "")
+    return node.attrib.get("value")
+
+
+def find(document, context, by, value):
+    """Elements of a document located by a strategy.
+
+    Both the Selenium and the Splinter location strategies are supported,
+    and elements are looked up in the index of the document where possible.
+
+    :param document: Document to find elements in.
+    :param context: The document, or the element to find elements within.
+    :param by: Location strategy.
+    :param value: Locator.
+    :type document: :py:class:`~pypom.dom.Document`
+    :type context: :py:class:`~pypom.dom.Document` or
+        :py:class:`lxml.html.HtmlElement`
+    :type by: str
+    :type value: str
+    :return: Elements in document order.
+    :rtype: list
+    """
+    if by in (By.CSS_SELECTOR, "css"):
+        return dom.select(document, context, value)
+    if by == By.XPATH:
+        return dom.evaluate(document, context, value)
+    index = document.index
+    if by == By.ID:
+        return index.lookup("id", value, context)
+    if by == By.NAME:
+        return index.lookup("name", value, context)
+    if by == By.CLASS_NAME:
+        if not value or len(value.split()) != 1:
+            raise InvalidSelectorException("Compound class names not permitted")
+        return index.lookup("class", value.strip(), context)
+    if by in (By.TAG_NAME, "tag"):
+        return index.lookup("tag", value.lower(), context)
+    if by in (By.LINK_TEXT, By.PARTIAL_LINK_TEXT):
+        links = index.lookup("tag", "a", context)
+        hidden = document.hidden
+        if by == By.LINK_TEXT:
+            return [e for e in links if dom.visible_text(e, hidden) == value]
+        return [e for e in links if value in dom.visible_text(e, hidden)]
+    elements = index.within(index.elements, context)
+    if by == "text":
+        # elements with a text node of the value, which is either the text
+        # of the element or the tail of one of its children
+        return [
+            e
+            for e in elements
+            if e.text == value or any(child.tail == value for child in e)
+        ]
+    if by == "value":
+        return [e for e in elements if e.get("value") == value]
+    raise InvalidArgumentException("Unsupported location strategy: {}".format(by))
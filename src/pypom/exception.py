@@ -7,3 +7,9 @@ class UsageError(Exception):
     """PyPOM usage error."""
 
     pass
+
+
+class ReplayError(Exception):
+    """A driver was used differently from how it was recorded."""
+
+    pass
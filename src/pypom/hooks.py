@@ -15,3 +15,12 @@ def pypom_after_wait_for_page_to_load(page):
 @hookspec
 def pypom_after_wait_for_region_to_load(region):
     """Called after waiting for the region to load"""
+
+
+@hookspec
+def pypom_after_wait_for_regions_to_load(regions):
+    """Called after waiting for a list of regions to load together
+
+    :py:func:`pypom_after_wait_for_region_to_load` is also called for each of
+    the regions beforehand.
+    """
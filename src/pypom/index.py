@@ -0,0 +1,259 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Reverse URL matching.
+
+A :py:class:`PageIndex` finds the page object class whose
+:py:attr:`~pypom.page.Page.URL_TEMPLATE` matches a URL, along with the keyword
+arguments the URL was formatted from::
+
+  from pypom.index import PageIndex
+
+  index = PageIndex.from_subclasses(BasePage, base_url='https://www.mozilla.org')
+  match = index.match('https://www.mozilla.org/en-US/firefox/')
+  page = match.page_class(driver, index.base_url, **match.url_kwargs)
+
+"""
+
+import re
+import sys
+from collections import namedtuple
+from string import Formatter
+
+from .exception import UsageError
+from .page import Page, _field_name
+
+if sys.version_info >= (3,):
+    from urllib.parse import parse_qsl, unquote, urljoin, urlsplit
+else:
+    from urllib import unquote
+    from urlparse import parse_qsl, urljoin, urlsplit
+
+_WILDCARD = object()
+
+PageMatch = namedtuple("PageMatch", ["page_class", "url_kwargs"])
+
+
+def _compile(template, pattern):
+    # regular expression matching a part of a template, and the field names
+    # of its groups in order
+    regex = []
+    names = []
+    for literal, name, _, _ in Formatter().parse(template):
+        regex.append(re.escape(literal))
+        if name is not None:
+            names.append(_field_name(name))
+            regex.append("({})".format(pattern))
+    return re.compile("".join(regex) + "$"), names
+
+
+def _has_fields(template):
+    return any(name is not None for _, name, _, _ in Formatter().parse(template))
+
+
+def _key(template):
+    # trie key of a literal part of a template, or the wildcard
+    if template is None:
+        return None
+    return _WILDCARD if _has_fields(template) else _literal(template)
+
+
+def _literal(template):
+    return "".join(literal for literal, _, _, _ in Formatter().parse(template))
+
+
+class _Matcher(object):
+    # matches URLs against a single URL template
+
+    def __init__(self, page_class, template, base_url):
+        self.page_class = page_class
+        if base_url:
+            template = urljoin(base_url, template)
+        scheme, netloc, path, query, _ = urlsplit(template)
+        self.origin = None
+        if scheme or netloc:
+            self.origin = "{}://{}".format(scheme, netloc)
+        elif not path.startswith("/"):
+            path = "/" + path
+        self.path, self.path_names = _compile(
+            (self.origin or "") + path, "[^/]+?"
+        )
+        self.query = []
+        for key, value in parse_qsl(query, keep_blank_values=True):
+            self.query.append((key,) + _compile(value, ".*?"))
+        self.query_keys = set(key for key, _, _ in self.query)
+        self.specificity = len(_literal(path)) + len(self.query)
+
+        # the literal origin and path segments, with fields as wildcards
+        self.keys = [_key(self.origin)]
+        self.keys.extend(_key(segment) for segment in path.split("/")[1:])
+
+    def match(self, origin, path, query):
+        url_kwargs = {}
+        target = path if self.origin is None else origin + path
+        match = self.path.match(target)
+        if match is None:
+            return None
+        values = [unquote(value) for value in match.groups()]
+        if not self._collect(url_kwargs, self.path_names, values):
+            return None
+        params = {}
+        for key, value in query:
+            params.setdefault(key, []).append(value)
+        for key, regex, names in self.query:
+            if key not in params:
+                return None
+            match = regex.match(params[key][0])
+            if match is None or not self._collect(url_kwargs, names, match.groups()):
+                return None
+        for key, values in params.items():
+            if key not in self.query_keys:
+                url_kwargs[key] = values[0] if len(values) == 1 else values
+        return url_kwargs
+
+    def _collect(self, url_kwargs, names, values):
+        for name, value in zip(names, values):
+            if url_kwargs.setdefault(name, value) != value:
+                # the same field must have the same value everywhere
+                return False
+        return True
+
+
+class _Node(object):
+    __slots__ = ("children", "matchers")
+
+    def __init__(self):
+        self.children = {}
+        self.matchers = []
+
+
+class PageIndex(object):
+    """An index of page object classes by URL template.
+
+    Templates are compiled when they are registered, and indexed in a trie by
+    their path segments, where segments with keyword arguments match any
+    segment. Matching a URL only tries the templates found by following its
+    path segments through the trie, preferring literal segments, rather than
+    every registered template.
+
+    :param base_url: (optional) Base URL that relative URL templates are
+        joined to. Without one, relative templates match URLs on any host.
+    :type base_url: str
+    """
+
+    def __init__(self, base_url=None):
+        self.base_url = base_url
+        self._root = _Node()
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    @classmethod
+    def from_subclasses(cls, base=Page, base_url=None):
+        """Creates an index of all subclasses of a page object class.
+
+        Classes are only registered if they define :py:attr:`~pypom.page.Page.URL_TEMPLATE`
+        themselves, rather than inheriting it.
+
+        :param base: (optional) Page object class. Defaults to :py:class:`~pypom.page.Page`.
+        :param base_url: (optional) Base URL that relative URL templates are joined to.
+        :type base: :py:class:`~pypom.page.Page` subclass
+        :type base_url: str
+        :return: Page index.
+        :rtype: :py:class:`PageIndex`
+        """
+        index = cls(base_url=base_url)
+        seen = set()
+        pending = [base]
+        while pending:
+            page_class = pending.pop()
+            if page_class in seen:
+                continue
+            seen.add(page_class)
+            if page_class.__dict__.get("URL_TEMPLATE") is not None:
+                index.register(page_class)
+            pending.extend(reversed(page_class.__subclasses__()))
+        return index
+
+    def register(self, page_class):
+        """Adds a page object class to the index.
+
+        :param page_class: Page object class with a URL template.
+        :type page_class: :py:class:`~pypom.page.Page` subclass
+        :return: The page object class, so this can be used as a class decorator.
+        :raises: UsageError
+        """
+        if page_class.URL_TEMPLATE is None:
+            raise UsageError(
+                "{} does not have a URL_TEMPLATE".format(page_class.__name__)
+            )
+        matcher = _Matcher(page_class, page_class.URL_TEMPLATE, self.base_url)
+        node = self._root
+        for key in matcher.keys:
+            node = node.children.setdefault(key, _Node())
+        node.matchers.append(matcher)
+        node.matchers.sort(key=lambda m: -m.specificity)
+        self._count += 1
+        return page_class
+
+    def match(self, url):
+        """Finds the page object class matching a URL.
+
+        Query parameters that are not part of the URL template are returned as
+        keyword arguments, in the same way that keyword arguments that are not
+        part of the template are added to the query of the
+        :py:attr:`~pypom.page.Page.seed_url`.
+
+        :param url: URL to match.
+        :type url: str
+        :return: Named tuple of the page object class and the keyword arguments
+            of its URL template, or ``None`` if no template matches.
+        :rtype: :py:class:`PageMatch`
+        """
+        scheme, netloc, path, query, _ = urlsplit(url)
+        origin = "{}://{}".format(scheme, netloc)
+        path = path or "/"
+        query = parse_qsl(query, keep_blank_values=True)
+        segments = path.split("/")[1:]
+        for node in self._nodes(self._root, [origin] + segments, 0):
+            for matcher in node.matchers:
+                url_kwargs = matcher.match(origin, path, query)
+                if url_kwargs is not None:
+                    return PageMatch(matcher.page_class, url_kwargs)
+        for node in self._nodes(self._root.children.get(None), segments, 0):
+            for matcher in node.matchers:
+                url_kwargs = matcher.match(origin, path, query)
+                if url_kwargs is not None:
+                    return PageMatch(matcher.page_class, url_kwargs)
+        return None
+
+    def _nodes(self, node, keys, depth):
+        # nodes at the end of the keys, following literal keys first
+        if node is None:
+            return
+        if depth == len(keys):
+            yield node
+            return
+        for child in (node.children.get(keys[depth]), node.children.get(_WILDCARD)):
+            for found in self._nodes(child, keys, depth + 1):
+                yield found
+
+    def current_page(self, driver, **kwargs):
+        """Creates a page object for the current page of a driver.
+
+        :param driver: A driver.
+        :param kwargs: Additional keyword arguments passed to the page object,
+            such as ``timeout``.
+        :return: Page object, or ``None`` if no template matches the current
+            URL. The page object does not wait for the page to load.
+        :rtype: :py:class:`~pypom.page.Page`
+        """
+        from .driver import adaptDriver
+
+        match = self.match(adaptDriver(driver).current_url())
+        if match is None:
+            return None
+        kwargs.update(match.url_kwargs)
+        return match.page_class(driver, self.base_url, **kwargs)
@@ -2,7 +2,7 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
-from zope.interface import Interface
+from zope.interface import Attribute, Interface
 
 
 class ISplinter(Interface):
@@ -12,11 +12,29 @@ class ISplinter(Interface):
 class IDriver(Interface):
     """ Driver interface """
 
-    def wait_factory(timeout):
+    stale_exceptions = Attribute(
+        "Tuple of exceptions raised when using an element that is no longer "
+        "attached to the page"
+    )
+
+    def check_stale(element):
+        """Checks whether an element is still attached to the page.
+
+        Only needed by drivers finding no elements within a stale element,
+        rather than raising one of :py:attr:`stale_exceptions`.
+
+        :param element: Element to check.
+        :raises: One of :py:attr:`stale_exceptions` if the element is stale.
+        """
+
+    def wait_factory(timeout, polling=None):
         """Returns a WebDriverWait like property for a given timeout.
 
         :param timeout: Timeout used by WebDriverWait like calls
+        :param polling: (optional) Polling policy deciding how long to sleep
+            between checks.
         :type timeout: int
+        :type polling: :py:class:`~pypom.polling.PollingPolicy`
         """
 
     def open(url):
@@ -24,6 +42,44 @@ class IDriver(Interface):
         Navigates to :py:attr:`url`
         """
 
+    def current_url():
+        """Returns the URL of the current page.
+
+        :rtype: str
+        """
+
+    def refresh():
+        """Reload the current page."""
+
+    def implicitly_wait(time_to_wait):
+        """Sets the implicit wait of the driver, and keeps track of it.
+
+        :param time_to_wait: Time in seconds to wait when locating elements.
+        :type time_to_wait: int
+        """
+
+    def compose_locator(root_locator, locator):
+        """Combines a root locator and a locator relative to the root.
+
+        :param root_locator: Tuple of strategy and locator of the root element.
+        :param locator: Tuple of strategy and locator of elements within the root.
+        :type root_locator: tuple
+        :type locator: tuple
+        :return: Tuple of strategy and locator finding the same elements with a
+            single command, or ``None`` if the locators can not be combined.
+        :rtype: tuple
+        """
+
+    def snapshot():
+        """Context manager reading the current page from a copy within it.
+
+        Finding elements and checking whether they are present or displayed
+        use the copy, which is taken again after the page changes.
+        """
+
+    def invalidate_snapshot():
+        """Discards the copy of the page taken within :py:func:`snapshot`."""
+
     def find_element(strategy, locator, root=None):
         """Finds an element on the page.
 
@@ -75,3 +131,104 @@ class IDriver(Interface):
         :return: ``True`` if element is displayed, else ``False``.
         :rtype: bool
         """
+
+    def extract_elements(elements, fields):
+        """Reads data from elements using a single command.
+
+        :param elements: Elements to read.
+        :param fields: Fields to read from each element. Valid values are
+            ``text``, ``displayed``, ``tag_name``, ``attribute:<name>``, and
+            ``property:<name>``.
+        :type elements: list
+        :type fields: list
+        :return: List with a dictionary of values by field for each element.
+        :rtype: list
+        """
+
+    def extract(strategy, locator, fields, root=None):
+        """Finds elements and reads data from them using a single command.
+
+        :param strategy: Location strategy to use (type depends on the driver implementation)
+        :param locator: Location of target elements.
+        :param fields: Fields to read from each element.
+        :param root: (optional) root node.
+        :type strategy: str
+        :type locator: str
+        :type fields: list
+        :type root: web element object or None.
+        :return: List with a dictionary of values by field for each element.
+        :rtype: list
+        """
+
+    def extract_records(elements, fields):
+        """Reads data from elements within root elements using a single command.
+
+        :param elements: Root elements to read.
+        :param fields: Tuples of strategy, locator and field to read from
+            the first element located within each root element, or from the
+            root element when the strategy and locator are ``None``.
+        :type elements: list
+        :type fields: list
+        :return: List with a list of values for each root element.
+        :rtype: list
+        """
+
+    def find_records(strategy, locator, fields, root=None):
+        """Finds root elements and reads data from elements within them.
+
+        :param strategy: Location strategy to use (type depends on the driver implementation)
+        :param locator: Location of root elements.
+        :param fields: Fields to read. See :py:func:`extract_records`.
+        :param root: (optional) root node.
+        :type strategy: str
+        :type locator: str
+        :type fields: list
+        :type root: web element object or None.
+        :return: List with a list of values for each root element.
+        :rtype: list
+        """
+
+    def wait_for_script(script, args, timeout):
+        """Waits for a script to return a true value.
+
+        :param script: Body of a JavaScript function returning the condition.
+        :param args: Arguments passed to the function.
+        :param timeout: Time in seconds to wait for.
+        :type script: str
+        :type args: list
+        :type timeout: int
+        :raises: TimeoutException
+        """
+
+    def document_marker():
+        """Marks the current document.
+
+        :return: Marker identifying the current document and URL.
+        """
+
+    def wait_for_new_document(marker, timeout):
+        """Waits for the document or URL to change.
+
+        :param marker: Marker returned by :py:func:`document_marker`.
+        :param timeout: Time in seconds to wait for.
+        :type timeout: int
+        :raises: TimeoutException
+        """
+
+    def get_state():
+        """Returns the cookies and storage of the current origin.
+
+        :return: Dictionary of the ``origin``, a list of ``cookies``, and
+            dictionaries of ``local_storage`` and ``session_storage`` items.
+        :rtype: dict
+        """
+
+    def set_state(state, url=None):
+        """Replaces the cookies and storage of an origin.
+
+        :param state: State returned by :py:func:`get_state`.
+        :param url: (optional) URL to open on the origin of the state, if
+            the current page is not on it.
+        :type state: dict
+        :type url: str
+        """
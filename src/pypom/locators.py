@@ -0,0 +1,200 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Driver independent handling of locators.
+
+Drivers name their location strategies differently, so the functions in this
+module work with locator kinds. Driver adapters map their own strategies to
+and from these kinds.
+"""
+
+import re
+
+CSS = "css"
+XPATH = "xpath"
+ID = "id"
+NAME = "name"
+CLASS_NAME = "class name"
+TAG_NAME = "tag name"
+
+_IDENTIFIER = re.compile(r"^-?[_a-zA-Z][_a-zA-Z0-9-]*$")
+_ID_SELECTOR = re.compile(r"^#-?[_a-zA-Z][_a-zA-Z0-9-]*$")
+
+
+def _css_string(value):
+    return '"{}"'.format(value.replace("\\", "\\\\").replace('"', '\\"'))
+
+
+def _xpath_literal(value):
+    if "'" not in value:
+        return "'{}'".format(value)
+    if '"' not in value:
+        return '"{}"'.format(value)
+    parts = value.split("'")
+    return "concat({})".format(", \"'\", ".join("'{}'".format(p) for p in parts))
+
+
+def to_css(kind, value):
+    """Convert a locator to a CSS selector.
+
+    :param kind: Locator kind.
+    :param value: Locator value.
+    :return: Equivalent CSS selector, or ``None`` if there is none.
+    :rtype: str
+    """
+    if kind == CSS:
+        return value
+    if kind == NAME:
+        return "[name={}]".format(_css_string(value))
+    if not _IDENTIFIER.match(value):
+        return None
+    if kind == ID:
+        return "#" + value
+    if kind == CLASS_NAME:
+        return "." + value
+    if kind == TAG_NAME:
+        return value
+    return None
+
+
+def to_xpath(kind, value):
+    """Convert a locator to an XPath expression.
+
+    The expression for locators other than XPath selects matching descendants
+    of the context node, so it can be used relative to a root element.
+
+    :param kind: Locator kind.
+    :param value: Locator value.
+    :return: Equivalent XPath expression, or ``None`` if there is none.
+    :rtype: str
+    """
+    if kind == XPATH:
+        return value
+    if kind == ID:
+        return ".//*[@id={}]".format(_xpath_literal(value))
+    if kind == NAME:
+        return ".//*[@name={}]".format(_xpath_literal(value))
+    if kind == CLASS_NAME and _IDENTIFIER.match(value):
+        return ".//*[contains(concat(' ', normalize-space(@class), ' '), ' {} ')]".format(
+            value
+        )
+    if kind == TAG_NAME and _IDENTIFIER.match(value) and value == value.lower():
+        return ".//" + value
+    return None
+
+
+class _Composed(str):
+    # a selector returned by compose, which selects elements within its root
+    # element in the same way within any other root
+    pass
+
+
+def _is_compound(css):
+    # whether a selector has no combinators, so that it matches the same
+    # elements within a root as it does when appended to the root selector;
+    # otherwise the ancestors it requires may be outside of the root
+    quote = None
+    depth = 0
+    escaped = False
+    for char in css.strip():
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char in "[(":
+            depth += 1
+        elif char in "])":
+            depth -= 1
+        elif depth == 0 and (char.isspace() or char in ">+~,"):
+            return False
+    return True
+
+
+def _unique_css(kind, value):
+    # only an element id is unique enough to combine with a CSS selector
+    if kind == ID and _IDENTIFIER.match(value):
+        return "#" + value
+    if kind == CSS and _ID_SELECTOR.match(value.strip()):
+        return value.strip()
+    return None
+
+
+def _split_group(value):
+    # split "(expression)rest" into expression and rest
+    depth = 0
+    quote = None
+    for index, char in enumerate(value):
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth == 0:
+                end = index + 1
+                return value[1:index], value[end:]
+    return None, None
+
+
+def _compose_xpath(root_xpath, kind, value):
+    value = value.strip()
+    if kind != XPATH:
+        value = to_xpath(kind, value)
+        if value is None:
+            return None
+    if value.startswith("("):
+        # a previously composed locator, so compose the grouped expression
+        group, rest = _split_group(value)
+        if group is None or "|" in rest:
+            return None
+        group = _compose_xpath(root_xpath, XPATH, group)
+        return group and "({}){}".format(group, rest)
+    if "|" in value or value.startswith("/"):
+        return None
+    if value == ".":
+        return "({})[1]".format(root_xpath)
+    if value.startswith(("./", ".//")):
+        return "({})[1]{}".format(root_xpath, value[1:])
+    return "({})[1]/{}".format(root_xpath, value)
+
+
+def compose(root_locator, locator):
+    """Combine a root locator and a locator relative to the root.
+
+    Locating the returned locator finds the same elements as locating the
+    root element and then locating elements within it, using a single
+    command. When the root is located by XPath the first matching element is
+    used as the root, in the same way as locating the root element first. CSS
+    selectors are only combined when the root is located by its id, and when
+    they have no combinators, as the ancestors a selector with combinators
+    requires may be outside of the root element.
+
+    :param root_locator: Tuple of kind and value locating the root element.
+    :param locator: Tuple of kind and value locating elements within the root.
+    :return: Tuple of kind and value, or ``None`` if the locators can not be
+        combined.
+    :rtype: tuple
+    """
+    root_kind, root_value = root_locator
+    kind, value = locator
+
+    if kind != XPATH:
+        root_css = _unique_css(root_kind, root_value)
+        css = to_css(kind, value)
+        if root_css and css and (isinstance(value, _Composed) or _is_compound(css)):
+            return CSS, _Composed("{} {}".format(root_css, css.strip()))
+
+    root_xpath = to_xpath(root_kind, root_value)
+    xpath = root_xpath and _compose_xpath(root_xpath, kind, value)
+    if xpath:
+        return XPATH, xpath
+    return None
@@ -2,26 +2,80 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
-import collections
+import re
 import sys
+from string import Formatter
 
 from .exception import UsageError
 from .view import WebView
 
 if sys.version_info >= (3,):
     import urllib.parse as urlparse
+    from collections.abc import Iterable
     from urllib.parse import urlencode
 else:
     import urlparse
+    from collections import Iterable
     from urllib import urlencode
 
+_FIELD_NAME = re.compile(r"[^.\[]*")
+
+_template_fields = {}
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+_NAVIGATION = ("navigate", "skip", "refresh")
+
 
 def iterable(arg):
-    if isinstance(arg, collections.Iterable) and not isinstance(arg, str):
+    if isinstance(arg, Iterable) and not isinstance(arg, str):
         return arg
     return [arg]
 
 
+def _normalize_url(url):
+    # comparable form of a URL, ignoring the case of the scheme and host,
+    # default ports, the order of query parameters, and the fragment
+    parts = urlparse.urlsplit(url)
+    scheme = parts.scheme.lower()
+    netloc = (parts.hostname or "").lower()
+    if parts.port and parts.port != _DEFAULT_PORTS.get(scheme):
+        netloc = "{}:{}".format(netloc, parts.port)
+    if parts.username or parts.password:
+        netloc = "{}@{}".format(parts.netloc.rpartition("@")[0], netloc)
+    path = urlparse.unquote(parts.path) or "/"
+    query = sorted(urlparse.parse_qsl(parts.query, keep_blank_values=True))
+    return scheme, netloc, path, query
+
+
+def _field_name(field):
+    # keyword argument of a replacement field, such as "user" for "user.name"
+    return _FIELD_NAME.match(field).group()
+
+
+def template_fields(template):
+    """Names of the keyword arguments used by a URL template.
+
+    Templates are only parsed once, as the names are cached.
+
+    :param template: URL template, or ``None``.
+    :type template: str
+    :return: Names of keyword arguments.
+    :rtype: frozenset
+    """
+    fields = _template_fields.get(template)
+    if fields is None:
+        names = []
+        if template is not None:
+            names = [
+                _field_name(name)
+                for _, name, _, _ in Formatter().parse(template)
+                if name
+            ]
+        fields = _template_fields[template] = frozenset(names)
+    return fields
+
+
 class Page(WebView):
     """A page object.
 
@@ -77,6 +131,57 @@ class Page(WebView):
 
     """
 
+    _loaded_script = None
+    """Body of a JavaScript function returning ``true`` when the page has loaded.
+
+    When set, :py:func:`wait_for_page_to_load` waits for the function in the
+    browser before checking :py:attr:`loaded`. The function is evaluated
+    whenever the document changes, so the wait ends as soon as the page has
+    loaded rather than at the next poll. Drivers that can not run scripts
+    only check :py:attr:`loaded`.
+
+    Example::
+
+        _loaded_script = "return document.body.classList.contains('loaded');"
+
+    """
+
+    _loaded_conditions = None
+    """Conditions that are met when the page has loaded.
+
+    A sequence of conditions from :py:mod:`pypom.conditions`.
+    :py:func:`wait_for_page_to_load` waits for all of them to be met before
+    checking :py:attr:`loaded`, using a single script evaluated in the
+    browser in the same way as :py:attr:`_loaded_script`. Conditions that can
+    not be checked by a script are checked one at a time on every poll.
+
+    Example::
+
+        _loaded_conditions = (
+            UrlMatches(r'/en-US/$'),
+            Displayed(By.ID, 'logo'),
+        )
+
+    """
+
+    _navigation = "navigate"
+    """How :py:func:`open` navigates when the browser is already on the page.
+
+    By default :py:func:`open` always navigates to :py:attr:`seed_url`. Set to
+    ``'skip'`` to not navigate when the current URL is the seed URL, or to
+    ``'refresh'`` to reload the current page instead. URLs are compared
+    ignoring the case of the scheme and host, default ports, the order of
+    query parameters, and the fragment. :py:func:`wait_for_page_to_load` is
+    called either way.
+
+    Example::
+
+        _navigation = 'skip'
+
+    """
+
+    _seed_url_cache = None
+
     def __init__(self, driver, base_url=None, timeout=10, **url_kwargs):
         super(Page, self).__init__(driver, timeout)
         self.base_url = base_url
@@ -88,12 +193,30 @@ class Page(WebView):
 
         The URL is formatted from :py:attr:`URL_TEMPLATE`, which is then
         appended to :py:attr:`base_url` unless the template results in an
-        absolute URL.
+        absolute URL. Keyword arguments that are not used by the template are
+        added to the query string.
+
+        The URL is cached until :py:attr:`base_url`, :py:attr:`URL_TEMPLATE`,
+        or the keyword arguments change.
 
         :return: URL that can be used to open the page.
         :rtype: str
 
         """
+        # copies of list values, so that changing them is noticed too
+        kwargs = dict(
+            (k, tuple(v) if isinstance(v, list) else v)
+            for k, v in self.url_kwargs.items()
+        )
+        key = (self.base_url, self.URL_TEMPLATE, kwargs)
+        cache = self._seed_url_cache
+        if cache is not None and cache[0] == key:
+            return cache[1]
+        url = self._format_seed_url()
+        self._seed_url_cache = (key, url)
+        return url
+
+    def _format_seed_url(self):
         url = self.base_url
         if self.URL_TEMPLATE is not None:
             url = urlparse.urljoin(
@@ -106,12 +229,12 @@ class Page(WebView):
         url_parts = list(urlparse.urlparse(url))
         query = urlparse.parse_qsl(url_parts[4])
 
+        fields = template_fields(self.URL_TEMPLATE)
         for k, v in self.url_kwargs.items():
-            if v is None:
+            if v is None or k in fields:
                 continue
-            if "{{{}}}".format(k) not in str(self.URL_TEMPLATE):
-                for i in iterable(v):
-                    query.append((k, i))
+            for i in iterable(v):
+                query.append((k, i))
 
         url_parts[4] = urlencode(query)
         return urlparse.urlunparse(url_parts)
@@ -120,21 +243,41 @@ class Page(WebView):
         """Open the page.
 
         Navigates to :py:attr:`seed_url` and calls :py:func:`wait_for_page_to_load`.
+        See :py:attr:`_navigation` for skipping the navigation when the
+        browser is already on the page.
 
         :return: The current page object.
         :rtype: :py:class:`Page`
         :raises: UsageError
 
         """
-        if self.seed_url:
-            self.driver_adapter.open(self.seed_url)
+        seed_url = self.seed_url
+        if seed_url:
+            self._navigate(seed_url)
             self.wait_for_page_to_load()
             return self
         raise UsageError("Set a base URL or URL_TEMPLATE to open this page.")
 
+    def _navigate(self, seed_url):
+        navigation = self._navigation
+        if navigation not in _NAVIGATION:
+            raise UsageError(
+                "_navigation must be one of {}, not {!r}".format(
+                    ", ".join(repr(n) for n in _NAVIGATION), navigation
+                )
+            )
+        if navigation != "navigate":
+            current_url = self.driver_adapter.current_url()
+            if _normalize_url(current_url) == _normalize_url(seed_url):
+                if navigation == "refresh":
+                    self.driver_adapter.refresh()
+                return
+        self.driver_adapter.open(seed_url)
+
     def wait_for_page_to_load(self):
         """Wait for the page to load."""
-        self.wait.until(lambda _: self.loaded)
+        conditions = self._wait_for_loaded_script()
+        self.wait.until(lambda _: self._conditions_met(conditions) and self.loaded)
         self.pm.hook.pypom_after_wait_for_page_to_load(page=self)
         return self
 
@@ -0,0 +1,83 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+from contextlib import contextmanager
+
+from pluggy import PluginManager
+
+from pypom import hooks
+
+_plugin_manager = None
+
+
+def create_plugin_manager():
+    """Create a new plugin manager.
+
+    The returned plugin manager has the PyPOM hook specifications added and
+    all plugins registered under the ``pypom.plugin`` entry point loaded.
+
+    :return: A new plugin manager.
+    :rtype: :py:class:`~pluggy.PluginManager`
+    """
+    pm = PluginManager("pypom")
+    pm.add_hookspecs(hooks)
+    pm.load_setuptools_entrypoints("pypom.plugin")
+    pm.check_pending()
+    return pm
+
+
+def get_plugin_manager():
+    """Return the plugin manager shared by all page objects.
+
+    The plugin manager is created on first use, and reused by every page
+    object that is not given a plugin manager explicitly.
+
+    :return: The shared plugin manager.
+    :rtype: :py:class:`~pluggy.PluginManager`
+    """
+    global _plugin_manager
+    if _plugin_manager is None:
+        _plugin_manager = create_plugin_manager()
+    return _plugin_manager
+
+
+def refresh_plugin_manager():
+    """Replace the shared plugin manager with a new one.
+
+    Use this when plugins have been installed or removed since the shared
+    plugin manager was created. Page objects that already exist keep using
+    the plugin manager they were created with.
+
+    :return: The new shared plugin manager.
+    :rtype: :py:class:`~pluggy.PluginManager`
+    """
+    global _plugin_manager
+    _plugin_manager = create_plugin_manager()
+    return _plugin_manager
+
+
+@contextmanager
+def isolated_plugin_manager():
+    """Use a new plugin manager for page objects created within the block.
+
+    Plugins registered with the isolated plugin manager are not seen by page
+    objects created outside of the block. The shared plugin manager is
+    restored on exit.
+
+    Usage::
+
+      from pypom.plugins import isolated_plugin_manager
+
+      with isolated_plugin_manager() as pm:
+          pm.register(MyPlugin())
+          page = Mozilla(driver).open()
+
+    """
+    global _plugin_manager
+    previous = _plugin_manager
+    _plugin_manager = create_plugin_manager()
+    try:
+        yield _plugin_manager
+    finally:
+        _plugin_manager = previous
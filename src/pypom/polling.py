@@ -0,0 +1,176 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Polling policies for waits.
+
+A polling policy decides how long a wait sleeps between checks of its
+condition. Set one on a page or region class using ``_polling``::
+
+  from pypom import Page
+  from pypom.polling import ExponentialBackoff
+
+  class Mozilla(Page):
+      _polling = ExponentialBackoff(initial=0.01, maximum=0.5)
+
+"""
+
+import threading
+
+
+class PollingPolicy(object):
+    """Base class for polling policies.
+
+    Sleeps for ``interval`` seconds between checks, which is half a second
+    as in Selenium waits. Subclasses override :py:func:`intervals` to sleep
+    for other times.
+    """
+
+    interval = 0.5
+
+    def bind(self, key):
+        """Return the policy to use for waits of a page or region class.
+
+        :param key: Page or region class.
+        :return: Polling policy.
+        :rtype: :py:class:`PollingPolicy`
+        """
+        return self
+
+    def intervals(self):
+        """Return an iterator of the time in seconds to sleep between checks.
+
+        :rtype: iterator
+        """
+        while True:
+            yield self.interval
+
+    def record(self, elapsed):
+        """Record the time taken for the condition of a wait to be met.
+
+        :param elapsed: Time in seconds.
+        :type elapsed: float
+        """
+
+
+class FixedInterval(PollingPolicy):
+    """Sleep for the same time between checks.
+
+    :param interval: Time in seconds to sleep between checks.
+    :type interval: float
+    """
+
+    def __init__(self, interval=0.5):
+        self.interval = interval
+
+    def __repr__(self):
+        return "FixedInterval({!r})".format(self.interval)
+
+
+class ExponentialBackoff(PollingPolicy):
+    """Sleep for longer after each check, up to a maximum.
+
+    Conditions that are met quickly are noticed within milliseconds, while
+    slow conditions are not checked more often than necessary.
+
+    :param initial: Time in seconds to sleep after the first check.
+    :param factor: Factor to multiply the time to sleep by after each check.
+    :param maximum: Longest time in seconds to sleep between checks.
+    :type initial: float
+    :type factor: float
+    :type maximum: float
+    """
+
+    def __init__(self, initial=0.01, factor=2, maximum=0.5):
+        self.initial = initial
+        self.factor = factor
+        self.maximum = maximum
+
+    def __repr__(self):
+        return "ExponentialBackoff(initial={!r}, factor={!r}, maximum={!r})".format(
+            self.initial, self.factor, self.maximum
+        )
+
+    def intervals(self):
+        interval = self.initial
+        while True:
+            yield min(interval, self.maximum)
+            interval *= self.factor
+
+
+class LearnedInterval(PollingPolicy):
+    """Sleep for the time conditions usually take to be met.
+
+    Keeps a moving average of the time taken for waits to end for each page
+    or region class. After the first check, a wait sleeps until shortly
+    before the average time has passed, and then backs off exponentially.
+
+    :param initial: Time in seconds to sleep between checks before the
+        average time is known, and after the first check once it is.
+    :param maximum: Longest time in seconds to sleep between later checks.
+    :param weight: Weight of the latest time in the moving average.
+    :param lead: Fraction of the average time to sleep for at first.
+    :type initial: float
+    :type maximum: float
+    :type weight: float
+    :type lead: float
+    """
+
+    def __init__(self, initial=0.01, maximum=0.5, weight=0.2, lead=0.9):
+        self.initial = initial
+        self.maximum = maximum
+        self.weight = weight
+        self.lead = lead
+        self._bound = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return "LearnedInterval(initial={!r}, maximum={!r})".format(
+            self.initial, self.maximum
+        )
+
+    def bind(self, key):
+        policy = self._bound.get(key)
+        if policy is None:
+            with self._lock:
+                policy = self._bound.setdefault(key, _LearnedPolicy(self, key))
+        return policy
+
+    def intervals(self):
+        return ExponentialBackoff(self.initial, 2, self.maximum).intervals()
+
+    def average(self, key):
+        """Return the average time taken for waits of a class to end.
+
+        :param key: Page or region class.
+        :return: Time in seconds, or ``None`` if no waits have ended.
+        :rtype: float
+        """
+        policy = self._bound.get(key)
+        return policy and policy.average
+
+
+class _LearnedPolicy(PollingPolicy):
+    # the learned state of a single page or region class
+
+    def __init__(self, parent, key):
+        self.parent = parent
+        self.key = key
+        self.average = None
+
+    def __repr__(self):
+        return "{!r} for {!r}".format(self.parent, self.key)
+
+    def intervals(self):
+        parent = self.parent
+        if self.average:
+            yield self.average * parent.lead
+        for interval in parent.intervals():
+            yield interval
+
+    def record(self, elapsed):
+        if self.average is None:
+            self.average = elapsed
+        else:
+            weight = self.parent.weight
+            self.average = weight * elapsed + (1 - weight) * self.average
@@ -2,6 +2,9 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
+from collections import deque, namedtuple
+
+from .exception import UsageError
 from .view import WebView
 
 
@@ -12,8 +15,10 @@ class Region(WebView):
 
     :param page: Page object this region appears in.
     :param root: (optional) element that serves as the root for the region.
+    :param wait: (optional) Wait for the region to load. Defaults to ``True``.
     :type page: :py:class:`~.page.Page`
     :type root: :py:class:`~selenium.webdriver.remote.webelement.WebElement` or :py:class:`~splinter.driver.webdriver.WebDriverElement`
+    :type wait: bool
 
     Usage (Selenium)::
 
@@ -66,11 +71,231 @@ class Region(WebView):
 
     _root_locator = None
 
-    def __init__(self, page, root=None):
+    _cache_root = False
+    """Cache the root element located using :py:attr:`_root_locator`.
+
+    By default the root element is located every time :py:attr:`root` is
+    accessed, which costs an additional command for every element located
+    within the region. When this is ``True`` the root element is located once,
+    and located again only when using it raises
+    :py:class:`~selenium.common.exceptions.StaleElementReferenceException` from
+    :py:func:`find_element`, :py:func:`find_elements`,
+    :py:func:`is_element_present`, or :py:func:`is_element_displayed`.
+    """
+
+    _compose_locators = False
+    """Combine :py:attr:`_root_locator` with locators within the region.
+
+    When ``True``, :py:func:`find_element` and :py:func:`find_elements` locate
+    elements within a region located by :py:attr:`_root_locator` using a
+    single command where the driver can combine the two locators, for example
+    ``(By.ID, 'newsletter-form')`` and ``(By.ID, 'footer_email_submit')``
+    become ``(By.CSS_SELECTOR, '#newsletter-form #footer_email_submit')``.
+    This applies to regions nested within regions too, so a chain of regions
+    is located with one command. CSS selectors with combinators are not
+    combined, as the ancestors they match may be outside of the root element,
+    and neither are locators of regions overriding :py:attr:`root`.
+    Otherwise the root element is located first.
+    """
+
+    _lazy = False
+    """Defer waiting for the region to load until it is used.
+
+    When ``True``, :py:func:`wait_for_region_to_load` is not called on
+    construction, but the first time :py:attr:`root` is accessed or an element
+    is located within the region. This avoids the cost of waiting for regions
+    that are created but never used.
+    """
+
+    _loaded_script = None
+    """Body of a JavaScript function returning ``true`` when the region has loaded.
+
+    When set, :py:func:`wait_for_region_to_load` waits for the function in the
+    browser before checking :py:attr:`loaded`, passing :py:attr:`root` as the
+    first argument. The function is evaluated whenever the document changes,
+    so the wait ends as soon as the region has loaded rather than at the next
+    poll. Drivers that can not run scripts only check :py:attr:`loaded`.
+
+    Example::
+
+        _loaded_script = "return arguments[0].classList.contains('loaded');"
+
+    """
+
+    _loaded_conditions = None
+    """Conditions that are met when the region has loaded.
+
+    A sequence of conditions from :py:mod:`pypom.conditions`, with locators
+    relative to :py:attr:`root`. :py:func:`wait_for_region_to_load` waits for
+    all of them to be met before checking :py:attr:`loaded`, using a single
+    script evaluated in the browser in the same way as
+    :py:attr:`_loaded_script`. Conditions that can not be checked by a
+    script are checked one at a time on every poll.
+    """
+
+    _fields = None
+    """Fields read by :py:func:`record`, :py:func:`records`, and
+    :py:func:`~pypom.page.Page.find_records`.
+
+    A sequence of ``(name, locator, field)`` tuples, where ``locator`` is a
+    tuple of strategy and locator relative to the root element, or ``None``
+    to read the root element itself. Only the first element located is read.
+    See :py:func:`~pypom.page.Page.extract` for valid values of ``field``.
+    """
+
+    # set on regions created by from_elements before they are initialised,
+    # as the regions are waited for together
+    _wait_deferred = False
+
+    def __init__(self, page, root=None, wait=True):
         super(Region, self).__init__(page.driver, page.timeout, pm=page.pm)
         self._root = root
+        self._cached_root = None
+        self._wait_pending = False
         self.page = page
-        self.wait_for_region_to_load()
+        if self._wait_deferred:
+            self._wait_deferred = False
+        elif wait:
+            if self._lazy:
+                self._wait_pending = True
+            else:
+                self.wait_for_region_to_load()
+
+    @classmethod
+    def from_elements(cls, page, elements):
+        """Creates a page region for each of a list of root elements.
+
+        Rather than waiting for each region to load in turn, the regions are
+        waited for together using :py:func:`wait_for_regions_to_load`, unless
+        they are :py:attr:`_lazy` or override :py:func:`wait_for_region_to_load`.
+
+        :param page: Page object the regions appear in.
+        :param elements: Root elements of the regions.
+        :type page: :py:class:`~.page.Page`
+        :type elements: list
+        :return: List of page regions.
+        :rtype: list
+
+        Usage::
+
+          from pypom import Page, Region
+          from selenium.webdriver.common.by import By
+
+          class Results(Page):
+              _result_locator = (By.CLASS_NAME, 'result')
+
+              @property
+              def results(self):
+                  elements = self.find_elements(*self._result_locator)
+                  return self.Result.from_elements(self, elements)
+
+              class Result(Region):
+                  pass
+
+        """
+        if cls._lazy or cls.wait_for_region_to_load != Region.wait_for_region_to_load:
+            # respect lazy and custom waits
+            return [cls(page, root=element) for element in elements]
+        regions = []
+        for element in elements:
+            region = cls.__new__(cls)
+            region._wait_deferred = True
+            region.__init__(page, root=element)
+            regions.append(region)
+        return cls.wait_for_regions_to_load(regions)
+
+    @staticmethod
+    def wait_for_regions_to_load(regions):
+        """Wait for a list of page regions to load.
+
+        The :py:attr:`loaded` state of each region is checked in a single wait
+        using the timeout of the first region, and is not checked again once a
+        region has loaded.
+
+        :param regions: Page regions to wait for.
+        :type regions: list
+        :return: The page regions.
+        :rtype: list
+
+        """
+        regions = list(regions)
+        if not regions:
+            return regions
+        pending = deque((region, region._wait_in_browser()) for region in regions)
+
+        def loaded(_):
+            while pending:
+                region, conditions = pending[0]
+                if not (region._conditions_met(conditions) and region.loaded):
+                    return False
+                pending.popleft()
+            return True
+
+        regions[0].wait.until(loaded)
+        for region in regions:
+            region.pm.hook.pypom_after_wait_for_region_to_load(region=region)
+        regions[0].pm.hook.pypom_after_wait_for_regions_to_load(regions=regions)
+        return regions
+
+    def record(self):
+        """Reads the fields of the page region using a single command.
+
+        :return: Named tuple of the values of :py:attr:`_fields`, with
+            ``None`` for elements that were not found.
+        :rtype: tuple
+
+        Usage::
+
+          from pypom import Page, Region
+          from selenium.webdriver.common.by import By
+
+          class Results(Page):
+              _result_locator = (By.CLASS_NAME, 'result')
+
+              @property
+              def results(self):
+                  return self.find_records(self.Result, *self._result_locator)
+
+              class Result(Region):
+                  _fields = (
+                      ('name', (By.CLASS_NAME, 'name'), 'text'),
+                      ('link', (By.TAG_NAME, 'a'), 'property:href'),
+                  )
+
+        """
+        return self.records([self])[0]
+
+    @classmethod
+    def records(cls, regions):
+        """Reads the fields of a list of page regions using a single command.
+
+        :param regions: Page regions to read.
+        :type regions: list
+        :return: List of named tuples of the values of :py:attr:`_fields`.
+        :rtype: list
+
+        """
+        regions = list(regions)
+        if not regions:
+            return []
+        extract = regions[0]._extractor("extract_records")
+        rows = extract([region.root for region in regions], cls._record_fields())
+        return cls._make_records(rows)
+
+    @classmethod
+    def _record_fields(cls):
+        if not cls._fields:
+            raise UsageError("{} does not declare _fields".format(cls.__name__))
+        return [(locator or (None, None)) + (field,) for _, locator, field in cls._fields]
+
+    @classmethod
+    def _make_records(cls, rows):
+        record_class = cls.__dict__.get("_record_class")
+        if record_class is None:
+            names = [name for name, _, _ in cls._fields]
+            record_class = namedtuple(cls.__name__ + "Record", names)
+            cls._record_class = record_class
+        return [record_class(*row) for row in rows]
 
     @property
     def root(self):
@@ -80,15 +305,80 @@ class Region(WebView):
         instantiation or by defining a :py:attr:`_root_locator` attribute. To
         reduce the chances of hitting :py:class:`~selenium.common.exceptions.StaleElementReferenceException`
         or similar you should use :py:attr:`_root_locator`, as this is looked up every
-        time the :py:attr:`root` property is accessed.
+        time the :py:attr:`root` property is accessed, unless :py:attr:`_cache_root`
+        is set.
         """
+        self._wait_if_pending()
         if self._root is None and self._root_locator is not None:
-            return self.page.find_element(*self._root_locator)
+            if not self._cache_root:
+                return self.page.find_element(*self._root_locator)
+            if self._cached_root is None:
+                self._cached_root = self.page.find_element(*self._root_locator)
+            return self._cached_root
         return self._root
 
+    def _wait_in_browser(self):
+        if self._loaded_script is None and not self._loaded_conditions:
+            return ()
+        root = self._root
+        if root is None and self._root_locator is not None:
+            # the root element may appear after the region is created
+            root = self.wait.until(lambda _: self.root)
+        return self._wait_for_loaded_script(root)
+
+    def _wait_if_pending(self):
+        if self._wait_pending:
+            # cleared first, as the loaded state is likely to use the region
+            self._wait_pending = False
+            try:
+                self.wait_for_region_to_load()
+            except Exception:
+                self._wait_pending = True
+                raise
+
+    def _compose(self, strategy, locator):
+        if not self._compose_locators or self._root is not None:
+            return None
+        if type(self).root is not Region.root:
+            # the root element is not necessarily located by _root_locator
+            return None
+        if self._root_locator is None or self._cached_root is not None:
+            return None
+        compose = getattr(self.driver_adapter, "compose_locator", None)
+        if compose is None:
+            return None
+        return compose(self._root_locator, (strategy, locator))
+
+    def _check_root(self, found):
+        if not found:
+            # nothing was found using a composed locator, so locate the root
+            # element, which raises if it is missing in the same way as
+            # locating it before the elements within it
+            self.page.find_element(*self._root_locator)
+        return found
+
+    def _call_with_root(self, method, *args):
+        root = self.root
+        cached = root is not None and root is self._cached_root
+        try:
+            result = method(*args, root=root)
+            if cached and not result:
+                # some drivers find nothing within a stale element
+                check = getattr(self.driver_adapter, "check_stale", None)
+                if check is not None:
+                    check(root)
+            return result
+        except getattr(self.driver_adapter, "stale_exceptions", ()):
+            if not cached:
+                raise
+            self._cached_root = None
+            return method(*args, root=self.root)
+
     def wait_for_region_to_load(self):
         """Wait for the page region to load."""
-        self.wait.until(lambda _: self.loaded)
+        self._wait_pending = False
+        conditions = self._wait_in_browser()
+        self.wait.until(lambda _: self._conditions_met(conditions) and self.loaded)
         self.pm.hook.pypom_after_wait_for_region_to_load(region=self)
         return self
 
@@ -103,7 +393,11 @@ class Region(WebView):
         :rytpe: :py:class:`~selenium.webdriver.remote.webelement.WebElement` or :py:class:`~splinter.driver.webdriver.WebDriverElement`
 
         """
-        return self.driver_adapter.find_element(strategy, locator, root=self.root)
+        self._wait_if_pending()
+        composed = self._compose(strategy, locator)
+        if composed is not None:
+            return self.page.find_element(*composed)
+        return self._call_with_root(self.driver_adapter.find_element, strategy, locator)
 
     def find_elements(self, strategy, locator):
         """Finds elements on the page.
@@ -116,7 +410,64 @@ class Region(WebView):
         :rtype: list
 
         """
-        return self.driver_adapter.find_elements(strategy, locator, root=self.root)
+        self._wait_if_pending()
+        composed = self._compose(strategy, locator)
+        if composed is not None:
+            return self._check_root(self.page.find_elements(*composed))
+        return self._call_with_root(
+            self.driver_adapter.find_elements, strategy, locator
+        )
+
+    def extract(self, strategy, locator, fields):
+        """Finds elements within the page region and reads data from them.
+
+        All values are read using a single command, rather than one command
+        for each field of each element.
+
+        :param strategy: Location strategy to use. See :py:class:`~selenium.webdriver.common.by.By` or :py:attr:`~pypom.splinter_driver.ALLOWED_STRATEGIES`.
+        :param locator: Location of target elements.
+        :param fields: Fields to read from each element. See :py:func:`~pypom.page.Page.extract`.
+        :type strategy: str
+        :type locator: str
+        :type fields: list
+        :return: List with a dictionary of values by field for each element.
+        :rtype: list
+
+        """
+        self._wait_if_pending()
+        composed = self._compose(strategy, locator)
+        if composed is not None:
+            return self._check_root(
+                self.page.extract(composed[0], composed[1], fields)
+            )
+        return self._call_with_root(
+            self._extractor("extract"), strategy, locator, fields
+        )
+
+    def find_records(self, region_class, strategy, locator):
+        """Finds page regions within the page region and reads their fields.
+
+        :param region_class: Page region class declaring the fields.
+        :param strategy: Location strategy to use. See :py:class:`~selenium.webdriver.common.by.By` or :py:attr:`~pypom.splinter_driver.ALLOWED_STRATEGIES`.
+        :param locator: Location of the root elements of the regions.
+        :type region_class: :py:class:`~pypom.region.Region` subclass
+        :type strategy: str
+        :type locator: str
+        :return: List of records.
+        :rtype: list
+
+        """
+        self._wait_if_pending()
+        composed = self._compose(strategy, locator)
+        if composed is not None:
+            return self._check_root(
+                self.page.find_records(region_class, *composed)
+            )
+        fields = region_class._record_fields()
+        rows = self._call_with_root(
+            self._extractor("find_records"), strategy, locator, fields
+        )
+        return region_class._make_records(rows)
 
     def is_element_present(self, strategy, locator):
         """Checks whether an element is present.
@@ -129,7 +480,10 @@ class Region(WebView):
         :rtype: bool
 
         """
-        return self.driver_adapter.is_element_present(strategy, locator, root=self.root)
+        self._wait_if_pending()
+        return self._call_with_root(
+            self.driver_adapter.is_element_present, strategy, locator
+        )
 
     def is_element_displayed(self, strategy, locator):
         """Checks whether an element is displayed.
@@ -142,8 +496,9 @@ class Region(WebView):
         :rtype: bool
 
         """
-        return self.driver_adapter.is_element_displayed(
-            strategy, locator, root=self.root
+        self._wait_if_pending()
+        return self._call_with_root(
+            self.driver_adapter.is_element_displayed, strategy, locator
         )
 
     @property
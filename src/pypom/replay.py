@@ -0,0 +1,591 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Recording the use of a driver, and replaying it without a browser.
+
+A :py:class:`Recorder` wraps a driver of any type with a registered adapter,
+and writes the calls page objects make to the driver adapter, and the reads
+and calls of the elements it returns, to a log. A :py:class:`Replay` of the
+log serves the same results without a browser, so a test can be re-run
+deterministically and in milliseconds, such as to debug a failure seen in
+continuous integration::
+
+  from pypom.replay import Recorder, Replay
+
+  with Recorder(driver, 'search.log.gz') as recorder:
+      Home(recorder.driver, base_url).open().search('firefox')
+
+  # later, without a browser
+  replay = Replay('search.log.gz')
+  Home(replay.driver, base_url).open().search('firefox')
+
+The log has a line of JSON for each call or read, holding the object used,
+the name and arguments, and the result or the exception raised. Objects are
+the driver, its adapter, or a number identifying an element or other object
+returned, which is the same each time the same element is returned. Logs
+with paths ending in ``.gz`` are compressed.
+"""
+
+import base64
+import gzip
+import importlib
+import io
+import json
+import sys
+from collections import deque
+from contextlib import contextmanager
+
+from selenium.common.exceptions import WebDriverException
+from zope.interface import Interface, implementer
+
+from .driver import adaptDriver, registerDriver
+from .exception import ReplayError
+from .interfaces import IDriver
+from .polling import FixedInterval
+from .selenium_driver import PollingWait, _FreshWait
+
+if sys.version_info >= (3,):
+    _SCALARS = (type(None), bool, int, float, str)
+    _BYTES = bytes
+    _text = str
+else:
+    _SCALARS = (type(None), bool, int, long, float, str, unicode)  # noqa: F821
+    _BYTES = ()
+    _text = unicode  # noqa: F821
+
+# version of the format of logs
+_FORMAT = 1
+
+# targets of the driver and its adapter; elements are numbered
+_DRIVER = "d"
+_ADAPTER = "a"
+
+# adapter methods returning context managers, which are not recorded
+_CONTEXT_MANAGERS = frozenset(["implicit_wait_suspended", "snapshot"])
+
+# modules of the exceptions raised again when replaying
+_EXCEPTION_MODULES = frozenset(
+    [
+        "builtins",
+        "exceptions",
+        "pypom.exception",
+        "selenium.common.exceptions",
+        "splinter.exceptions",
+    ]
+)
+
+
+class IRecorded(Interface):
+    """ Marker interface for drivers of a recorder"""
+
+
+class IReplayed(Interface):
+    """ Marker interface for drivers of a replay"""
+
+
+def _open(path, mode):
+    if path.endswith(".gz"):
+        return io.TextIOWrapper(gzip.open(path, mode + "b"), encoding="utf-8")
+    return io.open(path, mode, encoding="utf-8")
+
+
+def _encode(value):
+    # JSON for a value; recorded and replayed objects are replaced by their
+    # number, and other objects passed as arguments by their representation
+    if isinstance(value, _SCALARS):
+        return value
+    if isinstance(value, _BYTES):
+        return {"~b": base64.b64encode(value).decode("ascii")}
+    if isinstance(value, (RecordedObject, ReplayedObject)):
+        return {"~e": value._target}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    if isinstance(value, dict):
+        return dict((key, _encode(item)) for key, item in value.items())
+    return {"~r": repr(value)}
+
+
+def _dumps(value):
+    return _text(json.dumps(value, sort_keys=True, separators=(",", ":")))
+
+
+def _key(target, name, args, kwargs):
+    # outcomes are looked up by object, name and arguments; reads have none
+    if args is None:
+        return target, name, None
+    return target, name, _dumps([args, kwargs or {}])
+
+
+def _describe(exc):
+    cls = type(exc)
+    if isinstance(exc, WebDriverException):
+        message = exc.msg
+    elif len(exc.args) == 1 and isinstance(exc.args[0], _SCALARS):
+        message = exc.args[0]
+    else:
+        message = str(exc)
+    return [cls.__module__, cls.__name__, message]
+
+
+def _exception_class(module, name):
+    if module not in _EXCEPTION_MODULES:
+        return None
+    try:
+        cls = getattr(importlib.import_module(module), name, None)
+    except ImportError:
+        return None
+    if isinstance(cls, type) and issubclass(cls, BaseException):
+        return cls
+    return None
+
+
+def _exception(description):
+    module, name, message = description
+    cls = _exception_class(module, name)
+    if cls is not None:
+        try:
+            return cls(message)
+        except Exception:
+            pass
+    return ReplayError("{}.{} was raised: {}".format(module, name, message))
+
+
+def _features(adapter):
+    # methods of an adapter, which are available when replaying
+    names = []
+    for name in dir(adapter):
+        if not name.startswith("_") and callable(getattr(adapter, name, None)):
+            names.append(name)
+    return names
+
+
+@contextmanager
+def _replayed_context():
+    yield
+
+
+class Recorder(object):
+    """Records the use of a driver to a log.
+
+    Pass :py:attr:`driver` to page objects in place of the driver. Calls made
+    to its adapter, and reads and calls of the public attributes of the
+    driver and of the elements returned, are written to the log.
+
+    :param driver: Driver to record, of any type with a registered adapter.
+    :param path: Path of the log to write. Logs with paths ending in ``.gz``
+        are compressed.
+    :type path: str
+
+    Usage::
+
+      with Recorder(driver, 'search.log') as recorder:
+          page = Home(recorder.driver, base_url).open()
+
+    """
+
+    def __init__(self, driver, path):
+        self.path = path
+        self.adapter = adaptDriver(driver)
+        self.driver = RecordedDriver(self, driver, _DRIVER)
+        self._numbers = {}
+        self._objects = {}
+        self._file = _open(path, "w")
+        cls = type(self.adapter)
+        self._write(
+            {
+                "format": _FORMAT,
+                "adapter": "{}.{}".format(cls.__module__, cls.__name__),
+                "features": _features(self.adapter),
+                "stale": [
+                    [exc.__module__, exc.__name__]
+                    for exc in getattr(self.adapter, "stale_exceptions", ())
+                ],
+            }
+        )
+
+    def __repr__(self):
+        return "<Recorder {}>".format(self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Finishes writing the log."""
+        self._file.close()
+
+    def _write(self, entry):
+        self._file.write(_dumps(entry) + "\n")
+
+    def _read(self, target, obj, name):
+        entry = {"t": target, "n": name}
+        try:
+            value = getattr(obj, name)
+        except Exception as exc:
+            entry["x"] = _describe(exc)
+            self._write(entry)
+            raise
+        if callable(value) and not isinstance(value, type):
+            return self._method(target, name, value)
+        value = self._wrap(value)
+        entry["r"] = _encode(value)
+        self._write(entry)
+        return value
+
+    def _method(self, target, name, method):
+        def call(*args, **kwargs):
+            return self._call(target, name, method, args, kwargs)
+
+        return call
+
+    def _call(self, target, name, method, args, kwargs):
+        entry = {"t": target, "n": name, "a": _encode(args)}
+        if kwargs:
+            entry["k"] = _encode(kwargs)
+        try:
+            result = method(*self._unwrap(args), **self._unwrap(kwargs))
+        except Exception as exc:
+            entry["x"] = _describe(exc)
+            self._write(entry)
+            raise
+        result = self._wrap(result)
+        entry["r"] = _encode(result)
+        self._write(entry)
+        return result
+
+    def _wrap(self, value):
+        # records objects returned, keeping lists, tuples and dictionaries
+        if isinstance(value, _SCALARS + (RecordedObject,)) or isinstance(
+            value, _BYTES
+        ):
+            return value
+        if isinstance(value, (list, tuple)):
+            items = [self._wrap(item) for item in value]
+            if type(value) is list:
+                return items
+            if type(value) is tuple:
+                return tuple(items)
+            try:
+                # such as the element lists of Splinter
+                return type(value)(items)
+            except Exception:
+                return items
+        if isinstance(value, dict):
+            return dict((key, self._wrap(item)) for key, item in value.items())
+        return self._object(value)
+
+    def _unwrap(self, value):
+        if isinstance(value, RecordedObject):
+            return value._object
+        if type(value) in (list, tuple):
+            return type(value)(self._unwrap(item) for item in value)
+        if type(value) is dict:
+            return dict((key, self._unwrap(item)) for key, item in value.items())
+        return value
+
+    def _object(self, obj):
+        # the same element is given the same number each time it is returned
+        try:
+            number = self._numbers.get(obj)
+        except TypeError:
+            number = None
+        if number is None:
+            number = len(self._objects) + 1
+            try:
+                self._numbers[obj] = number
+            except TypeError:
+                pass  # the object can not be told apart from others
+            self._objects[number] = RecordedObject(self, obj, number)
+        return self._objects[number]
+
+
+class RecordedObject(object):
+    """An element or other object used through a :py:class:`Recorder`.
+
+    Reads of its public attributes and calls of its methods are written to
+    the log, and the objects they return are recorded in turn.
+    """
+
+    def __init__(self, recorder, obj, target):
+        self._recorder = recorder
+        self._object = obj
+        self._target = target
+
+    def __repr__(self):
+        return "<Recorded {!r}>".format(self._object)
+
+    def __eq__(self, other):
+        if not isinstance(other, RecordedObject):
+            return False
+        return other._recorder is self._recorder and other._target == self._target
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self._target)
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self._recorder._read(self._target, self._object, name)
+
+    def __getitem__(self, key):
+        return self._recorder._call(
+            self._target, "__getitem__", self._object.__getitem__, (key,), {}
+        )
+
+
+class RecordedDriver(RecordedObject):
+    """Driver of a :py:class:`Recorder`."""
+
+
+@implementer(IDriver)
+class Recording(RecordedObject):
+    """Driver adapter for :py:class:`RecordedDriver`.
+
+    Calls are passed on to the adapter of the recorded driver, and written to
+    the log. The calls made within context managers returned by the adapter
+    are recorded, but the context managers themselves are not.
+    """
+
+    def __init__(self, driver):
+        recorder = driver._recorder
+        super(Recording, self).__init__(recorder, recorder.adapter, _ADAPTER)
+        self.driver = driver
+        self._waits = {}
+
+    @property
+    def stale_exceptions(self):
+        return self._object.stale_exceptions
+
+    def wait_factory(self, timeout, polling=None):
+        """Returns a WebDriverWait like property for a given timeout.
+
+        Conditions are passed the recorded driver.
+
+        :param timeout: Timeout used by WebDriverWait calls
+        :param polling: (optional) Polling policy deciding how long to sleep
+            between checks. Defaults to the poll frequency of WebDriverWait.
+        :type timeout: int
+        :type polling: :py:class:`~pypom.polling.PollingPolicy`
+        """
+        key = timeout if polling is None else (timeout, polling)
+        wait = self._waits.get(key)
+        if wait is None:
+            if polling is None:
+                wait = _FreshWait(self.driver, timeout)
+            else:
+                wait = PollingWait(self.driver, timeout, polling)
+            if hasattr(self._object, "invalidate_snapshot"):
+                wait.adapter = self
+            self._waits[key] = wait
+        return wait
+
+    def __getattr__(self, name):
+        if name in _CONTEXT_MANAGERS:
+            return getattr(self._object, name)
+        return super(Recording, self).__getattr__(name)
+
+
+class Replay(object):
+    """Replays a log written by a :py:class:`Recorder`.
+
+    Pass :py:attr:`driver` to page objects in place of the recorded driver.
+    Calls and reads are matched to the log on the object, the name and the
+    arguments, and their results are served in the order they were recorded.
+    The last result is served again for as long as it is asked for, so waits
+    may check more or fewer times than when recording. Waits do not sleep
+    between checks.
+
+    :param path: Path of the log.
+    :type path: str
+    :raises: :py:class:`~pypom.exception.ReplayError` if the file is not a
+        log of a supported format.
+
+    Usage::
+
+      replay = Replay('search.log')
+      page = Home(replay.driver, base_url).open()
+
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._outcomes = {}
+        self._names = {}
+        self._objects = {}
+        with _open(path, "r") as log:
+            try:
+                header = json.loads(log.readline())
+            except ValueError:
+                header = None
+            if not isinstance(header, dict) or header.get("format") != _FORMAT:
+                raise ReplayError("Not a log of a supported format: {}".format(path))
+            for line in log:
+                self._add(json.loads(line))
+        self.adapter_name = header["adapter"]
+        self.features = frozenset(header["features"])
+        self.stale_exceptions = tuple(
+            cls
+            for cls in (_exception_class(*name) for name in header["stale"])
+            if cls is not None
+        )
+        self.driver = ReplayedDriver(self, _DRIVER)
+
+    def __repr__(self):
+        return "<Replay {}>".format(self.path)
+
+    def _add(self, entry):
+        target, name = entry["t"], entry["n"]
+        key = _key(target, name, entry.get("a"), entry.get("k"))
+        outcome = ("x", entry["x"]) if "x" in entry else ("r", entry["r"])
+        self._outcomes.setdefault(key, deque()).append(outcome)
+        self._names.setdefault(target, {}).setdefault(name, set()).add(
+            "a" in entry
+        )
+
+    def _attribute(self, target, name):
+        calls = self._names.get(target, {}).get(name, ())
+        if False in calls:
+            return self._serve(target, name)
+        if True in calls or (target == _ADAPTER and name in self.features):
+            return self._method(target, name)
+        if target == _ADAPTER:
+            raise AttributeError(name)
+        raise ReplayError("Not recorded: {} of {}".format(name, _name(target)))
+
+    def _method(self, target, name):
+        def call(*args, **kwargs):
+            return self._serve(target, name, _encode(args), _encode(kwargs))
+
+        return call
+
+    def _serve(self, target, name, args=None, kwargs=None):
+        outcomes = self._outcomes.get(_key(target, name, args, kwargs))
+        if not outcomes:
+            raise ReplayError(
+                "Not recorded: {} of {} called with {}".format(
+                    name, _name(target), _dumps([args, kwargs or {}])
+                )
+            )
+        kind, value = outcomes[0] if len(outcomes) == 1 else outcomes.popleft()
+        if kind == "x":
+            raise _exception(value)
+        return self._decode(value)
+
+    def _decode(self, value):
+        if isinstance(value, list):
+            return [self._decode(item) for item in value]
+        if isinstance(value, dict):
+            if "~e" in value:
+                return self._object(value["~e"])
+            if "~b" in value:
+                return base64.b64decode(value["~b"])
+            return dict((key, self._decode(item)) for key, item in value.items())
+        return value
+
+    def _object(self, number):
+        obj = self._objects.get(number)
+        if obj is None:
+            obj = self._objects[number] = ReplayedObject(self, number)
+        return obj
+
+
+def _name(target):
+    if target == _DRIVER:
+        return "the driver"
+    if target == _ADAPTER:
+        return "the driver adapter"
+    return "object {}".format(target)
+
+
+class ReplayedObject(object):
+    """An element or other object of a :py:class:`Replay`.
+
+    Its public attributes and the results of its methods are read from the
+    log.
+    """
+
+    def __init__(self, replay, target):
+        self._replay = replay
+        self._target = target
+
+    def __repr__(self):
+        return "<Replayed {}>".format(_name(self._target))
+
+    def __eq__(self, other):
+        if not isinstance(other, ReplayedObject):
+            return False
+        return other._replay is self._replay and other._target == self._target
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self._target)
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self._replay._attribute(self._target, name)
+
+    def __getitem__(self, key):
+        return self._replay._serve(self._target, "__getitem__", _encode((key,)))
+
+
+class ReplayedDriver(ReplayedObject):
+    """Driver of a :py:class:`Replay`."""
+
+
+@implementer(IDriver)
+class Replaying(ReplayedObject):
+    """Driver adapter for :py:class:`ReplayedDriver`.
+
+    Methods are available if the recorded adapter had them, and context
+    managers returned by them do nothing.
+    """
+
+    def __init__(self, driver):
+        super(Replaying, self).__init__(driver._replay, _ADAPTER)
+        self.driver = driver
+        self.stale_exceptions = self._replay.stale_exceptions
+        self._waits = {}
+
+    def wait_factory(self, timeout, polling=None):
+        """Returns a WebDriverWait like property for a given timeout.
+
+        Results were waited for when recording, so checks are not delayed.
+
+        :param timeout: Timeout used by WebDriverWait calls
+        :param polling: (optional) Ignored.
+        :type timeout: int
+        """
+        wait = self._waits.get(timeout)
+        if wait is None:
+            wait = PollingWait(self.driver, timeout, FixedInterval(0))
+            if "invalidate_snapshot" in self._replay.features:
+                wait.adapter = self
+            self._waits[timeout] = wait
+        return wait
+
+    def __getattr__(self, name):
+        if name in _CONTEXT_MANAGERS and name in self._replay.features:
+            return _replayed_context
+        return super(Replaying, self).__getattr__(name)
+
+
+def register():
+    """ Register the recording and replaying driver implementations.
+
+        This register call is performed when this module is imported, as
+        recorded and replayed drivers can only be created after importing it.
+    """
+    registerDriver(IRecorded, Recording, class_implements=[RecordedDriver])
+    registerDriver(IReplayed, Replaying, class_implements=[ReplayedDriver])
+
+
+register()
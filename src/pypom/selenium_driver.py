@@ -2,8 +2,20 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
+import json
+import sys
+import time
+import uuid
+from contextlib import contextmanager
 
-from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import (
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    UnknownMethodException,
+    WebDriverException,
+)
 from selenium.webdriver import (
     Android,
     BlackBerry,
@@ -16,13 +28,350 @@ from selenium.webdriver import (
     Remote,
     Safari,
 )
+from selenium.webdriver.common.by import By
 from selenium.webdriver.support.events import EventFiringWebDriver
 from selenium.webdriver.support.ui import WebDriverWait
 from zope.interface import Interface, implementer
 
+from . import locators
 from .driver import registerDriver
+from .exception import UsageError
 from .interfaces import IDriver
 
+if sys.version_info >= (3,):
+    from urllib.parse import urlsplit
+else:
+    from urlparse import urlsplit
+
+FIELDS = ("text", "displayed", "tag_name", "attribute", "property")
+
+# approximates WebElement.is_displayed in the browser
+_DISPLAYED_FUNCTION = """
+function displayed(element) {
+  if (!element.getClientRects().length) {
+    return false;
+  }
+  for (var node = element; node && node.nodeType === 1; node = node.parentNode) {
+    var style = window.getComputedStyle(node);
+    if (style.visibility === 'hidden' || style.visibility === 'collapse' ||
+        style.opacity === '0') {
+      return false;
+    }
+  }
+  return true;
+}
+"""
+
+# reads fields of elements in the browser, see Selenium.extract_elements
+_EXTRACT_FUNCTIONS = _DISPLAYED_FUNCTION + """
+function locate(root, kind, value) {
+  if (kind === 'css') {
+    return (root || document).querySelectorAll(value);
+  }
+  var elements = [];
+  var result = document.evaluate(
+    value, root || document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+  for (var i = 0; i < result.snapshotLength; i++) {
+    elements.push(result.snapshotItem(i));
+  }
+  return elements;
+}
+function read(element, field) {
+  switch (field[0]) {
+    case 'text':
+      var text = typeof element.innerText === 'string' ?
+        element.innerText : element.textContent;
+      return text.trim();
+    case 'displayed':
+      return displayed(element);
+    case 'tag_name':
+      return element.tagName.toLowerCase();
+    case 'attribute':
+      return element.getAttribute(field[1]);
+    case 'property':
+      var value = element[field[1]];
+      return value === undefined ? null : value;
+  }
+}
+function extract(elements, fields) {
+  var results = [];
+  for (var i = 0; i < elements.length; i++) {
+    var values = [];
+    for (var j = 0; j < fields.length; j++) {
+      values.push(read(elements[i], fields[j]));
+    }
+    results.push(values);
+  }
+  return results;
+}
+function records(roots, fields) {
+  var results = [];
+  for (var i = 0; i < roots.length; i++) {
+    var values = [];
+    for (var j = 0; j < fields.length; j++) {
+      var field = fields[j], element = roots[i];
+      if (field[0]) {
+        element = locate(element, field[0], field[1])[0];
+      }
+      values.push(element ? read(element, field[2]) : null);
+    }
+    results.push(values);
+  }
+  return results;
+}
+"""
+
+_EXTRACT_SCRIPT = _EXTRACT_FUNCTIONS + "return extract(arguments[0], arguments[1]);"
+
+_LOCATE_AND_EXTRACT_SCRIPT = _EXTRACT_FUNCTIONS + (
+    "return extract(locate(arguments[0], arguments[1], arguments[2]), arguments[3]);"
+)
+
+_RECORDS_SCRIPT = _EXTRACT_FUNCTIONS + "return records(arguments[0], arguments[1]);"
+
+_LOCATE_AND_RECORDS_SCRIPT = _EXTRACT_FUNCTIONS + (
+    "return records(locate(arguments[0], arguments[1], arguments[2]), arguments[3]);"
+)
+
+# helpers for compiled loaded conditions, see pypom.conditions
+_CONDITION_FUNCTIONS = _DISPLAYED_FUNCTION + """
+var root = arguments[0] || document;
+function first(kind, value) {
+  if (kind === 'css') {
+    return root.querySelector(value);
+  }
+  return document.evaluate(
+    value, root, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+}
+"""
+
+# waits for a condition in the browser, re-evaluating it when the document
+# changes rather than at an interval, see Selenium.wait_for_script
+_WAIT_SCRIPT = """
+var args = arguments[0], timeout = arguments[1];
+var done = arguments[arguments.length - 1];
+function condition() {
+%s
+}
+function check() {
+  try {
+    return !!condition.apply(null, args);
+  } catch (e) {
+    return false;
+  }
+}
+if (check()) {
+  done(true);
+  return;
+}
+var finished = false, observer, timer;
+function changed() {
+  if (check()) {
+    finish(true);
+  }
+}
+function finish(result) {
+  if (!finished) {
+    finished = true;
+    observer.disconnect();
+    clearTimeout(timer);
+    document.removeEventListener('readystatechange', changed);
+    done(result);
+  }
+}
+observer = new MutationObserver(changed);
+observer.observe(document, {
+  attributes: true, characterData: true, childList: true, subtree: true
+});
+document.addEventListener('readystatechange', changed);
+timer = setTimeout(function() { finish(check()); }, timeout);
+"""
+
+
+# checks a condition once, for drivers that can not run asynchronous scripts
+_CHECK_SCRIPT = """
+var args = arguments[0];
+function condition() {
+%s
+}
+try {
+  return !!condition.apply(null, args);
+} catch (e) {
+  return false;
+}
+"""
+
+
+def _interrupted(exc):
+    # whether waiting in the browser was interrupted by navigation, which
+    # unloads the document or replaces the elements passed to the script, or
+    # outlasted the script timeout of the driver
+    message = (exc.msg or "").lower()
+    if isinstance(exc, JavascriptException):
+        return "unloaded" in message
+    if type(exc) is WebDriverException:
+        # reported as an unknown error by chromedriver
+        return "loading status" in message
+    return isinstance(exc, (StaleElementReferenceException, TimeoutException))
+
+
+def _unsupported(exc):
+    # whether a command is not implemented by the driver, rather than failing
+    # once, such as during navigation
+    if isinstance(exc, UnknownMethodException):
+        return True
+    return type(exc) is WebDriverException and "unsupported operation" in (
+        exc.msg or ""
+    ).lower()
+
+
+# reads the local and session storage of the current origin
+_STORAGE_SCRIPT = """
+function dump(name) {
+  var items = {};
+  try {
+    var storage = window[name];
+    for (var i = 0; i < storage.length; i++) {
+      var key = storage.key(i);
+      items[key] = storage.getItem(key);
+    }
+  } catch (e) {
+    // storage is not available for this document
+  }
+  return items;
+}
+return {
+  origin: window.location.origin,
+  local_storage: dump('localStorage'),
+  session_storage: dump('sessionStorage')
+};
+"""
+
+# replaces the local and session storage of the current origin
+_RESTORE_STORAGE_SCRIPT = """
+var state = arguments[0];
+function load(name, items) {
+  var storage = window[name];
+  storage.clear();
+  for (var key in items) {
+    storage.setItem(key, items[key]);
+  }
+}
+load('localStorage', state.local_storage);
+load('sessionStorage', state.session_storage);
+"""
+
+
+# marks the current document, so that a new document can be told apart
+_MARK_DOCUMENT_SCRIPT = """
+document.pypomDocument = arguments[0];
+return window.location.href;
+"""
+
+# condition of a wait for the document or URL to change; a new document is
+# only used once it has been parsed, as elements may still be missing before
+_NEW_DOCUMENT_CONDITION = """
+if (document.pypomDocument !== arguments[0]) {
+  return document.readyState !== 'loading';
+}
+return window.location.href !== arguments[1];
+"""
+
+
+def _parse_fields(fields):
+    parsed = []
+    for field in fields:
+        kind, _, name = field.partition(":")
+        if kind not in FIELDS or bool(name) != (kind in ("attribute", "property")):
+            raise UsageError("Field not allowed: {}".format(field))
+        parsed.append([kind, name])
+    return parsed
+
+
+class _FreshWait(WebDriverWait):
+    # a WebDriverWait discarding the snapshot of an adapter before checking
+    # again, so that checks within Selenium.snapshot() see the page change;
+    # the first check uses the snapshot, which is discarded on interactions
+    adapter = None
+
+    def until(self, method, message=""):
+        return super(_FreshWait, self).until(self._fresh(method), message)
+
+    def until_not(self, method, message=""):
+        return super(_FreshWait, self).until_not(self._fresh(method), message)
+
+    def _fresh(self, method):
+        adapter = self.adapter
+        if adapter is None:
+            return method
+
+        checked = []
+
+        def check(driver):
+            if checked:
+                adapter.invalidate_snapshot()
+            checked.append(True)
+            return method(driver)
+
+        return check
+
+
+class PollingWait(_FreshWait):
+    """A WebDriverWait sleeping between checks according to a polling policy.
+
+    :param driver: Driver passed to the conditions.
+    :param timeout: Time in seconds to wait for.
+    :param polling: Polling policy.
+    :param ignored_exceptions: (optional) Exceptions to ignore during checks.
+    :type timeout: int
+    :type polling: :py:class:`~pypom.polling.PollingPolicy`
+    """
+
+    def __init__(self, driver, timeout, polling, ignored_exceptions=None):
+        super(PollingWait, self).__init__(
+            driver, timeout, ignored_exceptions=ignored_exceptions
+        )
+        self.polling = polling
+
+    def until(self, method, message=""):
+        method = self._fresh(method)
+        screen = stacktrace = None
+        start = time.time()
+        intervals = self.polling.intervals()
+        while True:
+            try:
+                value = method(self._driver)
+                if value:
+                    self.polling.record(time.time() - start)
+                    return value
+            except self._ignored_exceptions as exc:
+                screen = getattr(exc, "screen", None)
+                stacktrace = getattr(exc, "stacktrace", None)
+            if not self._sleep(start, intervals):
+                raise TimeoutException(message, screen, stacktrace)
+
+    def until_not(self, method, message=""):
+        method = self._fresh(method)
+        start = time.time()
+        intervals = self.polling.intervals()
+        while True:
+            try:
+                value = method(self._driver)
+                if not value:
+                    return value
+            except self._ignored_exceptions:
+                return True
+            if not self._sleep(start, intervals):
+                raise TimeoutException(message)
+
+    def _sleep(self, start, intervals):
+        # sleeps until the next check, unless the wait has timed out
+        remaining = start + self._timeout - time.time()
+        if remaining <= 0:
+            return False
+        time.sleep(min(next(intervals), remaining))
+        return True
+
 
 class ISelenium(Interface):
     """ Marker interface for Selenium"""
@@ -30,23 +379,205 @@ class ISelenium(Interface):
 
 @implementer(IDriver)
 class Selenium(object):
+    stale_exceptions = (StaleElementReferenceException,)
+
+    # locating elements within a stale element raises already
+    check_stale = None
+
+    # longest time to wait in the browser using a single command, which must
+    # be shorter than the script timeout of the driver
+    script_wait_slice = 5
+
+    # time to wait before trying again when waiting in the browser fails
+    script_retry_interval = 0.1
+
+    # locator kinds by location strategy, see pypom.locators
+    locator_kinds = {
+        By.CSS_SELECTOR: locators.CSS,
+        By.XPATH: locators.XPATH,
+        By.ID: locators.ID,
+        By.NAME: locators.NAME,
+        By.CLASS_NAME: locators.CLASS_NAME,
+        By.TAG_NAME: locators.TAG_NAME,
+    }
+
     def __init__(self, driver):
         self.driver = driver
+        self._waits = {}
+        self._implicit_wait = None
+        self._suspensions = 0
+        self._snapshot = None
+        self._snapshots = 0
+        self._async_scripts = True
 
-    def wait_factory(self, timeout):
+    def wait_factory(self, timeout, polling=None):
         """Returns a WebDriverWait like property for a given timeout.
 
+        Waits are reused by all page objects and regions sharing this adapter.
+
         :param timeout: Timeout used by WebDriverWait calls
+        :param polling: (optional) Polling policy deciding how long to sleep
+            between checks. Defaults to the poll frequency of WebDriverWait.
         :type timeout: int
+        :type polling: :py:class:`~pypom.polling.PollingPolicy`
         """
-        return WebDriverWait(self.driver, timeout)
+        key = timeout if polling is None else (timeout, polling)
+        wait = self._waits.get(key)
+        if wait is None:
+            if polling is None:
+                wait = _FreshWait(self.driver, timeout)
+            else:
+                wait = PollingWait(self.driver, timeout, polling)
+            wait.adapter = self
+            self._waits[key] = wait
+        return wait
 
     def open(self, url):
         """Open the page.
         Navigates to :py:attr:`url`
         """
+        self.invalidate_snapshot()
         self.driver.get(url)
 
+    def current_url(self):
+        """Returns the URL of the current page.
+
+        :rtype: str
+        """
+        return self.driver.current_url
+
+    def refresh(self):
+        """Reload the current page."""
+        self.invalidate_snapshot()
+        self.driver.refresh()
+
+    def implicitly_wait(self, time_to_wait):
+        """Sets the implicit wait of the driver, and keeps track of it.
+
+        Once the implicit wait has been set using the adapter, checking
+        whether elements are present or displayed no longer waits for the
+        implicit wait to expire when they are not. The implicit wait still
+        applies to locating elements.
+
+        :param time_to_wait: Time in seconds to wait when locating elements.
+        :type time_to_wait: int
+        """
+        if not self._suspensions:
+            self._set_implicit_wait(time_to_wait)
+        self._implicit_wait = time_to_wait
+
+    @contextmanager
+    def implicit_wait_suspended(self):
+        """Suspends the implicit wait set using :py:func:`implicitly_wait`.
+
+        Within the block elements are located without waiting, and the
+        implicit wait is restored on exit. Nested blocks do not send any
+        commands, so wrapping several checks in a block reduces the commands
+        needed to suspend and restore the implicit wait to two.
+
+        Usage::
+
+          with page.driver_adapter.implicit_wait_suspended():
+              assert not page.is_element_present(*locator)
+              assert not page.is_element_displayed(*other_locator)
+
+        """
+        suspend = not self._suspensions and bool(self._implicit_wait)
+        if suspend:
+            self._set_implicit_wait(0)
+        self._suspensions += 1
+        try:
+            yield
+        finally:
+            self._suspensions -= 1
+            if suspend:
+                self._set_implicit_wait(self._implicit_wait)
+
+    def _set_implicit_wait(self, time_to_wait):
+        self.driver.implicitly_wait(time_to_wait)
+
+    @contextmanager
+    def snapshot(self):
+        """Reads the current page from a copy taken using a single command.
+
+        Within the block, finding elements and checking whether they are
+        present or displayed use a :py:class:`~pypom.snapshot.Snapshot` of
+        the page instead of the browser, including within elements found in
+        it. The snapshot is taken when first needed, and taken again after it
+        is invalidated by opening a page, interacting with one of its
+        elements, or before a wait checks again. Nested blocks share the
+        snapshot. Snapshots are parsed by :py:mod:`pypom.dom`, which needs
+        the ``static`` extra.
+
+        Usage::
+
+          with page.driver_adapter.snapshot():
+              rows = page.find_elements(By.CSS_SELECTOR, 'tr')
+              assert [row.text for row in rows] == expected
+
+        """
+        self._snapshots += 1
+        try:
+            yield
+        finally:
+            self._snapshots -= 1
+            if not self._snapshots:
+                self.invalidate_snapshot()
+
+    def invalidate_snapshot(self):
+        """Discards the snapshot taken within :py:func:`snapshot`.
+
+        Call this after changing the page using elements found outside of
+        the block, as only interactions through the adapter and elements found
+        in the snapshot are detected.
+        """
+        if self._snapshot is not None:
+            self._snapshot.invalidate()
+            self._snapshot = None
+
+    def _snapshot_for(self, root):
+        # the snapshot to find elements in, if any
+        if not self._snapshots:
+            return None
+        from .snapshot import Snapshot, SnapshotElement
+
+        if root is not None and not isinstance(root, SnapshotElement):
+            return None
+        if self._snapshot is None:
+            self._snapshot = Snapshot.take(self)
+        return self._snapshot
+
+    def _find_live(self, strategy, locator):
+        # finds an element in the browser within snapshot()
+        snapshots, self._snapshots = self._snapshots, 0
+        try:
+            return self.find_element(strategy, locator)
+        finally:
+            self._snapshots = snapshots
+
+    def compose_locator(self, root_locator, locator):
+        """Combines a root locator and a locator relative to the root.
+
+        :param root_locator: Tuple of strategy and locator of the root element.
+        :param locator: Tuple of strategy and locator of elements within the root.
+        :type root_locator: tuple
+        :type locator: tuple
+        :return: Tuple of strategy and locator finding the same elements with a
+            single command, or ``None`` if the locators can not be combined.
+        :rtype: tuple
+
+        """
+        kinds = self.locator_kinds
+        if root_locator[0] not in kinds or locator[0] not in kinds:
+            return None
+        composed = locators.compose(
+            (kinds[root_locator[0]], root_locator[1]), (kinds[locator[0]], locator[1])
+        )
+        if composed is None:
+            return None
+        kind, value = composed
+        return next(s for s in kinds if kinds[s] == kind), value
+
     def find_element(self, strategy, locator, root=None):
         """Finds an element on the page.
 
@@ -60,6 +591,9 @@ class Selenium(object):
         :rtype: selenium.webdriver.remote.webelement.WebElement
 
         """
+        snapshot = self._snapshot_for(root)
+        if snapshot is not None:
+            return snapshot.find_element(strategy, locator, root=root)
         if root is not None:
             return root.find_element(strategy, locator)
         return self.driver.find_element(strategy, locator)
@@ -77,6 +611,9 @@ class Selenium(object):
         :rtype: list
 
         """
+        snapshot = self._snapshot_for(root)
+        if snapshot is not None:
+            return snapshot.find_elements(strategy, locator, root=root)
         if root is not None:
             return root.find_elements(strategy, locator)
         return self.driver.find_elements(strategy, locator)
@@ -94,6 +631,12 @@ class Selenium(object):
         :rtype: bool
 
         """
+        snapshot = self._snapshot_for(root)
+        if snapshot is not None:
+            return bool(snapshot.find_elements(strategy, locator, root=root))
+        if self._implicit_wait:
+            with self.implicit_wait_suspended():
+                return bool(self.find_elements(strategy, locator, root=root))
         try:
             return self.find_element(strategy, locator, root=root)
         except NoSuchElementException:
@@ -112,11 +655,327 @@ class Selenium(object):
         :rtype: bool
 
         """
+        snapshot = self._snapshot_for(root)
+        if snapshot is not None:
+            elements = snapshot.find_elements(strategy, locator, root=root)
+            return bool(elements) and elements[0].is_displayed()
+        if self._implicit_wait:
+            with self.implicit_wait_suspended():
+                elements = self.find_elements(strategy, locator, root=root)
+                return bool(elements) and elements[0].is_displayed()
         try:
             return self.find_element(strategy, locator, root=root).is_displayed()
         except NoSuchElementException:
             return False
 
+    def extract_elements(self, elements, fields):
+        """Reads data from elements using a single command.
+
+        :param elements: Elements to read.
+        :param fields: Fields to read from each element. Valid values are
+            ``text``, ``displayed``, ``tag_name``, ``attribute:<name>``, and
+            ``property:<name>``.
+        :type elements: list
+        :type fields: list
+        :return: List with a dictionary of values by field for each element.
+        :rtype: list
+
+        """
+        parsed = _parse_fields(fields)
+        elements = [self._unwrap(element) for element in elements]
+        if not elements:
+            return []
+        rows = self._execute_script(_EXTRACT_SCRIPT, elements, parsed)
+        return [dict(zip(fields, row)) for row in rows]
+
+    def extract(self, strategy, locator, fields, root=None):
+        """Finds elements and reads data from them using a single command.
+
+        Elements are located in the browser when the locator can be converted
+        to a CSS selector or an XPath expression, otherwise they are found
+        first and read using :py:func:`extract_elements`.
+
+        :param strategy: Location strategy to use. See :py:class:`~selenium.webdriver.common.by.By` for valid values.
+        :param locator: Location of target elements.
+        :param fields: Fields to read from each element. See :py:func:`extract_elements`.
+        :param root: (optional) root node.
+        :type strategy: str
+        :type locator: str
+        :type fields: list
+        :type root: str :py:class:`~selenium.webdriver.remote.webelement.WebElement` object or None.
+        :return: List with a dictionary of values by field for each element.
+        :rtype: list
+
+        """
+        parsed = _parse_fields(fields)
+        script_locator = self._script_locator(strategy, locator)
+        if script_locator is None:
+            elements = self.find_elements(strategy, locator, root=root)
+            return self.extract_elements(elements, fields)
+        rows = self._execute_script(
+            _LOCATE_AND_EXTRACT_SCRIPT, self._unwrap(root), *script_locator + (parsed,)
+        )
+        return [dict(zip(fields, row)) for row in rows]
+
+    def extract_records(self, elements, fields):
+        """Reads data from elements within root elements using a single command.
+
+        :param elements: Root elements to read.
+        :param fields: Tuples of strategy, locator and field to read from
+            the first element located within each root element. The root
+            element itself is read when the strategy and locator are
+            ``None``. See :py:func:`extract_elements` for valid fields.
+        :type elements: list
+        :type fields: list
+        :return: List with a list of values for each root element, which are
+            ``None`` for fields of elements that were not found.
+        :rtype: list
+
+        """
+        if not elements:
+            return []
+        parsed = self._parse_record_fields(fields)
+        if parsed is None:
+            return self._read_records(elements, fields)
+        elements = [self._unwrap(element) for element in elements]
+        return self._execute_script(_RECORDS_SCRIPT, elements, parsed)
+
+    def find_records(self, strategy, locator, fields, root=None):
+        """Finds root elements and reads data from elements within them.
+
+        Uses a single command when all locators can be converted to a CSS
+        selector or an XPath expression.
+
+        :param strategy: Location strategy to use. See :py:class:`~selenium.webdriver.common.by.By` for valid values.
+        :param locator: Location of root elements.
+        :param fields: Fields to read. See :py:func:`extract_records`.
+        :param root: (optional) root node.
+        :type strategy: str
+        :type locator: str
+        :type fields: list
+        :type root: str :py:class:`~selenium.webdriver.remote.webelement.WebElement` object or None.
+        :return: List with a list of values for each root element.
+        :rtype: list
+
+        """
+        parsed = self._parse_record_fields(fields)
+        script_locator = self._script_locator(strategy, locator)
+        if parsed is None or script_locator is None:
+            elements = self.find_elements(strategy, locator, root=root)
+            return self.extract_records(elements, fields)
+        return self._execute_script(
+            _LOCATE_AND_RECORDS_SCRIPT, self._unwrap(root), *script_locator + (parsed,)
+        )
+
+    def _script_locator(self, strategy, locator):
+        # kind and value of a locator that can be located by the scripts
+        kind = self.locator_kinds.get(strategy)
+        if kind is None:
+            return None
+        css = locators.to_css(kind, locator)
+        if css is not None:
+            return locators.CSS, css
+        xpath = locators.to_xpath(kind, locator)
+        if xpath is not None:
+            return locators.XPATH, xpath
+        return None
+
+    def _parse_record_fields(self, fields):
+        parsed = []
+        for strategy, locator, field in fields:
+            script_locator = (None, None)
+            if strategy is not None:
+                script_locator = self._script_locator(strategy, locator)
+                if script_locator is None:
+                    return None
+            parsed.append(list(script_locator) + _parse_fields([field]))
+        return parsed
+
+    def _read_records(self, elements, fields):
+        # locates elements one at a time, then reads each field in one command
+        rows = [[None] * len(fields) for _ in elements]
+        for index, (strategy, locator, field) in enumerate(fields):
+            targets = []
+            for row, element in zip(rows, elements):
+                if strategy is not None:
+                    found = self.find_elements(strategy, locator, root=element)
+                    element = found[0] if found else None
+                if element is not None:
+                    targets.append((row, element))
+            values = self.extract_elements([e for _, e in targets], [field])
+            for (row, _), value in zip(targets, values):
+                row[index] = value[field]
+        return rows
+
+    def compile_conditions(self, conditions):
+        """Compiles loaded conditions into a script.
+
+        :param conditions: Conditions to compile.
+        :type conditions: list of :py:class:`~pypom.conditions.Condition`
+        :return: Body of a JavaScript function returning ``true`` when all
+            conditions are met, or ``None`` if any of the conditions can not
+            be checked using a script. The function takes the root element of
+            a region as its first argument.
+        :rtype: str
+
+        """
+        expressions = []
+        for condition in conditions:
+            expression = condition.script(self._script_element)
+            if expression is None:
+                return None
+            expressions.append(expression)
+        return _CONDITION_FUNCTIONS + "return {};".format(
+            " &&\n  ".join(expressions) or "true"
+        )
+
+    def _script_element(self, strategy, locator):
+        # expression evaluating to the first element in a condition script
+        script_locator = self._script_locator(strategy, locator)
+        if script_locator is None:
+            return None
+        return "first({}, {})".format(*[json.dumps(v) for v in script_locator])
+
+    def wait_for_script(self, script, args, timeout):
+        """Waits for a script to return a true value.
+
+        The script is evaluated in the browser whenever the document changes,
+        so the wait ends as soon as the condition is met rather than at the
+        next poll. Waits that outlast :py:attr:`script_wait_slice`, or that
+        are interrupted by navigation, are continued using another command.
+        Drivers that can not run asynchronous scripts check the condition
+        every :py:attr:`script_retry_interval` instead.
+
+        :param script: Body of a JavaScript function returning the condition.
+        :param args: Arguments passed to the function.
+        :param timeout: Time in seconds to wait for.
+        :type script: str
+        :type args: list
+        :type timeout: int
+        :raises: :py:class:`~selenium.common.exceptions.TimeoutException`,
+            or the error raised by the script
+
+        """
+        args = [self._unwrap(arg) for arg in args]
+        end_time = time.time() + timeout
+        failed = False
+        while True:
+            remaining = max(end_time - time.time(), 0)
+            try:
+                if self._check_script(script, args, remaining):
+                    return
+                failed = False
+            except WebDriverException as exc:
+                if not _interrupted(exc):
+                    raise
+                # try again at once in the new document, and only back off
+                # if that fails too
+                if failed:
+                    time.sleep(min(self.script_retry_interval, remaining))
+                failed = True
+            if time.time() >= end_time:
+                raise TimeoutException("Timed out waiting for script condition")
+
+    def _check_script(self, script, args, remaining):
+        if self._async_scripts:
+            wait = min(remaining, self.script_wait_slice)
+            try:
+                return self._execute_async_script(
+                    _WAIT_SCRIPT % script, args, int(wait * 1000)
+                )
+            except WebDriverException as exc:
+                if not _unsupported(exc):
+                    raise
+                self._async_scripts = False
+        if self._execute_script(_CHECK_SCRIPT % script, args):
+            return True
+        time.sleep(min(self.script_retry_interval, remaining))
+        return False
+
+    def document_marker(self):
+        """Marks the current document.
+
+        :return: Marker identifying the current document and URL.
+        :rtype: tuple
+        """
+        self.invalidate_snapshot()
+        marker = uuid.uuid4().hex
+        return marker, self._execute_script(_MARK_DOCUMENT_SCRIPT, marker)
+
+    def wait_for_new_document(self, marker, timeout):
+        """Waits for the document or URL to change.
+
+        The wait ends as soon as the marked document is replaced by one that
+        has been parsed, or its URL changes, such as when a single page
+        application navigates.
+
+        :param marker: Marker returned by :py:func:`document_marker`.
+        :param timeout: Time in seconds to wait for.
+        :type marker: tuple
+        :type timeout: int
+        :raises: :py:class:`~selenium.common.exceptions.TimeoutException`
+        """
+        self.wait_for_script(_NEW_DOCUMENT_CONDITION, list(marker), timeout)
+
+    def get_state(self):
+        """Returns the cookies and storage of the current origin.
+
+        :return: Dictionary of the ``origin``, a list of ``cookies``, and
+            dictionaries of ``local_storage`` and ``session_storage`` items.
+        :rtype: dict
+        """
+        state = self._execute_script(_STORAGE_SCRIPT)
+        state["cookies"] = self._get_cookies()
+        return state
+
+    def set_state(self, state, url=None):
+        """Replaces the cookies and storage of an origin.
+
+        Cookies and storage can only be set for the origin of the current
+        page, so ``url`` is opened first unless the current page is already
+        on the origin of the state. Expired cookies are not restored.
+
+        :param state: State returned by :py:func:`get_state`.
+        :param url: (optional) URL to open on the origin of the state.
+            Defaults to the root of the origin.
+        :type state: dict
+        :type url: str
+        """
+        self.invalidate_snapshot()
+        origin = state["origin"]
+        current = urlsplit(self.current_url())
+        if "{}://{}".format(current.scheme, current.netloc) != origin:
+            self.open(url or origin + "/")
+        self._delete_cookies()
+        now = time.time()
+        for cookie in state["cookies"]:
+            if cookie.get("expiry") is None or cookie["expiry"] > now:
+                self._add_cookie(cookie)
+        self._execute_script(_RESTORE_STORAGE_SCRIPT, state)
+
+    def _get_cookies(self):
+        return self.driver.get_cookies()
+
+    def _add_cookie(self, cookie):
+        self.driver.add_cookie(cookie)
+
+    def _delete_cookies(self):
+        self.driver.delete_all_cookies()
+
+    def _unwrap(self, element):
+        # elements of a snapshot only exist once the module is imported, which
+        # is left until a snapshot is taken
+        snapshot = sys.modules.get("pypom.snapshot")
+        if snapshot is not None and isinstance(element, snapshot.SnapshotElement):
+            return element.live_element
+        return element
+
+    def _execute_script(self, script, *args):
+        return self.driver.execute_script(script, *args)
+
+    def _execute_async_script(self, script, *args):
+        return self.driver.execute_async_script(script, *args)
+
 
 def register():
     """ Register the Selenium specific driver implementation.
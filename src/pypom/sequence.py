@@ -0,0 +1,60 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import sys
+
+if sys.version_info >= (3,):
+    from collections.abc import Sequence
+else:
+    from collections import Sequence
+
+
+class RegionSequence(Sequence):
+    """A sequence of page regions that are created when first used.
+
+    The root elements of the regions are located once, but each region is only
+    created (and waited for) when it is indexed or iterated over. Taking the
+    length or a slice of the sequence does not create any regions.
+
+    :param page: Page object the regions appear in.
+    :param region_class: Page region class.
+    :param elements: Root elements of the regions.
+    :type page: :py:class:`~pypom.page.Page` or :py:class:`~pypom.region.Region`
+    :type region_class: :py:class:`~pypom.region.Region` subclass
+    :type elements: list
+    """
+
+    def __init__(self, page, region_class, elements):
+        self.page = page
+        self.region_class = region_class
+        self._elements = list(elements)
+        self._regions = {}
+
+    def __len__(self):
+        return len(self._elements)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            indices = range(*index.indices(len(self._elements)))
+            sequence = RegionSequence(
+                self.page, self.region_class, [self._elements[i] for i in indices]
+            )
+            for i, j in enumerate(indices):
+                if j in self._regions:
+                    sequence._regions[i] = self._regions[j]
+            return sequence
+
+        element = self._elements[index]
+        if index < 0:
+            index += len(self._elements)
+        region = self._regions.get(index)
+        if region is None:
+            region = self.region_class(self.page, root=element)
+            self._regions[index] = region
+        return region
+
+    def __repr__(self):
+        return "<{} of {} {}>".format(
+            type(self).__name__, len(self), self.region_class.__name__
+        )
@@ -0,0 +1,304 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Copies of the current page, read without the browser.
+
+Within ``with page.snapshot():`` the driver adapter takes a
+:py:class:`Snapshot` of the page using a single command, and finds elements
+in it rather than in the browser. See
+:py:func:`~pypom.selenium_driver.Selenium.snapshot`.
+"""
+
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+)
+
+from lxml import etree
+
+from . import dom
+from .elements import StaticElement, find
+
+# marks elements hidden in the browser
+_HIDDEN_ATTRIBUTE = "data-pypom-hidden"
+
+# copies the document element, with the state of form fields and whether
+# elements are displayed as attributes; displayed is memoized per element,
+# but otherwise matches the approximation used by extract
+_SNAPSHOT_SCRIPT = """
+var hidden = arguments[0];
+var root = document.documentElement;
+var copy = root.cloneNode(true);
+var elements = [root].concat(Array.prototype.slice.call(
+  root.getElementsByTagName('*')));
+var copies = [copy].concat(Array.prototype.slice.call(
+  copy.getElementsByTagName('*')));
+var visible = new Map();
+function styleVisible(element) {
+  if (!element || element.nodeType !== 1) {
+    return true;
+  }
+  if (!visible.has(element)) {
+    var style = window.getComputedStyle(element);
+    visible.set(element, style.visibility !== 'hidden' &&
+      style.visibility !== 'collapse' && style.opacity !== '0' &&
+      styleVisible(element.parentNode));
+  }
+  return visible.get(element);
+}
+function flag(element, name, value) {
+  if (value) {
+    element.setAttribute(name, '');
+  } else {
+    element.removeAttribute(name);
+  }
+}
+for (var i = 0; i < elements.length; i++) {
+  var element = elements[i], clone = copies[i];
+  if (!element.getClientRects().length || !styleVisible(element)) {
+    clone.setAttribute(hidden, '');
+  }
+  switch (element.localName) {
+    case 'input':
+      clone.setAttribute('value', element.value);
+      flag(clone, 'checked', element.checked);
+      break;
+    case 'textarea':
+      clone.textContent = element.value;
+      break;
+    case 'option':
+      flag(clone, 'selected', element.selected);
+      break;
+  }
+}
+return [window.location.href, copy.outerHTML];
+"""
+
+
+class Snapshot(object):
+    """A copy of the document of a page.
+
+    Elements are found in the copy using the locator strategies of both
+    Selenium and Splinter, in the same way as the
+    :py:class:`~pypom.static_driver.StaticDriver`. Fields hold their current
+    values, and elements hidden by style sheets are known to be hidden.
+
+    :param adapter: Driver adapter of the browser.
+    :param html: Markup of the document element, with the elements hidden in
+        the browser marked.
+    :param url: URL of the page.
+    :type html: str
+    :type url: str
+    """
+
+    def __init__(self, adapter, html, url):
+        self.adapter = adapter
+        self.document = dom.parse(html, url)
+        self.valid = True
+        hidden = []
+        for element in self.document.iter():
+            if _HIDDEN_ATTRIBUTE in element.attrib:
+                del element.attrib[_HIDDEN_ATTRIBUTE]
+                hidden.append(element)
+        self.document.hidden = frozenset(hidden)
+
+    def __repr__(self):
+        return "<Snapshot {}>".format(self.document.url)
+
+    @classmethod
+    def take(cls, adapter):
+        """Copies the current page of a browser using a single command.
+
+        :param adapter: Driver adapter of the browser.
+        :rtype: :py:class:`Snapshot`
+        """
+        url, html = adapter._execute_script(_SNAPSHOT_SCRIPT, _HIDDEN_ATTRIBUTE)
+        return cls(adapter, html, url)
+
+    def invalidate(self):
+        """Marks the snapshot as out of date.
+
+        Elements found in it are then read from the browser.
+        """
+        self.valid = False
+
+    def find_element(self, strategy, locator, root=None):
+        """Finds an element in the snapshot.
+
+        :param strategy: Location strategy to use.
+        :param locator: Location of target element.
+        :param root: (optional) Element of a snapshot to search within.
+        :rtype: :py:class:`SnapshotElement`
+        :raises: :py:class:`~selenium.common.exceptions.NoSuchElementException`
+        """
+        elements = self.find_elements(strategy, locator, root=root)
+        if not elements:
+            raise NoSuchElementException(
+                "Unable to locate element: {}={}".format(strategy, locator)
+            )
+        return elements[0]
+
+    def find_elements(self, strategy, locator, root=None):
+        """Finds elements in the snapshot.
+
+        :param strategy: Location strategy to use.
+        :param locator: Location of target elements.
+        :param root: (optional) Element of a snapshot to search within. It
+            may be from an earlier snapshot of the same page.
+        :return: List of :py:class:`SnapshotElement` objects.
+        :rtype: list
+        """
+        context = self.document if root is None else self._node(root)
+        nodes = find(self.document, context, strategy, locator)
+        return [SnapshotElement(self, node) for node in nodes]
+
+    def _node(self, element):
+        # the node of an element, which may be from an earlier snapshot
+        if element.snapshot is self:
+            return element._node
+        nodes = dom.evaluate(self.document, self.document, element.path)
+        if not nodes:
+            raise StaleElementReferenceException(
+                "The element is no longer part of the page"
+            )
+        return nodes[0]
+
+
+class SnapshotElement(object):
+    """An element found in a :py:class:`Snapshot`.
+
+    While the snapshot is valid, the element is read from the snapshot.
+    Afterwards, and for anything other than reading it, such as clicking it
+    or typing into it, the element is found in the browser by its position in
+    the page, and the snapshot is invalidated first.
+    """
+
+    def __init__(self, snapshot, node):
+        self.snapshot = snapshot
+        self._node = node
+        self._static = None
+        self._live = None
+
+    def __repr__(self):
+        return "<SnapshotElement {}>".format(self._node.tag)
+
+    def __eq__(self, other):
+        return isinstance(other, SnapshotElement) and other._node is self._node
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self._node)
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        # anything other than reading may change the page
+        self.snapshot.adapter.invalidate_snapshot()
+        return getattr(self.live_element, name)
+
+    @property
+    def path(self):
+        """XPath expression of the position of the element in the page.
+
+        :rtype: str
+        """
+        steps = []
+        node = self._node
+        while node is not None:
+            position = 1 + sum(1 for _ in node.itersiblings(etree.Element, preceding=True))
+            steps.append("*[{}]".format(position))
+            node = node.getparent()
+        return "/" + "/".join(reversed(steps))
+
+    @property
+    def live_element(self):
+        """The element in the browser, found by its position in the page.
+
+        :raises: :py:class:`~selenium.common.exceptions.StaleElementReferenceException`
+            if there is no element at the position.
+        """
+        if self._live is None:
+            try:
+                element = self.snapshot.adapter._find_live("xpath", self.path)
+            except NoSuchElementException:
+                element = None
+            if element is None:
+                raise StaleElementReferenceException(
+                    "The element is no longer part of the page"
+                )
+            self._live = element
+        return self._live
+
+    def _read(self, name):
+        # the attribute of the element in the snapshot while it is valid,
+        # and of the element in the browser afterwards
+        if not self.snapshot.valid:
+            return getattr(self.live_element, name)
+        if self._static is None:
+            self._static = StaticElement(self.snapshot, self._node, self.snapshot.document)
+        return getattr(self._static, name)
+
+    @property
+    def tag_name(self):
+        return self._read("tag_name")
+
+    @property
+    def text(self):
+        return self._read("text")
+
+    @property
+    def value(self):
+        return self._read("value")
+
+    @property
+    def html(self):
+        return self._read("html")
+
+    @property
+    def outer_html(self):
+        return self._read("outer_html")
+
+    @property
+    def visible(self):
+        if self.snapshot.valid:
+            return self.is_displayed()
+        return self.live_element.visible
+
+    def __getitem__(self, name):
+        return self._read("__getitem__")(name)
+
+    def get_attribute(self, name):
+        return self._read("get_attribute")(name)
+
+    def get_dom_attribute(self, name):
+        return self._read("get_dom_attribute")(name)
+
+    def get_property(self, name):
+        return self._read("get_property")(name)
+
+    def has_class(self, name):
+        if self.snapshot.valid:
+            return name in self._node.classes
+        return self.live_element.has_class(name)
+
+    def is_displayed(self):
+        return self._read("is_displayed")()
+
+    def is_enabled(self):
+        return self._read("is_enabled")()
+
+    def is_selected(self):
+        return self._read("is_selected")()
+
+    def find_element(self, strategy, locator):
+        if self.snapshot.valid:
+            return self.snapshot.find_element(strategy, locator, root=self)
+        return self.live_element.find_element(strategy, locator)
+
+    def find_elements(self, strategy, locator):
+        if self.snapshot.valid:
+            return self.snapshot.find_elements(strategy, locator, root=self)
+        return self.live_element.find_elements(strategy, locator)
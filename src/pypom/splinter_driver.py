@@ -2,12 +2,22 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
-
+import time
+
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver as SeleniumWebDriver
+from selenium.webdriver.remote.webelement import WebElement
 from splinter.driver.webdriver.chrome import WebDriver as ChromeWebDriver
 from splinter.driver.webdriver.firefox import WebDriver as FirefoxWebDriver
 from splinter.driver.webdriver.remote import WebDriver as RemoteWebDriver
+from splinter.element_list import ElementList
 from zope.interface import Interface, implementer
 
+from . import locators
 from .driver import registerDriver
 from .exception import UsageError
 from .interfaces import IDriver
@@ -15,6 +25,15 @@ from .selenium_driver import Selenium
 
 ALLOWED_STRATEGIES = ["name", "id", "css", "xpath", "text", "value", "tag"]
 
+# strategies that locate a single element using Selenium directly
+_SELENIUM_STRATEGIES = {
+    "css": By.CSS_SELECTOR,
+    "xpath": By.XPATH,
+    "id": By.ID,
+    "name": By.NAME,
+    "tag": By.TAG_NAME,
+}
+
 
 class ISplinter(Interface):
     """ Marker interface for Splinter"""
@@ -22,18 +41,39 @@ class ISplinter(Interface):
 
 @implementer(IDriver)
 class Splinter(Selenium):
-    def __init__(self, driver):
-        self.driver = driver
+    locator_kinds = {
+        "css": locators.CSS,
+        "xpath": locators.XPATH,
+        "id": locators.ID,
+        "name": locators.NAME,
+        "tag": locators.TAG_NAME,
+    }
 
     def open(self, url):
         """Open the page.
         Navigates to :py:attr:`url`
         """
+        self.invalidate_snapshot()
         self.driver.visit(url)
 
+    def current_url(self):
+        """Returns the URL of the current page.
+
+        :rtype: str
+        """
+        return self.driver.url
+
+    def refresh(self):
+        """Reload the current page."""
+        self.invalidate_snapshot()
+        self.driver.reload()
+
     def find_element(self, strategy, locator, root=None):
         """Finds an element on the page.
 
+        When the browser is driven by Selenium, only the first matching
+        element is requested, rather than all matching elements.
+
         :param strategy: Location strategy to use. See pypom.splinter_driver.ALLOWED_STRATEGIES for valid values.
         :param locator: Location of target element.
         :type strategy: str
@@ -42,9 +82,42 @@ class Splinter(Selenium):
         :rtype: splinter.driver.webdriver.WebDriverElement
 
         """
+        snapshot = self._snapshot_for(root)
+        if snapshot is not None:
+            elements = snapshot.find_elements(strategy, locator, root=root)
+            return elements[0] if elements else None
+        by = _SELENIUM_STRATEGIES.get(strategy)
+        if by is not None:
+            node = self.driver if root is None else root
+            wrapped = self._selenium_node(node, root)
+            if wrapped is not None:
+                return self._find_first(node, wrapped, by, locator, root)
         elements = self.find_elements(strategy, locator, root=root)
         return elements and elements.first or None
 
+    def _selenium_node(self, node, root):
+        # the Selenium driver or element wrapped by a Splinter node
+        if root is None:
+            wrapped = getattr(node, "driver", None)
+            return wrapped if isinstance(wrapped, SeleniumWebDriver) else None
+        wrapped = getattr(node, "_element", None)
+        return wrapped if isinstance(wrapped, WebElement) else None
+
+    def _find_first(self, node, wrapped, by, locator, root):
+        # waits for an element in the same way as Splinter
+        end_time = time.time() + node.wait_time
+        while True:
+            try:
+                element = wrapped.find_element(by, locator)
+                return node.element_class(element, node, {"by": by, "value": locator})
+            except NoSuchElementException:
+                pass
+            except StaleElementReferenceException:
+                if root is not None:
+                    raise
+            if time.time() >= end_time:
+                return None
+
     def find_elements(self, strategy, locator, root=None):
         """Finds elements on the page.
 
@@ -56,12 +129,58 @@ class Splinter(Selenium):
         :rtype: :py:class:`splinter.element_list.ElementList`
 
         """
+        snapshot = self._snapshot_for(root)
+        if snapshot is not None:
+            if strategy not in ALLOWED_STRATEGIES:
+                raise UsageError("Strategy not allowed")
+            elements = snapshot.find_elements(strategy, locator, root=root)
+            return ElementList(elements, find_by=strategy, query=locator)
+
         node = root or self.driver
 
         if strategy in ALLOWED_STRATEGIES:
             return getattr(node, "find_by_" + strategy)(locator)
         raise UsageError("Strategy not allowed")
 
+    def _unwrap(self, element):
+        element = super(Splinter, self)._unwrap(element)
+        return getattr(element, "_element", element)
+
+    def _set_implicit_wait(self, time_to_wait):
+        self.driver.driver.implicitly_wait(time_to_wait)
+
+    def _execute_script(self, script, *args):
+        return self.driver.driver.execute_script(script, *args)
+
+    def _execute_async_script(self, script, *args):
+        return self.driver.driver.execute_async_script(script, *args)
+
+    def _get_cookies(self):
+        return self.driver.cookies.all(verbose=True)
+
+    def _add_cookie(self, cookie):
+        cookie = dict(cookie)
+        name = cookie.pop("name")
+        self.driver.cookies.add({name: cookie.pop("value")}, **cookie)
+
+    def _delete_cookies(self):
+        self.driver.cookies.delete_all()
+
+    def check_stale(self, element):
+        """Checks whether an element is still attached to the page.
+
+        Splinter finds no elements within a stale element, rather than
+        raising :py:class:`~selenium.common.exceptions.StaleElementReferenceException`.
+
+        :param element: Element to check.
+        :type element: :py:class:`~splinter.driver.webdriver.WebDriverElement`
+        :raises: :py:class:`~selenium.common.exceptions.StaleElementReferenceException`
+            if the element is stale.
+        """
+        element = getattr(element, "_element", None)
+        if element is not None:
+            element.is_enabled()
+
     def is_element_present(self, strategy, locator, root=None):
         """Checks whether an element is present.
 
@@ -73,7 +192,11 @@ class Splinter(Selenium):
         :rtype: bool
 
         """
-        return self.find_element(strategy, locator, root=root) and True or False
+        if self._snapshot_for(root) is not None:
+            return bool(self.find_elements(strategy, locator, root=root))
+        with self.implicit_wait_suspended():
+            element = self.find_element(strategy, locator, root=root)
+        return element and True or False
 
     def is_element_displayed(self, strategy, locator, root=None):
         """Checks whether an element is displayed.
@@ -86,9 +209,12 @@ class Splinter(Selenium):
         :rtype: bool
 
         """
-
-        element = self.find_element(strategy, locator, root=root)
-        return element and element.visible or False
+        if self._snapshot_for(root) is not None:
+            element = self.find_element(strategy, locator, root=root)
+            return element is not None and element.is_displayed()
+        with self.implicit_wait_suspended():
+            element = self.find_element(strategy, locator, root=root)
+            return element and element.visible or False
 
 
 def register():
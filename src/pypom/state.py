@@ -0,0 +1,113 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Snapshots of browser session state.
+
+A :py:class:`SessionState` holds the cookies and the local and session
+storage of an origin. Capture it once a page has reached a state that is
+slow to get to, such as after logging in, and restore it into a new session
+before opening a page, rather than repeating the steps::
+
+  from pypom.state import SessionState
+
+  LoginPage(driver, base_url).open().login(username, password)
+  SessionState.capture(driver).save('state.json')
+
+  # later, in a new session
+  SessionState.load('state.json').restore(driver)
+  AccountPage(driver, base_url).open()
+
+"""
+
+import json
+import os
+import tempfile
+
+from .driver import adaptDriver
+
+# replaces a file even if it exists, on all platforms
+_replace = getattr(os, "replace", os.rename)
+
+
+class SessionState(object):
+    """Cookies and storage of an origin.
+
+    Only the cookies and storage of a single origin are captured, which is
+    the origin of the current page.
+
+    :param state: State returned by the ``get_state`` method of a driver adapter.
+    :type state: dict
+    """
+
+    def __init__(self, state):
+        self.state = state
+
+    def __repr__(self):
+        return "SessionState(origin={!r}, cookies={})".format(
+            self.origin, len(self.state["cookies"])
+        )
+
+    @property
+    def origin(self):
+        """Origin the state was captured from.
+
+        :rtype: str
+        """
+        return self.state["origin"]
+
+    @classmethod
+    def capture(cls, driver):
+        """Captures the state of the current origin of a driver.
+
+        :param driver: A driver.
+        :return: Session state.
+        :rtype: :py:class:`SessionState`
+        """
+        return cls(adaptDriver(driver).get_state())
+
+    def restore(self, driver, url=None):
+        """Replaces the cookies and storage of a driver with this state.
+
+        Cookies and storage can only be set for the origin of the current
+        page, so ``url`` is opened first unless the driver is already on the
+        origin of the state. The page should be opened again afterwards.
+
+        :param driver: A driver.
+        :param url: (optional) URL to open on the origin of the state.
+            Defaults to the root of the origin.
+        :type url: str
+        """
+        adaptDriver(driver).set_state(self.state, url)
+
+    def save(self, path):
+        """Writes the state to a file.
+
+        The file is replaced atomically, so processes reading it never see a
+        partially written state. It contains session cookies, and is only
+        readable by the current user.
+
+        :param path: Path of the file.
+        :type path: str
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(self.state, f)
+            _replace(temp_path, path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    @classmethod
+    def load(cls, path):
+        """Reads a state written by :py:func:`save`.
+
+        :param path: Path of the file.
+        :type path: str
+        :return: Session state.
+        :rtype: :py:class:`SessionState`
+        """
+        with open(path) as f:
+            return cls(json.load(f))
@@ -0,0 +1,398 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""A driver for static HTML, without a browser.
+
+:py:class:`StaticDriver` loads pages from local files, a map of URLs to
+fixture files, or an HTTP server, and parses them using :py:mod:`pypom.dom`.
+Elements can be located using the Selenium location strategies and the
+Splinter strategies in :py:attr:`~pypom.splinter_driver.ALLOWED_STRATEGIES`,
+so page objects can be tested against saved pages in milliseconds::
+
+  from pypom.static_driver import StaticDriver
+
+  driver = StaticDriver(fixtures={
+      'https://www.mozilla.org/en-US/': 'tests/fixtures/home.html',
+      'https://www.mozilla.org/en-US/firefox/': 'tests/fixtures/firefox/',
+  })
+  page = Home(driver, 'https://www.mozilla.org', locale='en-US').open()
+
+Scripts are not run, and style sheets are not applied, so whether an element
+is displayed is only decided by its attributes and inline style.
+"""
+
+import io
+import os
+import sys
+from contextlib import contextmanager
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from zope.interface import Interface, implementer
+
+from . import dom, locators
+from .driver import registerDriver
+from .elements import StaticElement, _first, find
+from .interfaces import IDriver
+from .selenium_driver import Selenium, _parse_fields
+
+if sys.version_info >= (3,):
+    from urllib.error import HTTPError, URLError
+    from urllib.parse import urldefrag, urlsplit, urlunsplit
+    from urllib.request import pathname2url, url2pathname, urlopen
+else:
+    from urllib import pathname2url, url2pathname
+    from urllib2 import HTTPError, URLError, urlopen
+    from urlparse import urldefrag, urlsplit, urlunsplit
+
+
+class IStatic(Interface):
+    """ Marker interface for StaticDriver"""
+
+
+class StaticDriver(object):
+    """A driver for static HTML pages.
+
+    URLs are loaded from the first of:
+
+    #. ``fixtures``, a dictionary of URLs to files. URLs match with or without
+       their query string. A URL ending with ``/`` mapped to a directory
+       matches all URLs starting with it, which are loaded from the same path
+       within the directory, using ``index.html`` for directories.
+    #. Files, for ``file:`` URLs and paths.
+    #. HTTP, for ``http:`` and ``https:`` URLs, such as a local test server.
+
+    :param fixtures: (optional) Dictionary of URLs to files or directories.
+    :param timeout: (optional) Timeout in seconds of HTTP requests.
+    :type fixtures: dict
+    :type timeout: int
+    """
+
+    def __init__(self, fixtures=None, timeout=10):
+        self.fixtures = dict(fixtures or {})
+        self.timeout = timeout
+        self.document = dom.parse("")
+        self.page_source = ""
+        self._cookies = {}
+
+    def __repr__(self):
+        return "<StaticDriver {}>".format(self.current_url)
+
+    @property
+    def current_url(self):
+        """URL of the current page.
+
+        :rtype: str
+        """
+        return self.document.url
+
+    @property
+    def title(self):
+        """Title of the current page.
+
+        :rtype: str
+        """
+        return self.document.title
+
+    def get(self, url):
+        """Load a page.
+
+        :param url: URL of the page.
+        :type url: str
+        :raises: :py:class:`~selenium.common.exceptions.WebDriverException`
+            if the page can not be loaded.
+        """
+        html, url = self._fetch(url)
+        self.load(html, url)
+
+    def load(self, html, url="about:blank"):
+        """Load a page from markup.
+
+        :param html: Markup of the page.
+        :param url: (optional) URL of the page.
+        :type html: str
+        :type url: str
+        """
+        self.page_source = html
+        self.document = dom.parse(html, url)
+
+    def refresh(self):
+        """Load the current page again."""
+        self.get(self.current_url)
+
+    def _fetch(self, url):
+        parts = urlsplit(url)
+        scheme = parts.scheme
+        if scheme in ("http", "https") and not parts.path:
+            # as browsers do, request the root of the host
+            url = urlunsplit(parts[:2] + ("/",) + parts[3:])
+        path = self._fixture(url)
+        if path is None:
+            if url in ("", "about:blank"):
+                return "", "about:blank"
+            if scheme in ("http", "https"):
+                return self._request(url)
+            if scheme == "file":
+                path = url2pathname(urlsplit(url).path)
+            elif not scheme or len(scheme) == 1:
+                # a path, possibly with a drive letter
+                path = url
+                url = "file://" + pathname2url(os.path.abspath(path))
+        if path is None:
+            raise WebDriverException("No fixture for {}".format(url))
+        if os.path.isdir(path):
+            path = os.path.join(path, "index.html")
+        try:
+            with io.open(path, encoding="utf-8") as f:
+                return f.read(), url
+        except (IOError, OSError) as e:
+            raise WebDriverException("Could not load {}: {}".format(url, e))
+
+    def _fixture(self, url):
+        url = urldefrag(url)[0]
+        without_query = url.partition("?")[0]
+        for key in (url, without_query):
+            if key in self.fixtures:
+                return self.fixtures[key]
+        prefixes = [
+            prefix
+            for prefix in self.fixtures
+            if prefix.endswith("/") and without_query.startswith(prefix)
+        ]
+        if not prefixes:
+            return None
+        prefix = max(prefixes, key=len)
+        directory = self.fixtures[prefix]
+        if not os.path.isdir(directory):
+            return None
+        relative = without_query[len(prefix):]
+        return os.path.join(directory, *relative.split("/"))
+
+    def _request(self, url):
+        try:
+            response = urlopen(url, timeout=self.timeout)
+        except HTTPError as e:
+            # browsers display error pages too
+            response = e
+        except URLError as e:
+            raise WebDriverException("Could not load {}: {}".format(url, e.reason))
+        try:
+            charset = response.headers.get_content_charset() or "utf-8"
+        except AttributeError:  # pragma: no cover
+            charset = response.headers.getparam("charset") or "utf-8"
+        try:
+            return response.read().decode(charset, "replace"), response.geturl()
+        finally:
+            response.close()
+
+    def find_element(self, by=By.ID, value=None):
+        """Find an element.
+
+        :param by: Location strategy.
+        :param value: Locator.
+        :rtype: :py:class:`StaticElement`
+        :raises: :py:class:`~selenium.common.exceptions.NoSuchElementException`
+        """
+        return _first(self.find_elements(by, value), by, value)
+
+    def find_elements(self, by=By.ID, value=None):
+        """Find elements.
+
+        :param by: Location strategy.
+        :param value: Locator.
+        :rtype: list of :py:class:`StaticElement`
+        """
+        return self._wrap(find(self.document, self.document, by, value))
+
+    def _wrap(self, nodes):
+        document = self.document
+        return [StaticElement(self, node, document) for node in nodes]
+
+    def implicitly_wait(self, time_to_wait):
+        """Does nothing, as pages do not change after loading."""
+
+    def execute_script(self, script, *args):
+        raise WebDriverException("StaticDriver can not run scripts")
+
+    execute_async_script = execute_script
+
+    def get_cookies(self):
+        """Cookies added using :py:func:`add_cookie`.
+
+        :rtype: list
+        """
+        return [dict(cookie) for cookie in self._cookies.values()]
+
+    def add_cookie(self, cookie):
+        """Add a cookie. Cookies are not sent with HTTP requests.
+
+        :param cookie: Dictionary with at least a ``name`` and a ``value``.
+        :type cookie: dict
+        """
+        self._cookies[cookie["name"]] = dict(cookie)
+
+    def delete_all_cookies(self):
+        """Delete all cookies."""
+        self._cookies.clear()
+
+    def quit(self):
+        """Does nothing, as there is no browser to quit."""
+
+    close = quit
+
+
+@implementer(IDriver)
+class Static(Selenium):
+    """Driver adapter for :py:class:`StaticDriver`.
+
+    Supports both the Selenium and the Splinter location strategies. Waits
+    poll, as there are no scripts to wait for in the browser.
+    """
+
+    locator_kinds = dict(
+        Selenium.locator_kinds, **{"css": locators.CSS, "tag": locators.TAG_NAME}
+    )
+
+    # scripts can not be run, so loaded scripts and conditions are not
+    # waited for in the browser
+    wait_for_script = None
+    compile_conditions = None
+
+    @contextmanager
+    def snapshot(self):
+        """Does nothing, as pages are always read without a browser."""
+        yield
+
+    def extract_elements(self, elements, fields):
+        """Reads data from elements.
+
+        :param elements: Elements to read.
+        :param fields: Fields to read from each element. Valid values are
+            ``text``, ``displayed``, ``tag_name``, ``attribute:<name>``, and
+            ``property:<name>``.
+        :type elements: list
+        :type fields: list
+        :return: List with a dictionary of values by field for each element.
+        :rtype: list
+        """
+        parsed = _parse_fields(fields)
+        rows = []
+        for element in elements:
+            values = [_read(element, kind, name) for kind, name in parsed]
+            rows.append(dict(zip(fields, values)))
+        return rows
+
+    def extract(self, strategy, locator, fields, root=None):
+        """Finds elements and reads data from them.
+
+        :param strategy: Location strategy to use.
+        :param locator: Location of target elements.
+        :param fields: Fields to read from each element. See :py:func:`extract_elements`.
+        :param root: (optional) root node.
+        :return: List with a dictionary of values by field for each element.
+        :rtype: list
+        """
+        _parse_fields(fields)
+        elements = self.find_elements(strategy, locator, root=root)
+        return self.extract_elements(elements, fields)
+
+    def extract_records(self, elements, fields):
+        """Reads data from elements within root elements.
+
+        :param elements: Root elements to read.
+        :param fields: Tuples of strategy, locator and field. See
+            :py:func:`~pypom.selenium_driver.Selenium.extract_records`.
+        :return: List with a list of values for each root element.
+        :rtype: list
+        """
+        if not elements:
+            return []
+        return self._read_records(elements, fields)
+
+    def find_records(self, strategy, locator, fields, root=None):
+        """Finds root elements and reads data from elements within them.
+
+        :param strategy: Location strategy to use.
+        :param locator: Location of root elements.
+        :param fields: Fields to read. See :py:func:`extract_records`.
+        :param root: (optional) root node.
+        :return: List with a list of values for each root element.
+        :rtype: list
+        """
+        elements = self.find_elements(strategy, locator, root=root)
+        return self.extract_records(elements, fields)
+
+    def document_marker(self):
+        """Returns the current document.
+
+        :rtype: :py:class:`~pypom.dom.Document`
+        """
+        return self.driver.document
+
+    def wait_for_new_document(self, marker, timeout):
+        """Checks that another page has been loaded.
+
+        Pages only change when they are loaded, so this does not wait.
+
+        :param marker: Document returned by :py:func:`document_marker`.
+        :param timeout: Ignored.
+        :raises: :py:class:`~selenium.common.exceptions.TimeoutException`
+        """
+        if self.driver.document is marker:
+            raise TimeoutException("No other page was loaded")
+
+    def get_state(self):
+        """Returns the cookies of the driver.
+
+        Pages do not have storage, which is always empty.
+
+        :rtype: dict
+        """
+        url = urlsplit(self.current_url())
+        return {
+            "origin": "{}://{}".format(url.scheme, url.netloc),
+            "cookies": self.driver.get_cookies(),
+            "local_storage": {},
+            "session_storage": {},
+        }
+
+    def set_state(self, state, url=None):
+        """Replaces the cookies of the driver.
+
+        :param state: State returned by :py:func:`get_state`.
+        :param url: (optional) URL to open on the origin of the state, if
+            the current page is not on it.
+        :type state: dict
+        :type url: str
+        """
+        current = urlsplit(self.current_url())
+        if "{}://{}".format(current.scheme, current.netloc) != state["origin"]:
+            self.open(url or state["origin"] + "/")
+        self.driver.delete_all_cookies()
+        for cookie in state["cookies"]:
+            self.driver.add_cookie(cookie)
+
+
+def _read(element, kind, name):
+    if kind == "text":
+        return element.text.strip()
+    if kind == "displayed":
+        return element.is_displayed()
+    if kind == "tag_name":
+        return element.tag_name
+    if kind == "attribute":
+        return element.get_dom_attribute(name)
+    return element.get_property(name)
+
+
+def register():
+    """ Register the static HTML driver implementation.
+
+        This register call is performed when this module is imported, as
+        a :py:class:`StaticDriver` can only be created after importing it.
+    """
+    registerDriver(IStatic, Static, class_implements=[StaticDriver])
+
+
+register()
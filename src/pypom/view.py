@@ -2,27 +2,41 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
+from contextlib import contextmanager
 from warnings import warn
 
-from pluggy import PluginManager
+from .driver import adaptDriver
+from .exception import UsageError
+from .plugins import get_plugin_manager
+from .sequence import RegionSequence
 
-from pypom import hooks
 
-from .interfaces import IDriver
+@contextmanager
+def _no_snapshot():
+    yield
 
 
 class WebView(object):
+    _polling = None
+    """Polling policy used by :py:attr:`wait`.
+
+    Set this to a :py:class:`~pypom.polling.PollingPolicy` to change how long
+    waits sleep between checks. Defaults to the poll frequency of the driver.
+    """
+
     def __init__(self, driver, timeout, pm=None):
         self.driver = driver
-        self.driver_adapter = IDriver(driver)
+        self.driver_adapter = adaptDriver(driver)
         self.timeout = timeout
         self.pm = pm
         if self.pm is None:
-            self.pm = PluginManager("pypom")
-            self.pm.add_hookspecs(hooks)
-            self.pm.load_setuptools_entrypoints("pypom.plugin")
-            self.pm.check_pending()
-        self.wait = self.driver_adapter.wait_factory(self.timeout)
+            self.pm = get_plugin_manager()
+        if self._polling is None:
+            self.wait = self.driver_adapter.wait_factory(self.timeout)
+        else:
+            self.wait = self.driver_adapter.wait_factory(
+                self.timeout, polling=self._polling.bind(type(self))
+            )
 
     @property
     def selenium(self):
@@ -30,6 +44,71 @@ class WebView(object):
         warn("use driver instead", DeprecationWarning, stacklevel=2)
         return self.driver
 
+    def transition(self, action, page_class, base_url=None, **kwargs):
+        """Performs an action that loads another page, and waits for it.
+
+        The current document is marked before calling ``action``. Afterwards
+        this waits for the marked document to be replaced, or for the URL to
+        change, and then creates the page object and waits for it to load.
+        The waits end as soon as the browser is ready rather than at the next
+        poll, so there is no need to sleep or override
+        :py:attr:`~pypom.page.Page.loaded` to avoid finding elements of the
+        previous page.
+
+        :param action: Function called without arguments, such as the
+            ``click`` method of a link.
+        :param page_class: Page object class of the page loaded.
+        :param base_url: (optional) Base URL of the page object. Defaults to
+            the base URL of the current page.
+        :param kwargs: Keyword arguments passed to the page object, such as
+            ``timeout`` or the keyword arguments of its URL template.
+        :type page_class: :py:class:`~pypom.page.Page` subclass
+        :type base_url: str
+        :return: The page object, once it has loaded.
+        :rtype: :py:class:`~pypom.page.Page`
+
+        Usage::
+
+          link = page.find_element(By.LINK_TEXT, 'Download')
+          download = page.transition(link.click, DownloadPage)
+
+        """
+        marker = self.driver_adapter.document_marker()
+        action()
+        self.driver_adapter.wait_for_new_document(marker, self.timeout)
+        if base_url is None:
+            base_url = getattr(self, "page", self).base_url
+        kwargs.setdefault("timeout", self.timeout)
+        return page_class(self.driver, base_url, **kwargs).wait_for_page_to_load()
+
+    def snapshot(self):
+        """Reads the page from a copy taken using a single command.
+
+        Within the block, :py:func:`find_element`, :py:func:`find_elements`,
+        :py:func:`is_element_present` and :py:func:`is_element_displayed` of
+        this view and of all other pages and regions using the same driver
+        find elements in a copy of the page rather than in the browser, which
+        saves a command for each call. Elements found in the copy are read
+        from it, and the copy is taken again after opening a page, clicking
+        or typing into one of its elements, and before a wait checks again.
+
+        Elements found before the block are not part of the copy, so regions
+        with such root elements keep using the browser, and interactions
+        using them are not detected. Drivers that do not support copying the
+        page are used as they are.
+
+        Usage::
+
+          with page.snapshot():
+              assert len(page.results) == 10
+              assert page.results[0].name == 'Firefox'
+
+        """
+        snapshot = getattr(self.driver_adapter, "snapshot", None)
+        if snapshot is None:
+            return _no_snapshot()
+        return snapshot()
+
     def find_element(self, strategy, locator):
         return self.driver_adapter.find_element(strategy, locator)
 
@@ -46,6 +125,155 @@ class WebView(object):
         """
         return self.driver_adapter.find_elements(strategy, locator)
 
+    def regions(self, region_class, strategy, locator):
+        """Creates a page region for each element found.
+
+        The regions are created using :py:func:`~pypom.region.Region.from_elements`,
+        so they are waited for together.
+
+        :param region_class: Page region class.
+        :param strategy: Location strategy to use. See :py:class:`~selenium.webdriver.common.by.By` or :py:attr:`~pypom.splinter_driver.ALLOWED_STRATEGIES`.
+        :param locator: Location of the root elements of the regions.
+        :type region_class: :py:class:`~pypom.region.Region` subclass
+        :type strategy: str
+        :type locator: str
+        :return: List of page regions.
+        :rtype: list
+
+        """
+        return region_class.from_elements(self, self.find_elements(strategy, locator))
+
+    def find_regions(self, region_class, strategy, locator):
+        """Finds page regions, creating them only when they are used.
+
+        The root elements of the regions are located immediately, but each
+        region is created and waited for when it is first indexed or iterated
+        over. Use this rather than :py:func:`regions` when only a few of many
+        regions are likely to be used.
+
+        :param region_class: Page region class.
+        :param strategy: Location strategy to use. See :py:class:`~selenium.webdriver.common.by.By` or :py:attr:`~pypom.splinter_driver.ALLOWED_STRATEGIES`.
+        :param locator: Location of the root elements of the regions.
+        :type region_class: :py:class:`~pypom.region.Region` subclass
+        :type strategy: str
+        :type locator: str
+        :return: Sequence of page regions.
+        :rtype: :py:class:`~pypom.sequence.RegionSequence`
+
+        """
+        return RegionSequence(self, region_class, self.find_elements(strategy, locator))
+
+    def find_records(self, region_class, strategy, locator):
+        """Finds page regions and reads their fields.
+
+        The root elements are located and the fields declared by
+        :py:attr:`~pypom.region.Region._fields` are read using a single
+        command, without creating the regions.
+
+        :param region_class: Page region class declaring the fields.
+        :param strategy: Location strategy to use. See :py:class:`~selenium.webdriver.common.by.By` or :py:attr:`~pypom.splinter_driver.ALLOWED_STRATEGIES`.
+        :param locator: Location of the root elements of the regions.
+        :type region_class: :py:class:`~pypom.region.Region` subclass
+        :type strategy: str
+        :type locator: str
+        :return: List of records.
+        :rtype: list
+
+        """
+        fields = region_class._record_fields()
+        rows = self._extractor("find_records")(strategy, locator, fields)
+        return region_class._make_records(rows)
+
+    def extract(self, strategy, locator, fields):
+        """Finds elements and reads data from them.
+
+        All values are read using a single command, rather than one command
+        for each field of each element.
+
+        :param strategy: Location strategy to use. See :py:class:`~selenium.webdriver.common.by.By` or :py:attr:`~pypom.splinter_driver.ALLOWED_STRATEGIES`.
+        :param locator: Location of target elements.
+        :param fields: Fields to read from each element. Valid values are
+            ``text``, ``displayed``, ``tag_name``, ``attribute:<name>``, and
+            ``property:<name>``.
+        :type strategy: str
+        :type locator: str
+        :type fields: list
+        :return: List with a dictionary of values by field for each element.
+        :rtype: list
+
+        Usage::
+
+          links = page.extract(By.CSS_SELECTOR, 'a', ['text', 'property:href'])
+          hrefs = [link['property:href'] for link in links]
+
+        """
+        return self._extractor("extract")(strategy, locator, fields)
+
+    def extract_elements(self, elements, fields):
+        """Reads data from elements.
+
+        All values are read using a single command, rather than one command
+        for each field of each element.
+
+        :param elements: Elements to read.
+        :param fields: Fields to read from each element. See :py:func:`extract`.
+        :type elements: list
+        :type fields: list
+        :return: List with a dictionary of values by field for each element.
+        :rtype: list
+
+        """
+        return self._extractor("extract_elements")(elements, fields)
+
+    def _wait_for_loaded_script(self, *args):
+        # waits for the loaded script and conditions in the browser, and
+        # returns the conditions that are left to check on every poll
+        conditions = self._loaded_conditions or ()
+        wait = getattr(self.driver_adapter, "wait_for_script", None)
+        if wait is None:
+            return conditions
+        scripts = []
+        if self._loaded_script is not None:
+            scripts.append(self._loaded_script)
+        if conditions:
+            compiled = self._compiled_conditions()
+            if compiled is not None:
+                scripts.append(compiled)
+                conditions = ()
+        if len(scripts) > 1:
+            calls = [
+                "(function() {{\n{}\n}}).apply(this, arguments)".format(script)
+                for script in scripts
+            ]
+            scripts = ["return {};".format(" && ".join(calls))]
+        if scripts:
+            wait(scripts[0], args, self.timeout)
+        return conditions
+
+    def _compiled_conditions(self):
+        # compiled once for each class and type of driver adapter
+        cls = type(self)
+        compiled = cls.__dict__.get("_compiled_loaded_conditions")
+        if compiled is None:
+            compiled = {}
+            cls._compiled_loaded_conditions = compiled
+        key = type(self.driver_adapter)
+        if key not in compiled:
+            compile_conditions = getattr(self.driver_adapter, "compile_conditions", None)
+            compiled[key] = compile_conditions and compile_conditions(
+                self._loaded_conditions
+            )
+        return compiled[key]
+
+    def _conditions_met(self, conditions):
+        return all(condition.check(self) for condition in conditions)
+
+    def _extractor(self, name):
+        method = getattr(self.driver_adapter, name, None)
+        if method is None:
+            raise UsageError("Driver does not support extracting element data")
+        return method
+
     def is_element_present(self, strategy, locator):
         """Checks whether an element is present.
 
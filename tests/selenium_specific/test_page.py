@@ -4,6 +4,11 @@
 
 import random
 
+import pytest
+from mock import Mock, patch
+
+UNLOADED = "javascript error: document unloaded while waiting for result"
+
 
 def test_find_element_selenium(page, selenium):
     locator = (str(random.random()), str(random.random()))
@@ -55,3 +60,377 @@ def test_is_element_displayed_not_displayed_selenium(page, selenium):
     assert not page.is_element_displayed(*locator)
     selenium.find_element.assert_called_with(*locator)
     element.is_displayed.assert_called_once_with()
+
+
+def test_extract_selenium(page, selenium):
+    from selenium.webdriver.common.by import By
+
+    selenium.execute_script.return_value = [["Home", "/"], ["About", "/about"]]
+    data = page.extract(By.ID, "nav", ["text", "attribute:href"])
+    assert data == [
+        {"text": "Home", "attribute:href": "/"},
+        {"text": "About", "attribute:href": "/about"},
+    ]
+    assert selenium.execute_script.call_count == 1
+    args = selenium.execute_script.call_args[0][1:]
+    assert args == (None, "css", "#nav", [["text", ""], ["attribute", "href"]])
+    selenium.find_elements.assert_not_called()
+
+
+def test_extract_xpath_selenium(page, selenium):
+    from selenium.webdriver.common.by import By
+
+    selenium.execute_script.return_value = []
+    assert page.extract(By.ID, "1 nav", ["displayed"]) == []
+    args = selenium.execute_script.call_args[0][1:]
+    assert args == (None, "xpath", ".//*[@id='1 nav']", [["displayed", ""]])
+
+
+def test_extract_not_converted_selenium(page, selenium):
+    from selenium.webdriver.common.by import By
+
+    elements = [Mock(), Mock()]
+    selenium.find_elements.return_value = elements
+    selenium.execute_script.return_value = [["a"], ["a"]]
+    data = page.extract(By.LINK_TEXT, "Home", ["tag_name"])
+    assert data == [{"tag_name": "a"}, {"tag_name": "a"}]
+    selenium.find_elements.assert_called_once_with(By.LINK_TEXT, "Home")
+    args = selenium.execute_script.call_args[0][1:]
+    assert args == (elements, [["tag_name", ""]])
+
+
+def test_extract_elements_selenium(page, selenium):
+    elements = [Mock(), Mock()]
+    selenium.execute_script.return_value = [[True, "x"], [False, None]]
+    data = page.extract_elements(elements, ["displayed", "property:value"])
+    assert data == [
+        {"displayed": True, "property:value": "x"},
+        {"displayed": False, "property:value": None},
+    ]
+    selenium.execute_script.assert_called_once()
+
+
+def test_extract_elements_empty_selenium(page, selenium):
+    assert page.extract_elements([], ["text"]) == []
+    selenium.execute_script.assert_not_called()
+
+
+@pytest.mark.parametrize("field", ["href", "attribute", "text:href", "attribute:"])
+def test_extract_invalid_field_selenium(page, selenium, field):
+    from pypom.exception import UsageError
+
+    with pytest.raises(UsageError):
+        page.extract_elements([Mock()], [field])
+    selenium.execute_script.assert_not_called()
+
+
+def test_open_refresh_selenium(page, selenium):
+    page._navigation = "refresh"
+    selenium.current_url = page.seed_url
+    page.open()
+    selenium.refresh.assert_called_once_with()
+    assert not selenium.get.called
+
+
+class TestImplicitWait:
+    def test_implicitly_wait_selenium(self, page, selenium):
+        page.driver_adapter.implicitly_wait(10)
+        selenium.implicitly_wait.assert_called_once_with(10)
+
+    def test_is_element_present_not_present_selenium(self, page, selenium):
+        from mock import call
+
+        page.driver_adapter.implicitly_wait(10)
+        selenium.find_elements.return_value = []
+        assert page.is_element_present("id", "logo") is False
+        selenium.find_elements.assert_called_once_with("id", "logo")
+        selenium.find_element.assert_not_called()
+        assert selenium.implicitly_wait.call_args_list == [call(10), call(0), call(10)]
+
+    def test_is_element_displayed_selenium(self, page, selenium):
+        element = Mock()
+        selenium.find_elements.return_value = [element]
+        page.driver_adapter.implicitly_wait(10)
+        assert page.is_element_displayed("id", "logo")
+        element.is_displayed.assert_called_once_with()
+        assert selenium.implicitly_wait.call_count == 3
+
+    def test_suspended_selenium(self, page, selenium):
+        from mock import call
+
+        page.driver_adapter.implicitly_wait(10)
+        selenium.find_elements.return_value = []
+        with page.driver_adapter.implicit_wait_suspended():
+            assert not page.is_element_present("id", "logo")
+            assert not page.is_element_displayed("id", "logo")
+            page.driver_adapter.implicitly_wait(5)
+        assert selenium.implicitly_wait.call_args_list == [call(10), call(0), call(5)]
+
+    def test_restored_on_error_selenium(self, page, selenium):
+        page.driver_adapter.implicitly_wait(10)
+        selenium.find_elements.side_effect = ValueError()
+        with pytest.raises(ValueError):
+            page.is_element_present("id", "logo")
+        selenium.implicitly_wait.assert_called_with(10)
+
+    def test_not_tracked_selenium(self, page, selenium):
+        with page.driver_adapter.implicit_wait_suspended():
+            assert page.is_element_present("id", "logo")
+        selenium.implicitly_wait.assert_not_called()
+        selenium.find_element.assert_called_once_with("id", "logo")
+
+
+class TestLoadedScript:
+    @pytest.fixture
+    def page(self, selenium):
+        from pypom import Page
+
+        class MyPage(Page):
+            _loaded_script = "return document.readyState === 'complete';"
+
+        return MyPage(selenium, timeout=1)
+
+    def test_wait_for_page_to_load_selenium(self, page, selenium):
+        selenium.execute_async_script.return_value = True
+        page.wait_for_page_to_load()
+        assert selenium.execute_async_script.call_count == 1
+        script, args, timeout = selenium.execute_async_script.call_args[0]
+        assert "return document.readyState === 'complete';" in script
+        assert args == []
+        assert 0 < timeout <= 1000
+
+    def test_timeout_selenium(self, page, selenium):
+        from selenium.common.exceptions import TimeoutException
+
+        page.timeout = 0
+        selenium.execute_async_script.return_value = False
+        with pytest.raises(TimeoutException):
+            page.wait_for_page_to_load()
+
+    def test_retry_selenium(self, page, selenium):
+        from selenium.common.exceptions import JavascriptException
+
+        page.driver_adapter.script_retry_interval = 0
+        selenium.execute_async_script.side_effect = [JavascriptException(UNLOADED), True]
+        page.wait_for_page_to_load()
+        assert selenium.execute_async_script.call_count == 2
+
+    def test_retry_at_once_selenium(self, page, selenium):
+        from selenium.common.exceptions import JavascriptException
+
+        page.driver_adapter.script_retry_interval = 60
+        selenium.execute_async_script.side_effect = [
+            JavascriptException(UNLOADED),
+            False,
+            JavascriptException(UNLOADED),
+            True,
+        ]
+        with patch("time.sleep") as sleep:
+            page.wait_for_page_to_load()
+        assert selenium.execute_async_script.call_count == 4
+        sleep.assert_not_called()
+
+    def test_retry_backs_off_selenium(self, page, selenium):
+        from selenium.common.exceptions import JavascriptException
+
+        page.driver_adapter.script_retry_interval = 0.01
+        selenium.execute_async_script.side_effect = [
+            JavascriptException(UNLOADED),
+            JavascriptException(UNLOADED),
+            True,
+        ]
+        with patch("time.sleep") as sleep:
+            page.wait_for_page_to_load()
+        sleep.assert_called_once_with(0.01)
+
+    def test_script_error_selenium(self, page, selenium):
+        from selenium.common.exceptions import JavascriptException
+
+        selenium.execute_async_script.side_effect = JavascriptException("oops")
+        with pytest.raises(JavascriptException):
+            page.wait_for_page_to_load()
+        assert selenium.execute_async_script.call_count == 1
+
+    def test_retry_after_navigation_selenium(self, page, selenium):
+        from selenium.common.exceptions import (
+            StaleElementReferenceException,
+            TimeoutException,
+        )
+
+        page.driver_adapter.script_retry_interval = 0
+        selenium.execute_async_script.side_effect = [
+            StaleElementReferenceException(),
+            TimeoutException(),
+            True,
+        ]
+        page.wait_for_page_to_load()
+        assert selenium.execute_async_script.call_count == 3
+
+    def test_async_scripts_unsupported_selenium(self, page, selenium):
+        from selenium.common.exceptions import WebDriverException
+
+        page.driver_adapter.script_retry_interval = 0
+        selenium.execute_async_script.side_effect = WebDriverException(
+            "unsupported operation: execute/async"
+        )
+        selenium.execute_script.side_effect = [False, True, True]
+        page.wait_for_page_to_load()
+        script, args = selenium.execute_script.call_args[0]
+        assert "return document.readyState === 'complete';" in script
+        assert args == []
+        assert selenium.execute_script.call_count == 2
+        page.wait_for_page_to_load()
+        assert selenium.execute_async_script.call_count == 1
+        assert selenium.execute_script.call_count == 3
+
+    def test_unknown_method_selenium(self, page, selenium):
+        from selenium.common.exceptions import UnknownMethodException
+
+        selenium.execute_async_script.side_effect = UnknownMethodException()
+        selenium.execute_script.return_value = True
+        page.wait_for_page_to_load()
+        assert selenium.execute_script.call_count == 1
+
+    def test_unknown_error_during_navigation_selenium(self, page, selenium):
+        from selenium.common.exceptions import WebDriverException
+
+        page.driver_adapter.script_retry_interval = 0
+        selenium.execute_async_script.side_effect = [
+            WebDriverException("unknown error: cannot determine loading status"),
+            True,
+            True,
+        ]
+        page.wait_for_page_to_load()
+        page.wait_for_page_to_load()
+        assert selenium.execute_async_script.call_count == 3
+        selenium.execute_script.assert_not_called()
+
+    def test_unknown_error_selenium(self, page, selenium):
+        from selenium.common.exceptions import WebDriverException
+
+        selenium.execute_async_script.side_effect = WebDriverException("unknown error")
+        with pytest.raises(WebDriverException):
+            page.wait_for_page_to_load()
+        selenium.execute_script.assert_not_called()
+
+    def test_no_script_selenium(self, selenium):
+        from pypom import Page
+
+        Page(selenium).wait_for_page_to_load()
+        selenium.execute_async_script.assert_not_called()
+
+
+class TestTransition:
+    def test_document_marker_selenium(self, page, selenium):
+        from pypom.selenium_driver import _MARK_DOCUMENT_SCRIPT
+
+        selenium.execute_script.return_value = "https://www.mozilla.org/"
+        marker = page.driver_adapter.document_marker()
+        script, token = selenium.execute_script.call_args[0]
+        assert script == _MARK_DOCUMENT_SCRIPT
+        assert marker == (token, "https://www.mozilla.org/")
+        assert page.driver_adapter.document_marker()[0] != token
+
+    def test_wait_for_new_document_selenium(self, page, selenium):
+        selenium.execute_async_script.return_value = True
+        page.driver_adapter.wait_for_new_document(("abc", "https://a/"), 1)
+        script, args, timeout = selenium.execute_async_script.call_args[0]
+        assert "document.pypomDocument !== arguments[0]" in script
+        assert "document.readyState !== 'loading'" in script
+        assert args == ["abc", "https://a/"]
+
+    def test_transition_selenium(self, page, selenium):
+        from pypom import Page
+        from selenium.common.exceptions import JavascriptException
+
+        class Next(Page):
+            URL_TEMPLATE = "/next"
+
+        # the first wait is interrupted by the old document unloading
+        selenium.execute_async_script.side_effect = [JavascriptException(UNLOADED), True]
+        action = Mock()
+        next_page = page.transition(action, Next)
+        action.assert_called_once_with()
+        assert isinstance(next_page, Next)
+        assert next_page.base_url == page.base_url
+        assert selenium.execute_async_script.call_count == 2
+
+
+class TestPollingWait:
+    @pytest.fixture
+    def wait(self, selenium):
+        from pypom.polling import FixedInterval
+        from pypom.selenium_driver import PollingWait
+
+        return PollingWait(selenium, 1, FixedInterval(0))
+
+    def test_until_selenium(self, wait, selenium):
+        from selenium.common.exceptions import NoSuchElementException
+
+        condition = Mock(side_effect=[NoSuchElementException(), False, "done"])
+        assert wait.until(condition) == "done"
+        condition.assert_called_with(selenium)
+        assert condition.call_count == 3
+
+    def test_until_timeout_selenium(self, wait):
+        from selenium.common.exceptions import TimeoutException
+
+        wait._timeout = 0
+        condition = Mock(return_value=False)
+        with pytest.raises(TimeoutException):
+            wait.until(condition, "not loaded")
+        assert condition.call_count == 1
+
+    def test_until_not_selenium(self, wait):
+        condition = Mock(side_effect=[True, True, False])
+        assert wait.until_not(condition) is False
+        assert condition.call_count == 3
+
+    def test_records_elapsed_selenium(self, selenium):
+        from pypom.polling import LearnedInterval
+        from pypom.selenium_driver import PollingWait
+
+        policy = LearnedInterval()
+        PollingWait(selenium, 1, policy.bind("key")).until(lambda _: True)
+        assert policy.average("key") >= 0
+
+
+class TestState:
+    STORAGE = {
+        "origin": "https://www.mozilla.org",
+        "local_storage": {"token": "xyz"},
+        "session_storage": {"tab": "1"},
+    }
+
+    def test_get_state(self, page, selenium):
+        from pypom.selenium_driver import _STORAGE_SCRIPT
+
+        selenium.execute_script.return_value = dict(self.STORAGE)
+        selenium.get_cookies.return_value = [{"name": "session", "value": "abc"}]
+        state = page.driver_adapter.get_state()
+        assert state == dict(self.STORAGE, cookies=[{"name": "session", "value": "abc"}])
+        selenium.execute_script.assert_called_once_with(_STORAGE_SCRIPT)
+
+    def test_set_state(self, page, selenium):
+        from pypom.selenium_driver import _RESTORE_STORAGE_SCRIPT
+
+        valid = {"name": "session", "value": "abc", "expiry": 2 ** 40}
+        expired = {"name": "old", "value": "def", "expiry": 1}
+        session = {"name": "tab", "value": "ghi"}
+        state = dict(self.STORAGE, cookies=[valid, expired, session])
+        selenium.current_url = "https://www.mozilla.org/en-US/"
+        page.driver_adapter.set_state(state)
+        assert not selenium.get.called
+        selenium.delete_all_cookies.assert_called_once_with()
+        assert [c[0][0] for c in selenium.add_cookie.call_args_list] == [valid, session]
+        selenium.execute_script.assert_called_once_with(_RESTORE_STORAGE_SCRIPT, state)
+
+    @pytest.mark.parametrize(
+        "url, expected",
+        [(None, "https://www.mozilla.org/"), ("https://www.mozilla.org/a", None)],
+    )
+    def test_set_state_other_origin(self, page, selenium, url, expected):
+        selenium.current_url = "about:blank"
+        state = dict(self.STORAGE, cookies=[])
+        page.driver_adapter.set_state(state, url)
+        selenium.get.assert_called_once_with(expected or url)
@@ -6,6 +6,7 @@ import random
 
 import pytest
 from mock import Mock
+from selenium.webdriver.common.by import By
 
 from pypom import Region
 
@@ -166,3 +167,238 @@ class TestRootLocator:
         assert not region.is_element_displayed(*locator)
         element.find_element.assert_called_with(*locator)
         hidden_element.is_displayed.assert_called_once_with()
+
+
+class TestCachedRootLocator:
+    @pytest.fixture
+    def region(self, page):
+        class MyRegion(Region):
+            _root_locator = (str(random.random()), str(random.random()))
+            _cache_root = True
+
+        return MyRegion(page)
+
+    def test_root_selenium(self, element, region, selenium):
+        assert element == region.root
+        assert element == region.root
+        selenium.find_element.assert_called_once_with(*region._root_locator)
+
+    def test_find_element_selenium(self, element, region, selenium):
+        locator = (str(random.random()), str(random.random()))
+        region.find_element(*locator)
+        region.find_element(*locator)
+        selenium.find_element.assert_called_once_with(*region._root_locator)
+        assert element.find_element.call_count == 2
+
+    def test_find_element_stale_selenium(self, element, region, selenium):
+        from selenium.common.exceptions import StaleElementReferenceException
+
+        locator = (str(random.random()), str(random.random()))
+        region.root
+        fresh_element = Mock()
+        selenium.find_element.return_value = fresh_element
+        element.find_element.side_effect = StaleElementReferenceException()
+        assert region.find_element(*locator) == fresh_element.find_element.return_value
+        assert selenium.find_element.call_count == 2
+        fresh_element.find_element.assert_called_once_with(*locator)
+        assert region.root == fresh_element
+
+    def test_is_element_present_stale_selenium(self, element, region, selenium):
+        from selenium.common.exceptions import StaleElementReferenceException
+
+        locator = (str(random.random()), str(random.random()))
+        region.root
+        fresh_element = Mock()
+        selenium.find_element.return_value = fresh_element
+        element.find_element.side_effect = StaleElementReferenceException()
+        assert region.is_element_present(*locator)
+        fresh_element.find_element.assert_called_once_with(*locator)
+
+    def test_stale_root_element_selenium(self, page, selenium):
+        from selenium.common.exceptions import StaleElementReferenceException
+
+        root_element = Mock()
+        root_element.find_element.side_effect = StaleElementReferenceException()
+        locator = (str(random.random()), str(random.random()))
+        with pytest.raises(StaleElementReferenceException):
+            Region(page, root=root_element).find_element(*locator)
+
+
+class TestComposedLocator:
+    @pytest.fixture
+    def region(self, page):
+        class MyRegion(Region):
+            _root_locator = (By.ID, "newsletter-form")
+            _compose_locators = True
+
+        return MyRegion(page)
+
+    def test_find_element_selenium(self, region, selenium):
+        region.find_element(By.ID, "footer_email_submit")
+        selenium.find_element.assert_called_once_with(
+            By.CSS_SELECTOR, "#newsletter-form #footer_email_submit"
+        )
+
+    def test_find_elements_selenium(self, region, selenium):
+        region.find_elements(By.XPATH, "./li")
+        selenium.find_elements.assert_called_once_with(
+            By.XPATH, "(.//*[@id='newsletter-form'])[1]/li"
+        )
+
+    def test_find_element_nested_selenium(self, region, selenium):
+        class Entry(Region):
+            _root_locator = (By.CLASS_NAME, "entry")
+            _compose_locators = True
+
+        Entry(region).find_element(By.TAG_NAME, "a")
+        selenium.find_element.assert_called_once_with(
+            By.XPATH,
+            "((.//*[@id='newsletter-form'])[1]"
+            "//*[contains(concat(' ', normalize-space(@class), ' '), ' entry ')])[1]"
+            "//a",
+        )
+
+    def test_find_element_not_composed_selenium(self, element, region, selenium):
+        region.find_element(By.LINK_TEXT, "Sign up")
+        selenium.find_element.assert_called_once_with(*region._root_locator)
+        element.find_element.assert_called_once_with(By.LINK_TEXT, "Sign up")
+
+    def test_not_composed_by_default_selenium(self, element, page, selenium):
+        class MyRegion(Region):
+            _root_locator = (By.ID, "newsletter-form")
+
+        MyRegion(page).find_element(By.ID, "footer_email_submit")
+        selenium.find_element.assert_called_once_with(*MyRegion._root_locator)
+        element.find_element.assert_called_once_with(By.ID, "footer_email_submit")
+
+
+class TestExtract:
+    def test_extract_composed_selenium(self, page, selenium):
+        class MyRegion(Region):
+            _root_locator = (By.ID, "newsletter-form")
+            _compose_locators = True
+
+        selenium.execute_script.return_value = [["Sign up"]]
+        data = MyRegion(page).extract(By.TAG_NAME, "button", ["text"])
+        assert data == [{"text": "Sign up"}]
+        args = selenium.execute_script.call_args[0][1:]
+        assert args == (None, "css", "#newsletter-form button", [["text", ""]])
+        selenium.find_element.assert_not_called()
+
+    def test_extract_root_element_selenium(self, page, selenium):
+        root_element = Mock()
+        selenium.execute_script.return_value = []
+        Region(page, root=root_element).extract(By.CSS_SELECTOR, "li", ["text"])
+        args = selenium.execute_script.call_args[0][1:]
+        assert args == (root_element, "css", "li", [["text", ""]])
+
+
+class TestRecords:
+    class Result(Region):
+        _fields = (
+            ("name", (By.CLASS_NAME, "name"), "text"),
+            ("link", (By.TAG_NAME, "a"), "property:href"),
+            ("id", None, "attribute:id"),
+        )
+
+    def test_find_records_selenium(self, page, selenium):
+        selenium.execute_script.return_value = [["One", "/1", "r1"], ["Two", None, "r2"]]
+        records = page.find_records(self.Result, By.CLASS_NAME, "result")
+        assert [tuple(r) for r in records] == [("One", "/1", "r1"), ("Two", None, "r2")]
+        assert records[0].name == "One"
+        assert records[1].link is None
+        assert selenium.execute_script.call_count == 1
+        args = selenium.execute_script.call_args[0][1:]
+        assert args == (
+            None,
+            "css",
+            ".result",
+            [
+                ["css", ".name", ["text", ""]],
+                ["css", "a", ["property", "href"]],
+                [None, None, ["attribute", "id"]],
+            ],
+        )
+        selenium.find_elements.assert_not_called()
+
+    def test_records_selenium(self, page, selenium):
+        roots = [Mock(), Mock()]
+        selenium.execute_script.return_value = [["One", "/1", "r1"], ["Two", "/2", "r2"]]
+        regions = [self.Result(page, root=root) for root in roots]
+        records = self.Result.records(regions)
+        assert records[1] == ("Two", "/2", "r2")
+        assert type(records[0]).__name__ == "ResultRecord"
+        assert selenium.execute_script.call_args[0][1] == roots
+
+    def test_record_selenium(self, page, selenium):
+        selenium.execute_script.return_value = [["One", "/1", "r1"]]
+        record = self.Result(page, root=Mock()).record()
+        assert record.id == "r1"
+
+    def test_records_not_converted_selenium(self, page, selenium):
+        class Result(Region):
+            _fields = (
+                ("name", (By.LINK_TEXT, "Name"), "text"),
+                ("id", None, "attribute:id"),
+            )
+
+        found, root, missing = Mock(), Mock(), Mock()
+        root.find_elements.return_value = [found]
+        missing.find_elements.return_value = []
+        selenium.execute_script.side_effect = [[["One"]], [["r1"], ["r2"]]]
+        records = Result.records([Result(page, root=root), Result(page, root=missing)])
+        assert records == [("One", "r1"), (None, "r2")]
+        root.find_elements.assert_called_once_with(By.LINK_TEXT, "Name")
+        assert selenium.execute_script.call_args_list[0][0][1:] == (
+            [found],
+            [["text", ""]],
+        )
+
+    def test_find_records_composed_selenium(self, page, selenium):
+        class Results(Region):
+            _root_locator = (By.ID, "results")
+            _compose_locators = True
+
+        selenium.execute_script.return_value = [["One", "/one", "r1"]]
+        records = Results(page).find_records(self.Result, By.TAG_NAME, "li")
+        assert records == [("One", "/one", "r1")]
+        args = selenium.execute_script.call_args[0][1:3]
+        assert args == (None, "css")
+        assert selenium.execute_script.call_args[0][3] == "#results li"
+        selenium.find_element.assert_not_called()
+
+
+class TestLoadedScript:
+    class MyRegion(Region):
+        _loaded_script = "return arguments[0].classList.contains('loaded');"
+
+    def test_wait_for_region_to_load_selenium(self, page, selenium):
+        root = Mock()
+        selenium.execute_async_script.return_value = True
+        self.MyRegion(page, root=root)
+        args = selenium.execute_async_script.call_args[0][1]
+        assert args == [root]
+
+    def test_root_appears_late_selenium(self, page, selenium):
+        from selenium.common.exceptions import NoSuchElementException
+
+        from pypom.polling import FixedInterval
+
+        class MyRegion(self.MyRegion):
+            _root_locator = (By.ID, "root")
+            _polling = FixedInterval(0)
+
+        root = Mock()
+        selenium.find_element.side_effect = [NoSuchElementException(), root]
+        selenium.execute_async_script.return_value = True
+        MyRegion(page)
+        assert selenium.find_element.call_count == 2
+        args = selenium.execute_async_script.call_args[0][1]
+        assert args == [root]
+
+    def test_from_elements_selenium(self, page, selenium):
+        roots = [Mock(), Mock()]
+        selenium.execute_async_script.return_value = True
+        self.MyRegion.from_elements(page, roots)
+        calls = selenium.execute_async_script.call_args_list
+        assert [c[0][1] for c in calls] == [[roots[0]], [roots[1]]]
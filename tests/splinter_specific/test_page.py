@@ -4,6 +4,9 @@
 
 import random
 
+import pytest
+from mock import Mock
+
 
 def test_find_element_splinter(page, splinter, splinter_strategy):
     locator = (splinter_strategy, str(random.random()))
@@ -105,3 +108,131 @@ def test_is_element_displayed_not_displayed_splinter(page, splinter, splinter_st
         page.driver, "find_by_{0}".format(splinter_strategy)
     ).assert_called_once_with(locator[1])
     visible_mock.assert_called_with()
+
+
+def test_extract_splinter(page, splinter):
+    element = Mock()
+    splinter.driver.execute_script.return_value = [["Home"]]
+    data = page.extract_elements([element], ["text"])
+    assert data == [{"text": "Home"}]
+    args = splinter.driver.execute_script.call_args[0][1:]
+    assert args == ([element._element], [["text", ""]])
+
+
+def test_extract_not_converted_splinter(page, splinter):
+    element = Mock()
+    splinter.find_by_text.return_value = [element]
+    splinter.driver.execute_script.return_value = [["a"]]
+    assert page.extract("text", "Home", ["tag_name"]) == [{"tag_name": "a"}]
+    splinter.find_by_text.assert_called_once_with("Home")
+    args = splinter.driver.execute_script.call_args[0][1:]
+    assert args == ([element._element], [["tag_name", ""]])
+
+
+def test_open_refresh_splinter(page, splinter):
+    page._navigation = "refresh"
+    page.driver.url = page.seed_url
+    page.open()
+    page.driver.reload.assert_called_once_with()
+    assert not page.driver.visit.called
+
+
+class TestSeleniumFastPath:
+    @pytest.fixture
+    def splinter(self, splinter):
+        from selenium.webdriver.remote.webdriver import WebDriver
+
+        splinter.driver = Mock(spec=WebDriver)
+        splinter.wait_time = 0
+        return splinter
+
+    def test_find_element_splinter(self, page, splinter):
+        element = page.find_element("css", ".logo")
+        splinter.driver.find_element.assert_called_once_with("css selector", ".logo")
+        splinter.element_class.assert_called_once_with(
+            splinter.driver.find_element.return_value,
+            splinter,
+            {"by": "css selector", "value": ".logo"},
+        )
+        assert element is splinter.element_class.return_value
+        splinter.find_by_css.assert_not_called()
+
+    def test_find_element_not_present_splinter(self, page, splinter):
+        from selenium.common.exceptions import NoSuchElementException
+
+        splinter.driver.find_element.side_effect = NoSuchElementException()
+        assert page.find_element("id", "logo") is None
+        assert not page.is_element_present("id", "logo")
+        assert not page.is_element_displayed("id", "logo")
+
+    def test_find_element_waits_splinter(self, page, splinter):
+        from selenium.common.exceptions import NoSuchElementException
+
+        splinter.wait_time = 5
+        splinter.driver.find_element.side_effect = [NoSuchElementException(), Mock()]
+        assert page.is_element_present("name", "logo")
+        assert splinter.driver.find_element.call_count == 2
+
+    def test_find_element_root_splinter(self, page, splinter):
+        from selenium.webdriver.remote.webelement import WebElement
+
+        root = Mock(wait_time=0)
+        root._element = Mock(spec=WebElement)
+        page.driver_adapter.find_element("tag", "a", root=root)
+        root._element.find_element.assert_called_once_with("tag name", "a")
+        root.find_by_tag.assert_not_called()
+
+    def test_find_element_stale_root_splinter(self, page, splinter):
+        from selenium.common.exceptions import StaleElementReferenceException
+        from selenium.webdriver.remote.webelement import WebElement
+
+        root = Mock(wait_time=0)
+        root._element = Mock(spec=WebElement)
+        root._element.find_element.side_effect = StaleElementReferenceException()
+        with pytest.raises(StaleElementReferenceException):
+            page.driver_adapter.find_element("xpath", "./a", root=root)
+
+    def test_find_element_text_splinter(self, page, splinter):
+        page.find_element("text", "Home")
+        splinter.find_by_text.assert_called_once_with("Home")
+        splinter.driver.find_element.assert_not_called()
+
+
+def test_implicit_wait_splinter(page, splinter):
+    from mock import call
+
+    page.driver_adapter.implicitly_wait(10)
+    splinter.find_by_id.return_value = []
+    assert not page.is_element_present("id", "logo")
+    assert splinter.driver.implicitly_wait.call_args_list == [
+        call(10),
+        call(0),
+        call(10),
+    ]
+
+
+class TestStateSplinter:
+    def test_get_state(self, page, splinter):
+        splinter.driver.execute_script.return_value = {
+            "origin": "https://www.mozilla.org",
+            "local_storage": {},
+            "session_storage": {},
+        }
+        splinter.cookies.all.return_value = [{"name": "session", "value": "abc"}]
+        state = page.driver_adapter.get_state()
+        assert state["cookies"] == [{"name": "session", "value": "abc"}]
+        splinter.cookies.all.assert_called_once_with(verbose=True)
+
+    def test_set_state(self, page, splinter):
+        splinter.url = "about:blank"
+        state = {
+            "origin": "https://www.mozilla.org",
+            "cookies": [{"name": "session", "value": "abc", "path": "/"}],
+            "local_storage": {},
+            "session_storage": {},
+        }
+        page.driver_adapter.set_state(state)
+        splinter.visit.assert_called_once_with("https://www.mozilla.org/")
+        splinter.cookies.delete_all.assert_called_once_with()
+        splinter.cookies.add.assert_called_once_with({"session": "abc"}, path="/")
+        assert splinter.driver.execute_script.called
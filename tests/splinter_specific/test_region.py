@@ -265,3 +265,98 @@ class TestRootLocatorSplinter:
             first_mock = Mock().first.return_value = visible_mock
             mock_find_element.return_value = first_mock
             assert not region.is_element_displayed(*locator)
+
+
+class TestCachedRootLocatorSplinter:
+    @pytest.fixture
+    def region(self, page, splinter_strategy):
+        class MyRegion(Region):
+            _root_locator = (splinter_strategy, str(random.random()))
+            _cache_root = True
+
+        return MyRegion(page)
+
+    def test_root_splinter(self, region, splinter_strategy):
+        assert region.root is region.root
+        getattr(
+            region.driver, "find_by_{0}".format(splinter_strategy)
+        ).assert_called_once_with(region._root_locator[1])
+
+    def test_find_elements_stale_splinter(self, region, splinter, splinter_strategy):
+        from selenium.common.exceptions import StaleElementReferenceException
+        from splinter.element_list import ElementList
+
+        locator = (splinter_strategy, str(random.random()))
+        stale_root = MagicMock()
+        stale_root.configure_mock(
+            **{"find_by_{0}.return_value".format(splinter_strategy): ElementList([])}
+        )
+        stale_root._element.is_enabled.side_effect = StaleElementReferenceException()
+        fresh_root = MagicMock()
+        splinter.configure_mock(
+            **{
+                "find_by_{0}.return_value.first".format(splinter_strategy): stale_root
+            }
+        )
+        region.root
+        getattr(splinter, "find_by_{0}".format(splinter_strategy)).return_value = (
+            ElementList([fresh_root])
+        )
+        elements = region.find_elements(*locator)
+        assert elements == getattr(
+            fresh_root, "find_by_{0}".format(splinter_strategy)
+        ).return_value
+        assert region.root is fresh_root
+
+    def test_find_elements_root_not_cached_splinter(self, page, splinter_strategy):
+        from selenium.common.exceptions import StaleElementReferenceException
+        from splinter.element_list import ElementList
+
+        locator = (splinter_strategy, str(random.random()))
+        root = MagicMock()
+        root.configure_mock(
+            **{"find_by_{0}.return_value".format(splinter_strategy): ElementList([])}
+        )
+        root._element.is_enabled.side_effect = StaleElementReferenceException()
+        assert len(Region(page, root=root).find_elements(*locator)) == 0
+        root._element.is_enabled.assert_not_called()
+
+
+class TestComposedLocatorSplinter:
+    def test_find_element_splinter(self, page, splinter):
+        class MyRegion(Region):
+            _root_locator = ("id", "root")
+            _compose_locators = True
+
+        MyRegion(page).find_element("css", ".child")
+        splinter.find_by_css.assert_called_once_with("#root .child")
+
+    def test_find_elements_nested_splinter(self, page, splinter):
+        class Outer(Region):
+            _root_locator = ("xpath", "//div")
+            _compose_locators = True
+
+        class Inner(Region):
+            _root_locator = ("name", "inner")
+            _compose_locators = True
+
+        Inner(Outer(page)).find_elements("tag", "li")
+        splinter.find_by_xpath.assert_called_once_with(
+            "((//div)[1]//*[@name='inner'])[1]//li"
+        )
+
+
+class TestRecordsSplinter:
+    def test_find_records_not_converted_splinter(self, page, splinter):
+        class Result(Region):
+            _fields = (("name", ("text", "Name"), "tag_name"),)
+
+        root = Mock()
+        root.find_by_text.return_value = [Mock()]
+        splinter.find_by_css.return_value = [root]
+        splinter.driver.execute_script.return_value = [["a"]]
+        records = page.find_records(Result, "css", ".result")
+        assert records == [("a",)]
+        root.find_by_text.assert_called_once_with("Name")
+        args = splinter.driver.execute_script.call_args[0][1:]
+        assert args == ([root.find_by_text.return_value[0]._element], [["tag_name", ""]])
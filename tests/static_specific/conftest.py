@@ -0,0 +1,54 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import pytest
+
+from pypom.static_driver import StaticDriver
+
+HOME = """<!DOCTYPE html>
+<html><head><title>Home</title></head>
+<body>
+  <h1 id="title">Welcome</h1>
+  <ul id="news">
+    <li class="story"><a href="/news/1">First story</a> <span>1 May</span></li>
+    <li class="story"><a href="/news/2">Second story</a> <span>2 May</span></li>
+  </ul>
+  <form action="search">
+    <input name="q" value="firefox">
+    <input type="checkbox" name="all" checked>
+    <select name="lang"><option value="en">English<option selected>Deutsch</select>
+    <button disabled>Search</button>
+  </form>
+  <p class="notice" style="display: none">Hidden notice</p>
+</body></html>
+"""
+
+STORY = """<title>Story {0}</title><h1>Story {0}</h1><a href="/">Home</a>"""
+
+
+@pytest.fixture
+def site(tmpdir):
+    tmpdir.join("index.html").write(HOME)
+    news = tmpdir.mkdir("news")
+    for number in (1, 2):
+        news.join(str(number)).write(STORY.format(number))
+    return tmpdir
+
+
+@pytest.fixture
+def base_url():
+    return "https://www.mozilla.org"
+
+
+@pytest.fixture
+def static(site, base_url):
+    """ Static HTML driver """
+    return StaticDriver(fixtures={base_url + "/": str(site)})
+
+
+@pytest.fixture
+def page(static, base_url):
+    from pypom import Page
+
+    return Page(static, base_url)
@@ -0,0 +1,209 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import sys
+import threading
+
+import pytest
+from selenium.common.exceptions import (
+    InvalidArgumentException,
+    InvalidSelectorException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    WebDriverException,
+)
+from selenium.webdriver.common.by import By
+
+from pypom.driver import adaptDriver
+from pypom.static_driver import Static, StaticDriver
+
+if sys.version_info >= (3,):
+    from http.server import HTTPServer, SimpleHTTPRequestHandler
+else:
+    from BaseHTTPServer import HTTPServer
+    from SimpleHTTPServer import SimpleHTTPRequestHandler
+
+
+class TestLoad:
+    def test_directory(self, static):
+        static.get("https://www.mozilla.org/")
+        assert static.title == "Home"
+        static.get("https://www.mozilla.org/news/2?utm=x#top")
+        assert static.title == "Story 2"
+        assert static.current_url == "https://www.mozilla.org/news/2?utm=x#top"
+
+    def test_exact(self, site):
+        path = str(site.join("news", "1"))
+        static = StaticDriver(fixtures={"https://www.mozilla.org/story": path})
+        static.get("https://www.mozilla.org/story?id=1")
+        assert static.title == "Story 1"
+
+    def test_missing(self, static):
+        with pytest.raises(WebDriverException):
+            static.get("https://www.mozilla.org/news/3")
+        with pytest.raises(WebDriverException):
+            static.get("ftp://www.mozilla.org/")
+
+    def test_file(self, site):
+        static = StaticDriver()
+        static.get(str(site.join("news", "1")))
+        assert static.title == "Story 1"
+        assert static.current_url.startswith("file://")
+        static.get(static.current_url)
+        assert static.title == "Story 1"
+
+    def test_root(self, static):
+        static.get("https://www.mozilla.org")
+        assert static.current_url == "https://www.mozilla.org/"
+        assert static.title == "Home"
+
+    def test_about_blank(self, static):
+        static.get("about:blank")
+        assert static.current_url == "about:blank"
+        assert static.find_elements(By.TAG_NAME, "body")
+
+    def test_load(self):
+        static = StaticDriver()
+        static.load("<title>Loaded</title>", "https://www.mozilla.org/")
+        assert static.title == "Loaded"
+        assert static.page_source == "<title>Loaded</title>"
+
+    def test_http(self, site, monkeypatch):
+        monkeypatch.chdir(str(site))
+        server = HTTPServer(("127.0.0.1", 0), SimpleHTTPRequestHandler)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            url = "http://127.0.0.1:{}/".format(server.server_port)
+            static = StaticDriver()
+            static.get(url)
+            assert static.title == "Home"
+            static.get(url + "missing")
+            assert static.current_url == url + "missing"
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+
+class TestFind:
+    @pytest.mark.parametrize(
+        "by, value, count",
+        [
+            (By.ID, "title", 1),
+            (By.NAME, "q", 1),
+            (By.CLASS_NAME, "story", 2),
+            (By.TAG_NAME, "LI", 2),
+            (By.CSS_SELECTOR, "#news > li a", 2),
+            (By.XPATH, "//li[@class='story']", 2),
+            (By.LINK_TEXT, "First story", 1),
+            (By.PARTIAL_LINK_TEXT, "story", 2),
+            ("css", "li", 2),
+            ("tag", "a", 2),
+            ("text", "Welcome", 1),
+            ("value", "firefox", 1),
+        ],
+    )
+    def test_strategies(self, static, by, value, count):
+        static.get("https://www.mozilla.org/")
+        assert len(static.find_elements(by, value)) == count
+
+    def test_within_element(self, static):
+        static.get("https://www.mozilla.org/")
+        story = static.find_elements(By.CLASS_NAME, "story")[1]
+        assert story.find_element(By.TAG_NAME, "span").text == "2 May"
+        assert story.find_elements(By.XPATH, ".//a")[0].text == "Second story"
+
+    def test_implied_tbody(self):
+        static = StaticDriver()
+        static.load("<table><tr><td>a<td>b</table>", "https://www.mozilla.org/")
+        assert len(static.find_elements(By.CSS_SELECTOR, "tbody td")) == 2
+        assert len(static.find_elements(By.XPATH, "//table/tbody/tr")) == 1
+
+    def test_not_found(self, static):
+        static.get("https://www.mozilla.org/")
+        with pytest.raises(NoSuchElementException):
+            static.find_element(By.ID, "missing")
+
+    @pytest.mark.parametrize(
+        "by, value, exception",
+        [
+            (By.CLASS_NAME, "story first", InvalidSelectorException),
+            (By.CSS_SELECTOR, "li >", InvalidSelectorException),
+            (By.XPATH, "//li[", InvalidSelectorException),
+            ("unknown", "li", InvalidArgumentException),
+        ],
+    )
+    def test_invalid(self, static, by, value, exception):
+        with pytest.raises(exception):
+            static.find_elements(by, value)
+
+
+class TestElement:
+    @pytest.fixture
+    def find(self, static):
+        static.get("https://www.mozilla.org/")
+        return static.find_element
+
+    def test_text(self, find):
+        assert find(By.ID, "news").text == "First story 1 May\nSecond story 2 May"
+        assert find(By.CLASS_NAME, "notice").text == ""
+        assert find(By.CLASS_NAME, "notice").get_property("textContent") == "Hidden notice"
+
+    def test_attributes(self, find):
+        link = find(By.TAG_NAME, "a")
+        assert link.get_attribute("href") == "https://www.mozilla.org/news/1"
+        assert link.get_dom_attribute("href") == "/news/1"
+        assert link["href"] == "https://www.mozilla.org/news/1"
+        assert link.get_attribute("missing") is None
+        assert find(By.TAG_NAME, "form").get_attribute("action") == (
+            "https://www.mozilla.org/search"
+        )
+
+    def test_form_fields(self, find):
+        assert find(By.NAME, "q").value == "firefox"
+        assert find(By.NAME, "all").get_attribute("checked") == "true"
+        assert find(By.NAME, "all").is_selected()
+        assert find(By.NAME, "q").get_attribute("checked") is None
+        assert find(By.NAME, "lang").get_attribute("value") == "Deutsch"
+        assert not find(By.TAG_NAME, "button").is_enabled()
+        assert find(By.TAG_NAME, "button").get_attribute("disabled") == "true"
+
+    def test_state(self, find):
+        assert find(By.ID, "title").is_displayed()
+        assert not find(By.CLASS_NAME, "notice").is_displayed()
+        assert find(By.ID, "title").tag_name == "h1"
+        assert find(By.ID, "title").get_property("outerHTML") == (
+            '<h1 id="title">Welcome</h1>'
+        )
+
+    def test_equality(self, find):
+        assert find(By.ID, "title") == find(By.TAG_NAME, "h1")
+        assert find(By.ID, "title") != find(By.ID, "news")
+
+    def test_click(self, static, find):
+        link = find(By.LINK_TEXT, "Second story")
+        link.click()
+        assert static.current_url == "https://www.mozilla.org/news/2"
+        with pytest.raises(StaleElementReferenceException):
+            link.text
+
+    def test_click_without_link(self, static, find):
+        find(By.ID, "title").click()
+        assert static.title == "Home"
+
+
+class TestDriver:
+    def test_adapter(self, static):
+        assert isinstance(adaptDriver(static), Static)
+
+    def test_cookies(self, static):
+        static.add_cookie({"name": "session", "value": "abc"})
+        assert static.get_cookies() == [{"name": "session", "value": "abc"}]
+        static.delete_all_cookies()
+        assert static.get_cookies() == []
+
+    def test_execute_script(self, static):
+        with pytest.raises(WebDriverException):
+            static.execute_script("return 1")
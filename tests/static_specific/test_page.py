@@ -0,0 +1,121 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.common.by import By
+
+from pypom import Page, Region
+from pypom.state import SessionState
+
+
+class Story(Region):
+    _link = (By.TAG_NAME, "a")
+    _date = (By.TAG_NAME, "span")
+
+    @property
+    def title(self):
+        return self.find_element(*self._link).text
+
+    def open(self):
+        return self.transition(self.find_element(*self._link).click, StoryPage)
+
+
+class Home(Page):
+    URL_TEMPLATE = "/"
+    _stories = (By.CSS_SELECTOR, "#news .story")
+
+    @property
+    def loaded(self):
+        return self.is_element_displayed(By.ID, "title")
+
+    @property
+    def stories(self):
+        return [Story(self, root=el) for el in self.find_elements(*self._stories)]
+
+
+class StoryPage(Page):
+    URL_TEMPLATE = "/news/{number}"
+
+
+def test_page_and_regions(static, base_url):
+    home = Home(static, base_url).open()
+    assert [story.title for story in home.stories] == ["First story", "Second story"]
+    story = home.stories[1].open()
+    assert isinstance(story, StoryPage)
+    assert static.title == "Story 2"
+
+
+def test_transition_without_navigation(static, base_url):
+    home = Home(static, base_url).open()
+    with pytest.raises(TimeoutException):
+        home.transition(lambda: None, StoryPage)
+
+
+def test_extract(page, static):
+    page.open()
+    adapter = page.driver_adapter
+    assert adapter.extract(By.CSS_SELECTOR, "li a", ["text", "attribute:href"]) == [
+        {"text": "First story", "attribute:href": "/news/1"},
+        {"text": "Second story", "attribute:href": "/news/2"},
+    ]
+    assert adapter.find_records(
+        By.CLASS_NAME,
+        "story",
+        [(None, None, "tag_name"), ("tag", "span", "text"), (By.ID, "x", "displayed")],
+    ) == [["li", "1 May", None], ["li", "2 May", None]]
+
+
+def test_state(page, static):
+    page.open()
+    static.add_cookie({"name": "session", "value": "abc"})
+    state = SessionState.capture(static)
+    assert state.origin == "https://www.mozilla.org"
+    static.delete_all_cookies()
+    static.get("about:blank")
+    state.restore(static)
+    assert static.current_url == "https://www.mozilla.org/"
+    assert static.get_cookies() == [{"name": "session", "value": "abc"}]
+
+
+@pytest.mark.parametrize("selector", ["ul a", "body a", "ul > li a", "li:first-child a"])
+def test_region_selector_with_ancestor_outside_root(page, selector):
+    class News(Region):
+        _root_locator = (By.ID, "news")
+        _compose_locators = True
+
+    class NotComposed(News):
+        _compose_locators = False
+
+    page.open()
+    found = News(page).find_elements(By.CSS_SELECTOR, selector)
+    assert found == NotComposed(page).find_elements(By.CSS_SELECTOR, selector)
+    assert found
+
+
+def test_composed_region_root_overridden(page, static):
+    class Title(Region):
+        _root_locator = (By.ID, "news")
+        _compose_locators = True
+
+        @property
+        def root(self):
+            return self.page.find_element(By.TAG_NAME, "form")
+
+    page.open()
+    names = [e.get_attribute("name") for e in Title(page).find_elements(By.TAG_NAME, "input")]
+    assert names == ["q", "all"]
+
+
+def test_composed_region_root_missing(page):
+    class Missing(Region):
+        _root_locator = (By.ID, "missing")
+        _compose_locators = True
+
+    page.open()
+    region = Missing(page)
+    with pytest.raises(NoSuchElementException):
+        region.find_elements(By.TAG_NAME, "a")
+    with pytest.raises(NoSuchElementException):
+        region.extract(By.TAG_NAME, "a", ["text"])
@@ -0,0 +1,154 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import gzip
+import json
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.common.by import By
+
+from pypom import Page, Region
+from pypom.exception import ReplayError
+from pypom.replay import Recorder, Replay
+
+
+class Story(Region):
+    _link = (By.TAG_NAME, "a")
+
+    @property
+    def title(self):
+        return self.find_element(*self._link).text
+
+    @property
+    def href(self):
+        return self.find_element(*self._link).get_attribute("href")
+
+    def open(self):
+        return self.transition(self.find_element(*self._link).click, StoryPage)
+
+
+class Home(Page):
+    URL_TEMPLATE = "/"
+
+    @property
+    def loaded(self):
+        return self.is_element_displayed(By.ID, "title")
+
+    @property
+    def stories(self):
+        return self.regions(Story, By.CSS_SELECTOR, "#news .story")
+
+
+class StoryPage(Page):
+    URL_TEMPLATE = "/news/{number}"
+
+    @property
+    def heading(self):
+        return self.find_element(By.TAG_NAME, "h1").text
+
+
+def visit(driver, base_url):
+    home = Home(driver, base_url).open()
+    stories = home.stories
+    titles = [story.title for story in stories]
+    hrefs = [story.href for story in stories]
+    story = stories[1].open()
+    return titles, hrefs, story.heading, driver.title
+
+
+@pytest.fixture
+def log(tmpdir_factory):
+    return str(tmpdir_factory.mktemp("logs").join("visit.log"))
+
+
+def test_replay(static, base_url, log, site):
+    with Recorder(static, log) as recorder:
+        recorded = visit(recorder.driver, base_url)
+    assert recorded == (
+        ["First story", "Second story"],
+        ["https://www.mozilla.org/news/1", "https://www.mozilla.org/news/2"],
+        "Story 2",
+        "Story 2",
+    )
+    site.remove()
+    assert visit(Replay(log).driver, base_url) == recorded
+
+
+def test_log(static, base_url, log):
+    with Recorder(static, log) as recorder:
+        home = Home(recorder.driver, base_url).open()
+        first = home.find_element(By.CLASS_NAME, "story")
+        again = home.find_elements(By.CSS_SELECTOR, "li")[0]
+        assert first == again
+        first.text
+    with open(log) as f:
+        header = json.loads(f.readline())
+        entries = [json.loads(line) for line in f]
+    assert header["adapter"] == "pypom.static_driver.Static"
+    assert "find_elements" in header["features"]
+    assert {"t": "a", "n": "open", "a": ["https://www.mozilla.org/"], "r": None} in entries
+    found = [e["r"] for e in entries if e["n"] in ("find_element", "find_elements")]
+    assert found[-2:] == [{"~e": 1}, [{"~e": 1}, {"~e": 2}]]
+    assert entries[-1] == {"t": 1, "n": "text", "r": "First story 1 May"}
+
+
+def test_compressed(static, base_url, tmpdir):
+    log = str(tmpdir.join("visit.log.gz"))
+    with Recorder(static, log) as recorder:
+        recorded = visit(recorder.driver, base_url)
+    with gzip.open(log, "rt") as f:
+        assert json.loads(f.readline())["format"] == 1
+    assert visit(Replay(log).driver, base_url) == recorded
+
+
+def test_exceptions(static, base_url, log):
+    with Recorder(static, log) as recorder:
+        home = Home(recorder.driver, base_url).open()
+        with pytest.raises(NoSuchElementException):
+            home.find_element(By.ID, "missing")
+        with pytest.raises(TimeoutException):
+            home.transition(lambda: None, StoryPage)
+    home = Home(Replay(log).driver, base_url).open()
+    with pytest.raises(NoSuchElementException):
+        home.find_element(By.ID, "missing")
+    with pytest.raises(TimeoutException):
+        home.transition(lambda: None, StoryPage)
+
+
+def test_features(static, base_url, log):
+    with Recorder(static, log) as recorder:
+        Home(recorder.driver, base_url).open()
+    adapter = Home(Replay(log).driver, base_url).driver_adapter
+    assert getattr(adapter, "wait_for_script", 1) is None
+    assert callable(adapter.extract)
+    assert not hasattr(adapter, "nonexistent")
+    with adapter.snapshot():
+        pass
+
+
+def test_last_result_repeated(static, base_url, log):
+    with Recorder(static, log) as recorder:
+        Home(recorder.driver, base_url).open()
+    home = Home(Replay(log).driver, base_url).open()
+    for _ in range(3):
+        assert home.loaded
+
+
+def test_divergence(static, base_url, log):
+    with Recorder(static, log) as recorder:
+        Home(recorder.driver, base_url).open()
+    home = Home(Replay(log).driver, base_url).open()
+    with pytest.raises(ReplayError) as excinfo:
+        home.find_element(By.ID, "news")
+    assert "find_element of the driver adapter" in str(excinfo.value)
+    with pytest.raises(ReplayError):
+        home.driver.current_url
+
+
+def test_not_a_log(tmpdir):
+    path = tmpdir.join("empty.log")
+    path.write("")
+    with pytest.raises(ReplayError):
+        Replay(str(path))
@@ -0,0 +1,115 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import pytest
+from mock import Mock
+
+from pypom import Page, Region
+from pypom.conditions import Displayed, HasAttribute, HasClass, Present, UrlMatches
+
+
+@pytest.fixture
+def script_driver(driver):
+    # the adapters run scripts using the Selenium driver
+    driver.driver = driver
+    driver.execute_async_script.return_value = True
+    return driver
+
+
+class TestCompile:
+    def test_compile(self, page):
+        script = page.driver_adapter.compile_conditions(
+            [
+                Present("id", "logo"),
+                HasClass("xpath", "//body", "loaded"),
+                HasAttribute("name", "form", "data-ready", "yes"),
+                UrlMatches("/en-US/$"),
+            ]
+        )
+        assert 'first("css", "#logo")' in script
+        assert 'first("css", "[name=\\"form\\"]")' in script
+        assert 'e.classList.contains("loaded")' in script
+        assert 'e.getAttribute("data-ready") === "yes"' in script
+        assert 'new RegExp("/en-US/$")' in script
+
+    def test_compile_not_supported(self, page):
+        script = page.driver_adapter.compile_conditions(
+            [Displayed("id", "logo"), Present("unknown", "logo")]
+        )
+        assert script is None
+
+
+class TestPage:
+    def test_wait_in_browser(self, script_driver):
+        class MyPage(Page):
+            _loaded_conditions = (Displayed("id", "logo"),)
+
+        MyPage(script_driver).wait_for_page_to_load()
+        assert script_driver.execute_async_script.call_count == 1
+        script = script_driver.execute_async_script.call_args[0][0]
+        assert 'displayed(e)' in script
+        script_driver.find_element.assert_not_called()
+
+    def test_with_loaded_script(self, script_driver):
+        class MyPage(Page):
+            _loaded_script = "return window.ready;"
+            _loaded_conditions = (Present("id", "logo"),)
+
+        MyPage(script_driver).wait_for_page_to_load()
+        script = script_driver.execute_async_script.call_args[0][0]
+        assert "return window.ready;" in script
+        assert 'first("' in script
+
+    def test_check_on_poll(self, script_driver):
+        class MyPage(Page):
+            _loaded_conditions = (Present("unknown", "logo"),)
+
+        page = MyPage(script_driver)
+        page.driver_adapter.find_element = Mock()
+        page.wait_for_page_to_load()
+        script_driver.execute_async_script.assert_not_called()
+        page.driver_adapter.find_element.assert_called_once_with(
+            "unknown", "logo", root=None
+        )
+
+
+class TestRegion:
+    def test_wait_in_browser(self, page, script_driver):
+        class MyRegion(Region):
+            _loaded_conditions = (HasClass("xpath", "./li", "active"),)
+
+        root = Mock()
+        MyRegion(page, root=root)
+        args = script_driver.execute_async_script.call_args[0][1]
+        assert args in ([root], [root._element])
+
+
+class TestCheck:
+    def test_present(self, page):
+        page.driver_adapter.is_element_present = Mock(return_value=False)
+        assert not Present("id", "logo").check(page)
+
+    def test_has_class(self, page):
+        element = Mock()
+        element.get_attribute.return_value = "a loaded b"
+        page.driver_adapter.find_elements = Mock(return_value=[element])
+        assert HasClass("id", "body", "loaded").check(page)
+        assert not HasClass("id", "body", "load").check(page)
+
+    def test_has_attribute(self, page):
+        element = Mock()
+        element.get_attribute.return_value = "yes"
+        page.driver_adapter.find_elements = Mock(return_value=[element])
+        assert HasAttribute("id", "form", "data-ready").check(page)
+        assert HasAttribute("id", "form", "data-ready", "yes").check(page)
+        assert not HasAttribute("id", "form", "data-ready", "no").check(page)
+
+    def test_has_attribute_not_present(self, page):
+        page.driver_adapter.find_elements = Mock(return_value=[])
+        assert not HasAttribute("id", "form", "data-ready").check(page)
+
+    def test_url_matches(self, page):
+        page.driver_adapter.current_url = Mock(return_value="https://www.mozilla.org/en-US/")
+        assert UrlMatches("/en-US/$").check(page)
+        assert not UrlMatches("/fr/$").check(page)
@@ -0,0 +1,235 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import pytest
+from cssselect import HTMLTranslator
+from selenium.common.exceptions import InvalidSelectorException
+
+from pypom import dom
+
+HTML = """<!DOCTYPE html>
+<title>Test</title>
+<div id="main" class="a b">
+  <p>One <b>two</b><!-- comment -->
+  three</p>
+  <p hidden>hidden</p>
+  <p style="display: none">none</p>
+  <pre>  kept
+ as is</pre>
+  <table><tr><td>x</td><td>y</td></tr></table>
+  <input type=checkbox checked disabled>
+  <img src=a.png>
+</div>
+"""
+
+LIST = """
+<div id="main" lang="en-US">
+  <h1>Title</h1>
+  <ul>
+    <li class="item first"><a href="/one">One</a></li>
+    <li class="item"><a href="/two">Two</a></li>
+    <li class="item last"><a href="/three">Three</a></li>
+  </ul>
+  <p></p>
+</div>
+"""
+
+
+@pytest.fixture
+def document():
+    return dom.parse(HTML, "https://www.mozilla.org/")
+
+
+@pytest.fixture(scope="module")
+def items():
+    return dom.parse(LIST)
+
+
+def test_structure(document):
+    assert document.url == "https://www.mozilla.org/"
+    assert document.title == "Test"
+    assert document.root.tag == "html"
+    assert [e.tag for e in document.root] == ["head", "body"]
+
+
+@pytest.mark.parametrize("html", ["", "  <!-- empty -->", "<html></html>", "<p>a"])
+def test_implied_structure(html):
+    document = dom.parse(html)
+    assert [e.tag for e in document.root] == ["head", "body"]
+
+
+def test_implied_end_tags():
+    document = dom.parse("<ul><li>a<li>b</ul><p>c<p>d")
+    assert [e.tag for e in document.iter()] == [
+        "html",
+        "head",
+        "body",
+        "ul",
+        "li",
+        "li",
+        "p",
+        "p",
+    ]
+
+
+def test_implied_table_sections():
+    document = dom.parse(
+        "<table><tr><td>a<td>b<tr><th>c</table>"
+        "<table><thead><td>d</thead><tbody><tr><td>e</table>"
+    )
+    assert [e.tag for e in document.iter()][3:] == [
+        "table",
+        "tbody",
+        "tr",
+        "td",
+        "td",
+        "tr",
+        "th",
+        "table",
+        "thead",
+        "tr",
+        "td",
+        "tbody",
+        "tr",
+        "td",
+    ]
+
+
+def test_visible_text(document):
+    main = document.index.lookup("id", "main")[0]
+    assert dom.visible_text(main) == "One two three\n  kept\n as is\nx y"
+
+
+def test_is_displayed(document):
+    paragraphs = document.index.lookup("tag", "p")
+    assert [dom.is_displayed(p) for p in paragraphs] == [True, False, False]
+
+
+def test_form_state(document):
+    checkbox = document.index.lookup("tag", "input")[0]
+    assert dom.is_checked(checkbox)
+    assert dom.is_disabled(checkbox)
+
+
+def test_to_html():
+    document = dom.parse('<p class="x">a &amp; <br>b</p><script>1 < 2</script>')
+    p, script = document.index.lookup("tag", "p") + document.index.lookup("tag", "script")
+    assert dom.to_html(p) == '<p class="x">a &amp; <br>b</p>'
+    assert dom.to_html(p, inner=True) == "a &amp; <br>b"
+    assert dom.to_html(script, inner=True) == "1 < 2"
+
+
+def test_index():
+    document = dom.parse(
+        '<div id="a" class="x y"><p class="x" name="n">1</p><p id="a">2</p></div>'
+        '<p class="x">3</p>'
+    )
+    index = document.index
+    assert index is document.index
+    div = index.lookup("id", "a")[0]
+    assert [e.tag for e in index.lookup("id", "a")] == ["div", "p"]
+    assert [e.text_content() for e in index.lookup("class", "x")] == ["12", "1", "3"]
+    assert [e.text_content() for e in index.lookup("class", "x", div)] == ["1"]
+    assert [e.text_content() for e in index.lookup("tag", "p", div)] == ["1", "2"]
+    assert index.lookup("name", "n", div)[0].get("class") == "x"
+    assert index.lookup("tag", "table") == []
+    assert len(index.within(index.elements, div)) == 2
+    assert index.within(index.elements, index.lookup("tag", "p")[0]) == []
+
+
+def test_hidden():
+    document = dom.parse("<div><p>shown</p><p>hidden</p></div>")
+    div, shown, hidden = list(document.iter())[3:]
+    document.hidden = frozenset([hidden])
+    assert dom.is_displayed(shown, document.hidden)
+    assert not dom.is_displayed(hidden, document.hidden)
+    assert dom.visible_text(div, document.hidden) == "shown"
+
+
+def text(elements):
+    return [e.get("class") or e.text_content() or e.tag for e in elements]
+
+
+@pytest.mark.parametrize(
+    "selector, expected",
+    [
+        ("li.item.first", ["item first"]),
+        ("#main li:last-child a", ["Three"]),
+        ("ul > li + li", ["item", "item last"]),
+        ("h1 ~ p", ["p"]),
+        ("a[href^='/t']", ["Two", "Three"]),
+        ("li:nth-child(2n+1)", ["item first", "item last"]),
+        ("li:not(.first):not(.last)", ["item"]),
+        ("p:empty", ["p"]),
+        ("a, h1", ["Title", "One", "Two", "Three"]),
+        (":root > body > div > h1", ["Title"]),
+    ],
+)
+def test_select(items, selector, expected):
+    assert text(dom.select(items, items, selector)) == expected
+
+
+def test_select_within_element(items):
+    ul = dom.select(items, items, "ul")[0]
+    assert text(dom.select(items, ul, "div li")) == ["item first", "item", "item last"]
+    assert text(dom.select(items, ul, ".last a")) == ["Three"]
+    assert dom.select(items, ul, "ul") == []
+
+
+@pytest.mark.parametrize("selector", ["", "li >", "a[href", "p::before", "li:nth-child(x)"])
+def test_select_invalid(items, selector):
+    with pytest.raises(InvalidSelectorException):
+        dom.select(items, items, selector)
+
+
+@pytest.mark.parametrize(
+    "expression, expected",
+    [
+        ("//li[2]/a", ["Two"]),
+        ("(//a)[last()]", ["Three"]),
+        ("//a[text()='One']/../following-sibling::li/a", ["Two", "Three"]),
+        ("//h1 | //p", ["Title", "p"]),
+        ("/*[1]/*[2]/*[1]/*[1]", ["Title"]),
+    ],
+)
+def test_evaluate(items, expression, expected):
+    assert text(dom.evaluate(items, items, expression)) == expected
+
+
+def test_evaluate_relative(items):
+    ul = dom.evaluate(items, items, "//ul")[0]
+    assert len(dom.evaluate(items, ul, "./li")) == 3
+    assert len(dom.evaluate(items, ul, "//a")) == 3
+
+
+@pytest.mark.parametrize("expression", ["", "//", "//a[", "foo()", "//a/@href", "count(//a)"])
+def test_evaluate_invalid(items, expression):
+    with pytest.raises(InvalidSelectorException):
+        dom.evaluate(items, items, expression)
+
+
+@pytest.mark.parametrize(
+    "selector, keys",
+    [
+        ("#main", [("id", "main")]),
+        ("li.item:not(.first)", [("class", "item")]),
+        ("LI:nth-child(2)", [("tag", "li")]),
+        ("a, .last, #main", [("tag", "a"), ("class", "last"), ("id", "main")]),
+        ("[href], a", [None, ("tag", "a")]),
+        ("ul .item", [None]),
+    ],
+)
+def test_select_indexed(items, selector, keys):
+    compiled = dom.compile_selector(selector)
+    assert compiled.keys == keys
+    ul = dom.select(items, items, "ul")[0]
+    matching = items.tree.xpath(HTMLTranslator().css_to_xpath(selector))
+    for context in (items, ul):
+        expected = items.index.within(matching, context)
+        assert compiled.select(items, context) == expected
+
+
+def test_compiled():
+    assert dom.compile_selector("li.item") is dom.compile_selector("li.item")
+    assert dom.compile_expression("//a") is dom.compile_expression("//a")
@@ -104,3 +104,87 @@ def test_register_driver_class_implements():
 
     # same instance of adapted_driver
     assert isinstance(adapted_driver, FakeDriver)
+
+
+def test_adapt_driver_shared_adapter(page):
+    """ Page objects and regions using the same driver share an adapter"""
+    from pypom import Region
+    from pypom.driver import adaptDriver
+
+    assert adaptDriver(page.driver) is page.driver_adapter
+    assert Region(page).driver_adapter is page.driver_adapter
+    assert Region(page).wait is page.wait
+
+
+def test_adapt_driver_type_dispatch():
+    """ Adapter factories are looked up once per driver type"""
+    import pytest
+    from zope import component
+    from zope.interface import Interface
+    from pypom import driver as pypom_driver
+    from pypom.driver import adaptDriver, registerDriver
+
+    class IFakeDriver(Interface):
+        """ A fake marker interface"""
+
+    class FakeDriver(object):
+        """ A fake driver """
+
+    class FakeAdapter(object):
+        """ A fake driver adapter """
+
+        def __init__(self, driver):
+            self.driver = driver
+
+    registerDriver(IFakeDriver, FakeAdapter, [FakeDriver])
+    assert isinstance(adaptDriver(FakeDriver()), FakeAdapter)
+    assert pypom_driver._factories[FakeDriver] is FakeAdapter
+
+    def lookup(*args):
+        pytest.fail("adapter registry should not be used")
+
+    site_manager = component.getSiteManager
+    component.getSiteManager = lookup
+    try:
+        adapter = adaptDriver(FakeDriver())
+    finally:
+        component.getSiteManager = site_manager
+    assert isinstance(adapter, FakeAdapter)
+
+
+def test_adapt_driver_directly_provided():
+    """ Drivers providing interfaces directly are not dispatched on type"""
+    from mock import Mock
+    from zope.interface import alsoProvides
+    from pypom.driver import adaptDriver
+    from pypom.selenium_driver import ISelenium, Selenium
+    from pypom.splinter_driver import ISplinter, Splinter
+
+    selenium = Mock()
+    alsoProvides(selenium, ISelenium)
+    splinter = Mock()
+    alsoProvides(splinter, ISplinter)
+    assert type(adaptDriver(selenium)) is Selenium
+    assert type(adaptDriver(splinter)) is Splinter
+
+
+def test_adapt_driver_collected():
+    """ Cached adapters do not keep drivers alive"""
+    import gc
+    import weakref
+    from zope.interface import classImplements
+    from pypom import Page
+    from pypom.driver import adaptDriver
+    from pypom.selenium_driver import ISelenium
+
+    class Driver(object):
+        """ A driver supporting weak references """
+
+    classImplements(Driver, ISelenium)
+    driver = Driver()
+    ref = weakref.ref(driver)
+    page = Page(driver)
+    assert adaptDriver(driver) is page.driver_adapter
+    del page, driver
+    gc.collect()
+    assert ref() is None
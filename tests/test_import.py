@@ -0,0 +1,65 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import os
+import subprocess
+import sys
+
+
+def run(code):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    return subprocess.check_output([sys.executable, "-c", code], env=env).decode()
+
+
+def test_import_does_not_load_drivers():
+    output = run(
+        "import sys, pypom; "
+        "print([m for m in sorted(sys.modules) if m.startswith(('selenium', 'splinter', 'pypom.selenium', 'pypom.splinter'))])"
+    )
+    assert output.strip() == "[]"
+
+
+def test_drivers_registered_on_first_use():
+    output = run(
+        "from selenium.webdriver import Remote; "
+        "from pypom import Page; "
+        "page = Page(Remote.__new__(Remote)); "
+        "print(type(page.driver_adapter).__name__)"
+    )
+    assert output.strip() == "Selenium"
+
+
+def test_snapshot_imported_on_first_use():
+    output = run(
+        "import sys; "
+        "from selenium.webdriver import Remote; "
+        "from pypom import Page; "
+        "page = Page(Remote.__new__(Remote)); "
+        "page.driver_adapter._unwrap(None); "
+        "print('pypom.snapshot' in sys.modules)"
+    )
+    assert output.strip() == "False"
+
+
+def test_default_drivers_exclude_static_and_replay():
+    output = run(
+        "import sys; "
+        "from pypom.driver import registerDefaultDrivers; "
+        "registerDefaultDrivers(); "
+        "print([m for m in ('pypom.static_driver', 'pypom.replay', 'pypom.dom') if m in sys.modules])"
+    )
+    assert output.strip() == "[]"
+
+
+def test_static_and_replay_registered_on_import():
+    output = run(
+        "import os; "
+        "from pypom import Page; "
+        "from pypom.static_driver import StaticDriver; "
+        "from pypom.replay import Recorder; "
+        "recorder = Recorder(StaticDriver(), os.devnull); "
+        "print(type(Page(StaticDriver()).driver_adapter).__name__, "
+        "type(Page(recorder.driver).driver_adapter).__name__)"
+    )
+    assert output.strip() == "Static Recording"
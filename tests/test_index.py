@@ -0,0 +1,147 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import pytest
+
+from pypom import Page
+from pypom.exception import UsageError
+from pypom.index import PageIndex
+
+
+class Base(Page):
+    pass
+
+
+class Home(Base):
+    URL_TEMPLATE = "/"
+
+
+class Locale(Base):
+    URL_TEMPLATE = "/{locale}/"
+
+
+class Firefox(Base):
+    URL_TEMPLATE = "/{locale}/firefox/"
+
+
+class FirefoxNew(Base):
+    URL_TEMPLATE = "/en-US/firefox/new/"
+
+
+class Search(Base):
+    URL_TEMPLATE = "/{locale}/search?q={term}"
+
+
+class Item(Base):
+    URL_TEMPLATE = "/items/item-{id}/{id}"
+
+
+class Addons(Base):
+    URL_TEMPLATE = "https://addons.mozilla.org/{locale}/"
+
+
+class Inherited(Addons):
+    pass
+
+
+@pytest.fixture
+def index():
+    return PageIndex.from_subclasses(Base, base_url="https://www.mozilla.org/")
+
+
+def test_from_subclasses(index):
+    assert len(index) == 7
+
+
+@pytest.mark.parametrize(
+    "url, page_class, url_kwargs",
+    [
+        ("https://www.mozilla.org/", Home, {}),
+        ("https://www.mozilla.org", Home, {}),
+        ("https://www.mozilla.org/fr/", Locale, {"locale": "fr"}),
+        ("https://www.mozilla.org/fr/firefox/", Firefox, {"locale": "fr"}),
+        ("https://www.mozilla.org/en-US/firefox/new/", FirefoxNew, {}),
+        ("https://www.mozilla.org/en-US/firefox/", Firefox, {"locale": "en-US"}),
+        (
+            "https://www.mozilla.org/de/search?q=a+b&page=2&tag=x&tag=y",
+            Search,
+            {"locale": "de", "term": "a b", "page": "2", "tag": ["x", "y"]},
+        ),
+        ("https://www.mozilla.org/items/item-7/7", Item, {"id": "7"}),
+        ("https://addons.mozilla.org/fr/", Addons, {"locale": "fr"}),
+        ("https://www.mozilla.org/fr/?utm=x", Locale, {"locale": "fr", "utm": "x"}),
+        ("https://www.mozilla.org/en%20GB/", Locale, {"locale": "en GB"}),
+    ],
+)
+def test_match(index, url, page_class, url_kwargs):
+    assert index.match(url) == (page_class, url_kwargs)
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://developer.mozilla.org/fr/",
+        "https://www.mozilla.org/fr/firefox/new/extra/",
+        "https://www.mozilla.org/de/search",
+        "https://www.mozilla.org/items/item-7/8",
+        "https://addons.mozilla.org/",
+    ],
+)
+def test_no_match(index, url):
+    assert index.match(url) is None
+
+
+def test_seed_url_round_trip(index, driver):
+    page = Search(driver, index.base_url, locale="fr", term="firefox", page=2)
+    match = index.match(page.seed_url)
+    assert match.page_class is Search
+    assert match.url_kwargs == {"locale": "fr", "term": "firefox", "page": "2"}
+
+
+def test_without_base_url():
+    index = PageIndex()
+    index.register(Locale)
+    assert index.match("https://www.mozilla.org/fr/") == (Locale, {"locale": "fr"})
+    assert index.match("https://developer.mozilla.org/fr/") == (
+        Locale,
+        {"locale": "fr"},
+    )
+
+
+def test_origin_template():
+    class AnyHost(Page):
+        URL_TEMPLATE = "https://{host}/about"
+
+    index = PageIndex()
+    index.register(AnyHost)
+    assert index.match("https://example.com/about") == (AnyHost, {"host": "example.com"})
+
+
+def test_register_decorator():
+    index = PageIndex()
+
+    @index.register
+    class About(Page):
+        URL_TEMPLATE = "/about"
+
+    assert index.match("http://localhost/about").page_class is About
+
+
+def test_register_no_template():
+    with pytest.raises(UsageError):
+        PageIndex().register(Base)
+
+
+def test_current_page(index, driver):
+    driver.current_url = driver.url = "https://www.mozilla.org/fr/firefox/"
+    page = index.current_page(driver, timeout=5)
+    assert isinstance(page, Firefox)
+    assert page.url_kwargs == {"locale": "fr"}
+    assert page.timeout == 5
+    assert page.seed_url == driver.current_url
+
+
+def test_current_page_no_match(index, driver):
+    driver.current_url = driver.url = "https://developer.mozilla.org/"
+    assert index.current_page(driver) is None
@@ -0,0 +1,76 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import pytest
+
+from pypom.locators import CLASS_NAME, CSS, ID, NAME, TAG_NAME, XPATH, compose
+
+
+@pytest.mark.parametrize(
+    "root_locator, locator, expected",
+    [
+        ((ID, "root"), (ID, "child"), (CSS, "#root #child")),
+        ((CSS, "#root"), (CSS, "li[title='a b']"), (CSS, "#root li[title='a b']")),
+        ((CSS, "#root"), (CSS, "li:not(.a .b)"), (CSS, "#root li:not(.a .b)")),
+        ((ID, "root"), (CLASS_NAME, "item"), (CSS, "#root .item")),
+        ((ID, "root"), (TAG_NAME, "li"), (CSS, "#root li")),
+        ((ID, "root"), (NAME, 'a"b'), (CSS, '#root [name="a\\"b"]')),
+        ((XPATH, "//div"), (XPATH, ".//li"), (XPATH, "(//div)[1]//li")),
+        ((XPATH, "//div"), (XPATH, "li"), (XPATH, "(//div)[1]/li")),
+        ((XPATH, "//div"), (XPATH, "."), (XPATH, "(//div)[1]")),
+        ((XPATH, "//div"), (XPATH, "(.//li)[2]"), (XPATH, "((//div)[1]//li)[2]")),
+        ((XPATH, "//div"), (ID, "child"), (XPATH, "(//div)[1]//*[@id='child']")),
+        ((ID, "it's"), (XPATH, "./li"), (XPATH, "(.//*[@id=\"it's\"])[1]/li")),
+        ((TAG_NAME, "ul"), (TAG_NAME, "li"), (XPATH, "(.//ul)[1]//li")),
+        (
+            (CLASS_NAME, "menu"),
+            (NAME, "q"),
+            (
+                XPATH,
+                "(.//*[contains(concat(' ', normalize-space(@class), ' '), ' menu ')])[1]"
+                "//*[@name='q']",
+            ),
+        ),
+    ],
+)
+def test_compose(root_locator, locator, expected):
+    assert compose(root_locator, locator) == expected
+
+
+def test_compose_nested():
+    inner = compose((NAME, "inner"), (TAG_NAME, "li"))
+    assert compose((ID, "outer"), inner) == (
+        XPATH,
+        "((.//*[@id='outer'])[1]//*[@name='inner'])[1]//li",
+    )
+    inner = compose((ID, "inner"), (CLASS_NAME, "item"))
+    assert compose((ID, "outer"), inner) == (CSS, "#outer #inner .item")
+
+
+@pytest.mark.parametrize(
+    "root_locator, locator",
+    [
+        # the root element may not be the first match
+        ((CSS, ".menu"), (CSS, "li")),
+        ((CLASS_NAME, "menu"), (CSS, "li")),
+        # selector lists and combinators, as the ancestors they require may
+        # be outside of the root
+        ((ID, "root"), (CSS, "a, b")),
+        ((ID, "root"), (CSS, "> li")),
+        ((ID, "root"), (CSS, "div p")),
+        ((ID, "root"), (CSS, "ul > li")),
+        ((ID, "root"), (CSS, "h1 + p")),
+        # absolute paths and unions
+        ((XPATH, "//div"), (XPATH, "//li")),
+        ((XPATH, "//div"), (XPATH, "(//li)[1]")),
+        ((XPATH, "//div"), (XPATH, ".//a | .//b")),
+        # no equivalent XPath
+        ((CSS, ".menu"), (XPATH, ".//li")),
+        ((XPATH, "//div"), (CSS, "li")),
+        ((XPATH, "//div"), (TAG_NAME, "LI")),
+        ((XPATH, "//div"), ("link text", "Home")),
+    ],
+)
+def test_compose_not_possible(root_locator, locator):
+    assert compose(root_locator, locator) is None
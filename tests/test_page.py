@@ -3,11 +3,18 @@
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
 import random
+import sys
 
 import pytest
+from mock import Mock, patch
 
 from pypom import Page
 
+if sys.version_info >= (3,):
+    from urllib.parse import urlencode
+else:
+    from urllib import urlencode
+
 
 def test_base_url(base_url, page):
     assert base_url == page.seed_url
@@ -222,3 +229,175 @@ def test_bwc_selenium(page, driver_interface):
 
 def test_loaded(page, driver):
     assert page.loaded is True
+
+
+def test_seed_url_cached(base_url, driver):
+    page = Page(driver, base_url, key="value")
+    with patch("pypom.page.urlencode", wraps=urlencode) as encode:
+        assert page.seed_url == page.seed_url
+        assert encode.call_count == 1
+
+
+def test_seed_url_base_url_changed(base_url, driver):
+    page = Page(driver, base_url)
+    assert page.seed_url == base_url
+    page.base_url = "https://developer.mozilla.org/"
+    assert page.seed_url == "https://developer.mozilla.org/"
+
+
+def test_seed_url_kwargs_changed(base_url, driver):
+    page = Page(driver, base_url, key="value")
+    assert page.seed_url == "{}?key=value".format(base_url)
+    page.url_kwargs["key"] = "other"
+    assert page.seed_url == "{}?key=other".format(base_url)
+    page.url_kwargs = {}
+    assert page.seed_url == base_url
+
+
+def test_seed_url_list_changed(base_url, driver):
+    page = Page(driver, base_url, tags=["a"])
+    assert page.seed_url == "{}?tags=a".format(base_url)
+    page.url_kwargs["tags"].append("b")
+    assert page.seed_url == "{}?tags=a&tags=b".format(base_url)
+
+
+def test_seed_url_template_changed(base_url, driver):
+    page = Page(driver, base_url, key="value")
+    page.URL_TEMPLATE = "{key}"
+    assert page.seed_url == base_url + "value"
+
+
+def test_seed_url_keywords_format_spec(base_url, driver):
+    class MyPage(Page):
+        URL_TEMPLATE = "{page:03d}/{item.name}"
+
+    item = Mock()
+    item.name = "name"
+    page = MyPage(driver, base_url, page=7, item=item)
+    assert page.seed_url == base_url + "007/name"
+
+
+def test_template_fields():
+    from pypom.page import template_fields
+
+    assert template_fields("/{a}/{b.c}/{d[0]}/{e:>3}?{{f}}") == {"a", "b", "d", "e"}
+    assert template_fields(None) == frozenset()
+    assert template_fields("/{a}") is template_fields("/{a}")
+
+
+@pytest.mark.parametrize(
+    "current_url",
+    [
+        "https://www.mozilla.org/en-US/?b=2&a=1",
+        "HTTPS://WWW.MOZILLA.ORG:443/en-US/?a=1&b=2#top",
+        "https://www.mozilla.org/en%2DUS/?a=1&b=2",
+    ],
+)
+@pytest.mark.parametrize("navigation", ["skip", "refresh"])
+def test_open_already_on_seed_url(driver, navigation, current_url):
+    class MyPage(Page):
+        URL_TEMPLATE = "https://www.mozilla.org/{locale}/"
+        _navigation = navigation
+
+    page = MyPage(driver, locale="en-US", a="1", b="2")
+    adapter = page.driver_adapter
+    hook = Mock()
+    with patch.object(adapter, "current_url", return_value=current_url), patch.object(
+        adapter, "open"
+    ) as open_, patch.object(adapter, "refresh") as refresh, patch.object(
+        page.pm.hook, "pypom_after_wait_for_page_to_load", hook
+    ):
+        assert page.open() is page
+    assert not open_.called
+    assert refresh.called is (navigation == "refresh")
+    hook.assert_called_once_with(page=page)
+
+
+@pytest.mark.parametrize(
+    "current_url",
+    [
+        "https://www.mozilla.org/fr/?a=1&b=2",
+        "https://www.mozilla.org/en-US/?a=1",
+        "http://www.mozilla.org/en-US/?a=1&b=2",
+        "https://www.mozilla.org:8443/en-US/?a=1&b=2",
+    ],
+)
+@pytest.mark.parametrize("navigation", ["skip", "refresh"])
+def test_open_not_on_seed_url(driver, navigation, current_url):
+    class MyPage(Page):
+        URL_TEMPLATE = "https://www.mozilla.org/{locale}/"
+        _navigation = navigation
+
+    page = MyPage(driver, locale="en-US", a="1", b="2")
+    adapter = page.driver_adapter
+    with patch.object(adapter, "current_url", return_value=current_url), patch.object(
+        adapter, "open"
+    ) as open_, patch.object(adapter, "refresh") as refresh:
+        page.open()
+    open_.assert_called_once_with(page.seed_url)
+    assert not refresh.called
+
+
+def test_open_navigate_by_default(page, driver):
+    adapter = page.driver_adapter
+    with patch.object(adapter, "current_url") as current_url, patch.object(
+        adapter, "open"
+    ) as open_:
+        page.open()
+    assert not current_url.called
+    open_.assert_called_once_with(page.seed_url)
+
+
+def test_open_invalid_navigation(base_url, driver):
+    from pypom.exception import UsageError
+
+    class MyPage(Page):
+        _navigation = "reload"
+
+    with pytest.raises(UsageError):
+        MyPage(driver, base_url).open()
+
+
+class TestTransition:
+    class Next(Page):
+        URL_TEMPLATE = "/{locale}/next"
+
+    def test_transition(self, page, driver):
+        adapter = page.driver_adapter
+        calls = []
+        with patch.object(
+            adapter, "document_marker", side_effect=lambda: calls.append("mark") or "m"
+        ), patch.object(
+            adapter, "wait_for_new_document", side_effect=lambda *a: calls.append(a)
+        ), patch.object(
+            self.Next, "wait_for_page_to_load", autospec=True, side_effect=lambda p: p
+        ) as wait:
+            next_page = page.transition(lambda: calls.append("action"), self.Next, locale="fr")
+        assert calls == ["mark", "action", ("m", page.timeout)]
+        assert isinstance(next_page, self.Next)
+        assert next_page.base_url == page.base_url
+        assert next_page.seed_url == "https://www.mozilla.org/fr/next"
+        assert next_page.timeout == page.timeout
+        wait.assert_called_once_with(next_page)
+
+    def test_transition_base_url_timeout(self, page, driver):
+        adapter = page.driver_adapter
+        with patch.object(adapter, "document_marker"), patch.object(
+            adapter, "wait_for_new_document"
+        ), patch.object(self.Next, "wait_for_page_to_load", autospec=True, side_effect=lambda p: p):
+            next_page = page.transition(
+                Mock(), self.Next, base_url="https://example.com", timeout=3
+            )
+        assert next_page.base_url == "https://example.com"
+        assert next_page.timeout == 3
+
+    def test_transition_from_region(self, page, driver):
+        from pypom import Region
+
+        region = Region(page)
+        adapter = page.driver_adapter
+        with patch.object(adapter, "document_marker"), patch.object(
+            adapter, "wait_for_new_document"
+        ), patch.object(self.Next, "wait_for_page_to_load", autospec=True, side_effect=lambda p: p):
+            next_page = region.transition(Mock(), self.Next)
+        assert next_page.base_url == page.base_url
@@ -2,10 +2,15 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
-from pypom import Region, hookimpl
+from pypom import Page, Region, hookimpl
+from pypom.plugins import (
+    get_plugin_manager,
+    isolated_plugin_manager,
+    refresh_plugin_manager,
+)
 
 
-def test_after_wait_for_page_to_load(page):
+def test_after_wait_for_page_to_load(base_url, driver):
     log = []
 
     class Plugin:
@@ -17,7 +22,41 @@ def test_after_wait_for_page_to_load(page):
         def pypom_after_wait_for_region_to_load(self, region):
             log.append(2)
 
+    with isolated_plugin_manager():
+        page = Page(driver, base_url)
     page.pm.register(Plugin())
     page.open()
     Region(page)
     assert log == [1, 2]
+
+
+def test_shared_plugin_manager(base_url, driver):
+    assert Page(driver, base_url).pm is Page(driver, base_url).pm
+    assert Page(driver, base_url).pm is get_plugin_manager()
+
+
+def test_region_uses_page_plugin_manager(page):
+    assert Region(page).pm is page.pm
+
+
+def test_refresh_plugin_manager(base_url, driver):
+    previous = get_plugin_manager()
+    pm = refresh_plugin_manager()
+    assert pm is not previous
+    assert Page(driver, base_url).pm is pm
+
+
+def test_isolated_plugin_manager(base_url, driver):
+    shared = get_plugin_manager()
+    with isolated_plugin_manager() as pm:
+        assert pm is not shared
+        assert Page(driver, base_url).pm is pm
+    assert Page(driver, base_url).pm is shared
+
+
+def test_explicit_plugin_manager(driver):
+    from pypom.plugins import create_plugin_manager
+    from pypom.view import WebView
+
+    pm = create_plugin_manager()
+    assert WebView(driver, 10, pm=pm).pm is pm
@@ -0,0 +1,79 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+from itertools import islice
+
+from pypom import Page, Region
+from pypom.polling import (
+    ExponentialBackoff,
+    FixedInterval,
+    LearnedInterval,
+    PollingPolicy,
+)
+
+
+def take(policy, number=5):
+    return list(islice(policy.intervals(), number))
+
+
+def test_polling_policy():
+    class Recorded(PollingPolicy):
+        def __init__(self):
+            self.times = []
+
+        def record(self, elapsed):
+            self.times.append(elapsed)
+
+    policy = Recorded()
+    assert take(policy, 3) == [0.5, 0.5, 0.5]
+    assert policy.bind(Page) is policy
+
+
+def test_fixed_interval():
+    assert take(FixedInterval(0.1), 3) == [0.1, 0.1, 0.1]
+
+
+def test_exponential_backoff():
+    policy = ExponentialBackoff(initial=0.1, factor=2, maximum=0.5)
+    assert take(policy) == [0.1, 0.2, 0.4, 0.5, 0.5]
+
+
+def test_learned_interval():
+    policy = LearnedInterval(initial=0.1, maximum=0.4, weight=0.5, lead=0.5)
+    bound = policy.bind(Page)
+    assert take(bound, 4) == [0.1, 0.2, 0.4, 0.4]
+    bound.record(2.0)
+    bound.record(1.0)
+    assert policy.average(Page) == 1.5
+    assert take(bound, 3) == [0.75, 0.1, 0.2]
+
+
+def test_learned_interval_per_class():
+    policy = LearnedInterval()
+    assert policy.bind(Page) is policy.bind(Page)
+    policy.bind(Page).record(1.0)
+    assert policy.average(Region) is None
+
+
+def test_page_polling(driver):
+    policy = FixedInterval(0.1)
+
+    class MyPage(Page):
+        _polling = policy
+
+    page = MyPage(driver)
+    assert page.wait.polling is policy
+    assert MyPage(driver).wait is page.wait
+    assert Page(driver).wait is not page.wait
+
+
+def test_region_polling(page):
+    policy = LearnedInterval()
+
+    class MyRegion(Region):
+        _polling = policy
+
+    region = MyRegion(page)
+    assert region.wait.polling is policy.bind(MyRegion)
+    assert policy.average(MyRegion) is not None
@@ -45,3 +45,192 @@ class TestRootElement:
     def test_root(self, page, driver):
         element = Mock()
         assert Region(page, root=element).root == element
+
+
+class TestFromElements:
+    def test_from_elements(self, page):
+        elements = [Mock(), Mock(), Mock()]
+        regions = Region.from_elements(page, elements)
+        assert [region.root for region in regions] == elements
+        assert all(region.page is page for region in regions)
+
+    def test_from_elements_empty(self, page):
+        assert Region.from_elements(page, []) == []
+
+    def test_from_elements_loaded_once(self, page):
+        log = []
+
+        class MyRegion(Region):
+            @property
+            def loaded(self):
+                log.append(self.root)
+                return True
+
+        elements = [Mock(), Mock()]
+        MyRegion.from_elements(page, elements)
+        assert log == elements
+
+    def test_from_elements_custom_init(self, page):
+        log = []
+
+        class MyRegion(Region):
+            def __init__(self, page, root=None):
+                super(MyRegion, self).__init__(page, root)
+                self.created = True
+
+            @property
+            def loaded(self):
+                log.append(self.root)
+                return True
+
+        elements = [Mock(), Mock()]
+        regions = MyRegion.from_elements(page, elements)
+        assert all(region.created for region in regions)
+        assert log == elements
+        regions[0].find_element("id", "locator")
+        assert log == elements
+
+    def test_from_elements_lazy(self, page):
+        log = []
+
+        class MyRegion(Region):
+            _lazy = True
+
+            @property
+            def loaded(self):
+                log.append(self.root)
+                return True
+
+        elements = [Mock(), Mock()]
+        regions = MyRegion.from_elements(page, elements)
+        assert log == []
+        regions[1].find_element("id", "locator")
+        assert log == [elements[1]]
+
+    def test_from_elements_timeout(self, page):
+        class MyRegion(Region):
+            @property
+            def loaded(self):
+                return self.root == "loaded"
+
+        page.timeout = 0
+        from selenium.common.exceptions import TimeoutException
+
+        with pytest.raises(TimeoutException):
+            MyRegion.from_elements(page, ["loaded", "pending"])
+
+    def test_from_elements_custom_wait(self, page):
+        log = []
+
+        class MyRegion(Region):
+            def wait_for_region_to_load(self):
+                log.append(self.root)
+
+        elements = [Mock(), Mock()]
+        MyRegion.from_elements(page, elements)
+        assert log == elements
+
+    def test_from_elements_hooks(self, base_url, driver):
+        from pypom import Page, hookimpl
+        from pypom.plugins import isolated_plugin_manager
+
+        log = []
+
+        class Plugin:
+            @hookimpl
+            def pypom_after_wait_for_region_to_load(self, region):
+                log.append(region)
+
+            @hookimpl
+            def pypom_after_wait_for_regions_to_load(self, regions):
+                log.append(regions)
+
+        with isolated_plugin_manager() as pm:
+            pm.register(Plugin())
+            page = Page(driver, base_url)
+        regions = Region.from_elements(page, [Mock(), Mock()])
+        assert log == regions + [regions]
+
+    def test_regions(self, page, driver):
+        elements = [Mock(), Mock()]
+        page.driver_adapter.find_elements = Mock(return_value=elements)
+        regions = page.regions(Region, "strategy", "locator")
+        page.driver_adapter.find_elements.assert_called_once_with(
+            "strategy", "locator"
+        )
+        assert [region.root for region in regions] == elements
+
+
+class TestNoWait:
+    def test_no_wait(self, page):
+        class MyRegion(Region):
+            @property
+            def loaded(self):
+                return False
+
+        page.timeout = 0
+        assert MyRegion(page, wait=False).page is page
+
+
+class TestLazy:
+    @pytest.fixture
+    def region_class(self):
+        class MyRegion(Region):
+            _lazy = True
+            log = []
+
+            @property
+            def loaded(self):
+                self.log.append(self.root)
+                return True
+
+        return MyRegion
+
+    def test_not_waited_on_construction(self, page, region_class):
+        region_class(page)
+        assert region_class.log == []
+
+    def test_waited_on_first_use(self, page, region_class):
+        element = Mock()
+        region = region_class(page, root=element)
+        region.find_element("id", "locator")
+        region.find_elements("id", "locator")
+        assert region.root == element
+        assert region_class.log == [element]
+
+    def test_waited_once_explicitly(self, page, region_class):
+        region = region_class(page)
+        region.wait_for_region_to_load()
+        region.is_element_present("id", "locator")
+        assert region_class.log == [None]
+
+    def test_timeout_on_first_use(self, page):
+        class MyRegion(Region):
+            _lazy = True
+
+            @property
+            def loaded(self):
+                return False
+
+        page.timeout = 0
+        region = MyRegion(page)
+        from selenium.common.exceptions import TimeoutException
+
+        with pytest.raises(TimeoutException):
+            region.is_element_displayed("id", "locator")
+        with pytest.raises(TimeoutException):
+            region.root
+
+
+class TestRecords:
+    def test_no_fields(self, page):
+        from pypom.exception import UsageError
+
+        with pytest.raises(UsageError):
+            Region(page, root=Mock()).record()
+
+    def test_no_regions(self, page):
+        class MyRegion(Region):
+            _fields = (("name", None, "text"),)
+
+        assert MyRegion.records([]) == []
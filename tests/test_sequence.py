@@ -0,0 +1,72 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import pytest
+from mock import Mock
+
+from pypom import Region
+from pypom.sequence import RegionSequence
+
+
+class CountingRegion(Region):
+    created = []
+
+    def __init__(self, page, root=None):
+        super(CountingRegion, self).__init__(page, root)
+        self.created.append(root)
+
+
+@pytest.fixture
+def elements():
+    return [Mock() for _ in range(5)]
+
+
+@pytest.fixture
+def sequence(page, elements):
+    del CountingRegion.created[:]
+    return RegionSequence(page, CountingRegion, elements)
+
+
+def test_len(sequence):
+    assert len(sequence) == 5
+    assert CountingRegion.created == []
+
+
+def test_getitem(sequence, elements):
+    region = sequence[1]
+    assert region.root == elements[1]
+    assert sequence[1] is region
+    assert sequence[-4] is region
+    assert CountingRegion.created == [elements[1]]
+
+
+def test_getitem_out_of_range(sequence):
+    with pytest.raises(IndexError):
+        sequence[5]
+
+
+def test_slice(sequence, elements):
+    first = sequence[0]
+    head = sequence[:3]
+    assert isinstance(head, RegionSequence)
+    assert len(head) == 3
+    assert CountingRegion.created == [elements[0]]
+    assert head[0] is first
+    assert [region.root for region in sequence[::-2]] == elements[::-2]
+
+
+def test_iterate(sequence, elements):
+    for region in sequence:
+        if region.root == elements[2]:
+            break
+    assert CountingRegion.created == elements[:3]
+
+
+def test_find_regions(page, elements):
+    page.driver_adapter.find_elements = Mock(return_value=elements)
+    regions = page.find_regions(Region, "strategy", "locator")
+    page.driver_adapter.find_elements.assert_called_once_with("strategy", "locator")
+    assert isinstance(regions, RegionSequence)
+    assert len(regions) == 5
+    assert regions[4].page is page
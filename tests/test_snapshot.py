@@ -0,0 +1,158 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import pytest
+from mock import Mock, patch
+from selenium.common.exceptions import TimeoutException
+
+from pypom import Page, Region
+from pypom.driver import adaptDriver
+from pypom.snapshot import SnapshotElement
+
+HTML = """<html><head></head><body>
+<ul id="results">
+  <li class="result"><a href="/one">One</a></li>
+  <li class="result" data-pypom-hidden=""><a href="/two" data-pypom-hidden="">Two</a></li>
+</ul>
+<input name="q" value="firefox">
+</body></html>"""
+
+
+@pytest.fixture
+def scripts(driver):
+    """ execute_script of the driver """
+    scripts = Mock(return_value=["https://www.mozilla.org/", HTML])
+    driver.execute_script = driver.driver.execute_script = scripts
+    return scripts
+
+
+class Result(Region):
+    @property
+    def name(self):
+        return self.find_element("css", "a").text
+
+
+class Results(Page):
+    @property
+    def results(self):
+        return [Result(self, root=el) for el in self.find_elements("css", ".result")]
+
+
+def test_reads(base_url, driver, scripts):
+    page = Results(driver, base_url)
+    with page.snapshot():
+        results = page.results
+        assert [result.name for result in results] == ["One", ""]
+        assert page.is_element_present("css", "#results")
+        assert not page.is_element_present("css", "#missing")
+        assert page.is_element_displayed("css", ".result")
+        assert not results[1].is_element_displayed("css", "a")
+        assert page.find_element("css", "input").get_attribute("value") == "firefox"
+    assert scripts.call_count == 1
+    driver.find_elements.assert_not_called()
+    driver.find_element.assert_not_called()
+
+
+def test_nested(page, scripts):
+    with page.snapshot():
+        with page.snapshot():
+            page.find_elements("css", "li")
+        page.find_elements("css", "li")
+    assert scripts.call_count == 1
+    page.find_elements("css", "li")
+    assert scripts.call_count == 1
+
+
+def test_interaction(page, scripts):
+    adapter = page.driver_adapter
+    with page.snapshot():
+        link = page.find_element("css", "a")
+        with patch.object(adapter, "_find_live") as find_live:
+            link.click()
+        find_live.assert_called_once_with("xpath", "/*[1]/*[2]/*[1]/*[1]/*[1]")
+        find_live.return_value.click.assert_called_once_with()
+        page.find_elements("css", "a")
+    assert scripts.call_count == 2
+
+
+def test_find_live(page, scripts):
+    with page.snapshot():
+        assert page.driver_adapter._find_live("xpath", "/*[1]")
+    scripts.assert_not_called()
+
+
+def test_open(page, scripts):
+    with page.snapshot():
+        page.find_elements("css", "a")
+        page.open()
+        page.find_elements("css", "a")
+    assert scripts.call_count == 2
+
+
+def test_wait(page, scripts):
+    checks = []
+
+    def check(_):
+        checks.append(page.find_element("css", "a"))
+        return len(checks) == 2
+
+    page.wait._poll = 0
+    with page.snapshot():
+        page.wait.until(check)
+    assert scripts.call_count == 2
+    assert checks[0].snapshot is not checks[1].snapshot
+    assert not checks[0].snapshot.valid
+
+
+def test_wait_timeout(base_url, driver, scripts):
+    page = Page(driver, base_url, timeout=0)
+    page.wait._poll = 0
+    with page.snapshot():
+        with pytest.raises(TimeoutException):
+            page.wait.until(lambda _: page.is_element_present("css", "#missing"))
+
+
+def test_root_from_earlier_snapshot(page, scripts):
+    with page.snapshot():
+        item = page.find_elements("css", "li")[1]
+        page.driver_adapter.invalidate_snapshot()
+        link = Region(page, root=item).find_element("css", "a")
+    assert scripts.call_count == 2
+    assert link.snapshot is not item.snapshot
+
+
+def test_read_after_snapshot(page, scripts):
+    with page.snapshot():
+        link = page.find_element("css", "a")
+        assert link.text == "One"
+    with patch.object(page.driver_adapter, "_find_live") as find_live:
+        assert link.text is find_live.return_value.text
+
+
+def test_live_root(page, driver, scripts):
+    root = Mock()
+    with page.snapshot():
+        Region(page, root=root).find_elements("css", "a")
+    scripts.assert_not_called()
+    assert root.find_elements.called or root.find_by_css.called
+
+
+def test_unwrap(page, driver, scripts):
+    with page.snapshot():
+        element = page.find_element("css", "a")
+    adapter = adaptDriver(driver)
+    assert adapter._unwrap(element) in (
+        element.live_element,
+        element.live_element._element,
+    )
+    assert isinstance(element, SnapshotElement)
+
+
+def test_without_support(page):
+    class Adapter(object):
+        pass
+
+    page.driver_adapter = Adapter()
+    with page.snapshot():
+        pass
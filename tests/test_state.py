@@ -0,0 +1,62 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+import os
+import stat
+import sys
+
+import pytest
+from mock import patch
+
+from pypom.driver import adaptDriver
+from pypom.state import SessionState
+
+STATE = {
+    "origin": "https://www.mozilla.org",
+    "cookies": [{"name": "session", "value": "abc", "path": "/"}],
+    "local_storage": {"token": "xyz"},
+    "session_storage": {},
+}
+
+
+def test_capture(driver):
+    with patch.object(adaptDriver(driver), "get_state", return_value=STATE):
+        state = SessionState.capture(driver)
+    assert state.state == STATE
+    assert state.origin == "https://www.mozilla.org"
+
+
+@pytest.mark.parametrize("url", [None, "https://www.mozilla.org/404"])
+def test_restore(driver, url):
+    with patch.object(adaptDriver(driver), "set_state") as set_state:
+        SessionState(STATE).restore(driver, url)
+    set_state.assert_called_once_with(STATE, url)
+
+
+def test_save_load(tmpdir):
+    path = str(tmpdir.join("state.json"))
+    SessionState(STATE).save(path)
+    assert SessionState.load(path).state == STATE
+    assert os.listdir(str(tmpdir)) == ["state.json"]
+
+
+def test_save_replaces(tmpdir):
+    path = str(tmpdir.join("state.json"))
+    SessionState(dict(STATE, origin="https://example.com")).save(path)
+    SessionState(STATE).save(path)
+    assert SessionState.load(path).origin == "https://www.mozilla.org"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+def test_save_private(tmpdir):
+    path = str(tmpdir.join("state.json"))
+    SessionState(STATE).save(path)
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+
+def test_save_error(tmpdir):
+    path = str(tmpdir.join("state.json"))
+    with pytest.raises(TypeError):
+        SessionState(dict(STATE, origin=object())).save(path)
+    assert os.listdir(str(tmpdir)) == []